@@ -3,6 +3,7 @@
 Backhaul collector: simple SQLite-backed store for plan/apply events.
 Provides:
   - Collector.record_plan(plan_event) -> run_id
+  - Collector.record_plans([plan_event, ...]) -> inserted count (single transaction)
   - Collector.record_apply(plan_id, apply_event)
   - Collector.query_runs(...)
 Simple, safe defaults and small text excerpt storage.
@@ -10,11 +11,19 @@ Simple, safe defaults and small text excerpt storage.
 
 from __future__ import annotations
 import sqlite3
-import json
+import threading
 import time
 import hashlib
 from typing import Dict, Any, Optional, List
 
+from LCF import jsonx
+
+try:
+    from blake3 import blake3 as _h  # optional, SIMD-accelerated
+except ImportError:
+    def _h(data: bytes = b""):
+        return hashlib.blake2b(data, digest_size=32)
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS runs (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -34,71 +43,155 @@ CREATE TABLE IF NOT EXISTS runs (
   apply_output_excerpt TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_runs_logical ON runs(logical_id);
-CREATE INDEX IF NOT EXISTS idx_runs_plan ON runs(plan_id);
+-- (plan_id, id DESC) answers get_run_by_plan's ORDER BY id DESC LIMIT 1 from the index;
+-- it supersedes the older single-column idx_runs_plan
+DROP INDEX IF EXISTS idx_runs_plan;
+CREATE INDEX IF NOT EXISTS idx_runs_plan_id ON runs(plan_id, id DESC);
 """
 
-def _safe_json(obj: Any) -> str:
+_INSERT_RUN_SQL = (
+    "INSERT INTO runs(ts, logical_id, provider, spec_hash, spec_json, plan_id, plan_hash, add_count, change_count, "
+    "destroy_count, plan_excerpt, apply_success, apply_duration, apply_output_excerpt) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)"
+)
+_UPDATE_APPLY_SQL = "UPDATE runs SET apply_success = ?, apply_duration = ?, apply_output_excerpt = ? WHERE plan_id = ?"
+
+def _safe_json_bytes(obj: Any) -> bytes:
     try:
-        return json.dumps(obj, sort_keys=True)
+        return jsonx.dumps_bytes(obj, sort_keys=True)
     except Exception:
-        return json.dumps(str(obj))
+        return jsonx.dumps_bytes(str(obj))
+
+def _hash_bytes(b: bytes) -> str:
+    # fingerprint for dedupe only; not used for anything security-sensitive
+    return _h(b).hexdigest()
 
 def _hash_string(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    return _hash_bytes(s.encode("utf-8"))
+
+def _hash_file(path: str) -> str:
+    # stream large saved plans through the hash without loading them into memory
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _h).hexdigest()
+        h = _h()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
 
 
 class Collector:
     def __init__(self, path: str = "backhaul.db"):
         self.path = path
-        self._conn = sqlite3.connect(self.path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        cur = self._conn.cursor()
+        # one connection per thread: SQLite serializes all work on a shared handle
+        self._tls = threading.local()
+        # schema is created once on a bootstrap connection so worker threads never race on DDL
+        boot = self._connect()
+        cur = boot.cursor()
         cur.executescript(SCHEMA)
+        cur.execute("PRAGMA optimize;")
         cur.close()
-        self._conn.commit()
+        boot.commit()
+        # an in-memory database only exists on the connection that created it
+        self._shared = boot if self.path == ":memory:" else None
+        self._tls.c = boot
+
+    def _connect(self) -> sqlite3.Connection:
+        c = sqlite3.connect(self.path, check_same_thread=False)
+        c.row_factory = sqlite3.Row
+        self._apply_pragmas(c)
+        return c
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        # WAL + synchronous=NORMAL avoids a full fsync on every commit
+        cur = conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.execute("PRAGMA temp_store=MEMORY;")
+        cur.execute("PRAGMA mmap_size=268435456;")
+        cur.execute("PRAGMA cache_size=-20000;")
+        cur.execute("PRAGMA journal_size_limit=6144000;")
+        cur.close()
+
+    def _conn(self) -> sqlite3.Connection:
+        c = getattr(self._tls, "c", None)
+        if c is None:
+            c = self._shared or self._connect()
+            self._tls.c = c
+        return c
 
-    def _spec_hash(self, spec: Dict[str, Any]) -> str:
-        return _hash_string(_safe_json(spec))
+    def _spec_hash(self, spec_json: bytes) -> str:
+        # takes the already-serialized spec so it is encoded only once per event
+        return _hash_bytes(spec_json)
 
     def _plan_hash(self, plan_text: str) -> str:
         return _hash_string(plan_text or "")
 
+    def _plan_file_hash(self, plan_file: str, limit: int = 2000) -> tuple:
+        """Returns (plan_hash, excerpt) for a plan written to disk instead of passed inline."""
+        try:
+            with open(plan_file, "rb") as f:
+                head = f.read(limit * 4)
+            return _hash_file(plan_file), head.decode("utf-8", errors="replace")[:limit]
+        except OSError:
+            return self._plan_hash(""), ""
+
     def _excerpt(self, s: Optional[str], limit: int = 2000) -> str:
         if not s:
             return ""
-        return s[:limit]
+        # short outputs (the common case) are stored as-is without a copy
+        return s if len(s) <= limit else s[:limit]
+
+    def _plan_row(self, plan_event: Dict[str, Any], ts: Optional[int] = None) -> tuple:
+        get = plan_event.get
+        plan_text = get("plan_text") or get("diff") or ""
+        summary = get("plan_summary") or {}
+        spec_bytes = _safe_json_bytes(get("spec", {}))
+        plan_file = get("plan_file")
+        if not plan_text and plan_file:
+            plan_hash, excerpt = self._plan_file_hash(plan_file)
+        else:
+            excerpt = self._excerpt(plan_text)
+            plan_hash = self._plan_hash(plan_text)
+        # column order matches _INSERT_RUN_SQL; the apply_* columns are filled by record_apply
+        return (
+            int(time.time()) if ts is None else ts,
+            get("logical_id"),
+            get("provider"),
+            self._spec_hash(spec_bytes),
+            spec_bytes.decode("utf-8"),
+            get("plan_id"),
+            plan_hash,
+            int(summary.get("add", 0)),
+            int(summary.get("change", 0)),
+            int(summary.get("destroy", 0)),
+            excerpt,
+            None,
+            None,
+            None,
+        )
 
     def record_plan(self, plan_event: Dict[str, Any]) -> int:
         """
         plan_event expected keys:
           logical_id, provider, spec (dict), plan_id (str), plan_summary {add,change,destroy}, plan_text (str)
+          (or plan_file (path) for large plans saved to disk; hashed in streaming chunks)
         Returns run_id (int)
         """
+        conn = self._conn()
+        with conn:
+            return conn.execute(_INSERT_RUN_SQL, self._plan_row(plan_event)).lastrowid
+
+    def record_plans(self, plan_events: List[Dict[str, Any]]) -> int:
+        """
+        Bulk variant of record_plan: inserts all events in a single transaction.
+        Returns the number of rows inserted.
+        """
+        if not plan_events:
+            return 0
         ts = int(time.time())
-        logical_id = plan_event.get("logical_id")
-        provider = plan_event.get("provider")
-        spec = plan_event.get("spec", {})
-        plan_id = plan_event.get("plan_id")
-        plan_text = plan_event.get("plan_text") or plan_event.get("diff") or ""
-        summary = plan_event.get("plan_summary", {})
-        add = int(summary.get("add", 0))
-        change = int(summary.get("change", 0))
-        destroy = int(summary.get("destroy", 0))
-
-        spec_json = _safe_json(spec)
-        spec_hash = self._spec_hash(spec)
-        plan_hash = self._plan_hash(plan_text)
-        excerpt = self._excerpt(plan_text)
-
-        cur = self._conn.cursor()
-        cur.execute(
-            "INSERT INTO runs(ts, logical_id, provider, spec_hash, spec_json, plan_id, plan_hash, add_count, change_count, destroy_count, plan_excerpt, apply_success, apply_duration, apply_output_excerpt) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
-            (ts, logical_id, provider, spec_hash, spec_json, plan_id, plan_hash, add, change, destroy, excerpt, None, None, None),
-        )
-        run_id = cur.lastrowid
-        self._conn.commit()
-        cur.close()
-        return run_id
+        conn = self._conn()
+        with conn:
+            return conn.executemany(_INSERT_RUN_SQL, (self._plan_row(ev, ts) for ev in plan_events)).rowcount
 
     def record_apply(self, plan_id: str, apply_event: Dict[str, Any]) -> bool:
         """
@@ -112,24 +205,14 @@ class Collector:
         out = apply_event.get("output") or apply_event.get("stdout") or ""
         excerpt = self._excerpt(out)
 
-        cur = self._conn.cursor()
-        cur.execute("UPDATE runs SET apply_success = ?, apply_duration = ?, apply_output_excerpt = ? WHERE plan_id = ?", (success, dur, excerpt, plan_id))
-        updated = cur.rowcount
-        self._conn.commit()
-        cur.close()
-        return updated > 0
+        conn = self._conn()
+        with conn:
+            return conn.execute(_UPDATE_APPLY_SQL, (success, dur, excerpt, plan_id)).rowcount > 0
 
     # small helpers for inspection
     def list_runs(self, limit: int = 50) -> List[Dict[str, Any]]:
-        cur = self._conn.cursor()
-        cur.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,))
-        rows = [dict(r) for r in cur.fetchall()]
-        cur.close()
-        return rows
+        return [dict(r) for r in self._conn().execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,))]
 
     def get_run_by_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
-        cur = self._conn.cursor()
-        cur.execute("SELECT * FROM runs WHERE plan_id = ? ORDER BY id DESC LIMIT 1", (plan_id,))
-        r = cur.fetchone()
-        cur.close()
+        r = self._conn().execute("SELECT * FROM runs WHERE plan_id = ? ORDER BY id DESC LIMIT 1", (plan_id,)).fetchone()
         return dict(r) if r else None
@@ -6,42 +6,63 @@ It delegates all methods to the adapter but intercepts plan/create/apply calls.
 """
 
 from __future__ import annotations
+import contextlib
+import functools
+import inspect
 import time
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from LCF.backhaul.collector import Collector
+from LCF.Backhaul.collector import Collector
 
 # simple redact implementation - extend as needed
-SECRET_KEYS = {"secret", "password", "private_key", "access_key", "secret_key", "token"}
+SECRET_KEYS = frozenset({"secret", "password", "private_key", "access_key", "secret_key", "token"})
 
 
 def redact_secrets(obj: Optional[Dict]) -> Dict:
     if not isinstance(obj, dict):
         return {}
-    out = {}
-    for k, v in obj.items():
-        lk = k.lower()
-        if lk in SECRET_KEYS:
-            out[k] = "<REDACTED>"
-        else:
-            if isinstance(v, dict):
-                out[k] = redact_secrets(v)
+    out: Dict = {}
+    # iterative walk: no recursion depth limit and no per-level call overhead
+    stack = [(obj, out)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            if isinstance(k, str) and k.lower() in SECRET_KEYS:
+                dst[k] = "<REDACTED>"
+            elif isinstance(v, dict):
+                nd: Dict = {}
+                dst[k] = nd
+                stack.append((v, nd))
             else:
-                try:
-                    # small scalar only
-                    out[k] = v
-                except Exception:
-                    out[k] = "<UNSERIALIZABLE>"
+                dst[k] = v
     return out
 
 
+@functools.lru_cache(maxsize=32)
+def _create_signature(adapter_cls: type) -> Tuple[bool, bool]:
+    """
+    (legacy, takes_plan_only) for adapter_cls.create_instance, inspected once per class:
+    legacy adapters take (name, image, size, region), the rest (logical_id, spec, plan_only).
+    """
+    try:
+        params = list(inspect.signature(adapter_cls.create_instance).parameters.values())[1:]
+    except (TypeError, ValueError, AttributeError):
+        return False, True
+    positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    legacy = len(positional) >= 4 or any(p.kind is p.VAR_POSITIONAL for p in params)
+    takes_plan_only = any(p.name == "plan_only" or p.kind is p.VAR_KEYWORD for p in params)
+    return legacy, takes_plan_only
+
+
 class BackhaulAdapterWrapper:
     def __init__(self, adapter: Any, collector: Collector):
         self._adapter = adapter
         self._collector = collector
         # attempt to detect provider name
         self.provider = getattr(adapter, "name", getattr(adapter, "__class__", type(adapter)).__name__).lower()
+        # plan events buffered while inside batched_plans(); None when not batching
+        self._pending_plans: Optional[List[Dict[str, Any]]] = None
 
     def __getattr__(self, name):
         # delegate everything missing to underlying adapter
@@ -51,6 +72,32 @@ class BackhaulAdapterWrapper:
     # - plan(logical_id, spec) -> {"plan_id":..., "diff":..., "summary": {...}, "workdir":...}
     # - apply_plan(plan_id) -> {"success":bool, "adapter_id":..., "output": "...", "duration":...}
     # - create_instance(name, image, size, region, plan_only=True) -> fallback for small ops
+    #   (or create_instance(logical_id, spec, plan_only=...) as called by the autoscaler)
+
+    def _record_plan(self, event: Dict[str, Any]) -> None:
+        pending = self._pending_plans
+        if pending is not None:
+            pending.append(event)
+        else:
+            self._collector.record_plan(event)
+
+    @contextlib.contextmanager
+    def batched_plans(self):
+        """
+        Buffer plan events recorded inside the block and flush them to the
+        collector in one transaction on exit (see Collector.record_plans).
+        """
+        self._pending_plans = []
+        try:
+            yield self
+        finally:
+            pending, self._pending_plans = self._pending_plans, None
+            if pending:
+                try:
+                    self._collector.record_plans(pending)
+                except Exception:
+                    # never fail the caller due to collector problems
+                    pass
 
     def plan(self, logical_id: str, spec: Dict[str, Any]) -> Dict[str, Any]:
         # call underlying adapter.plan()
@@ -67,7 +114,7 @@ class BackhaulAdapterWrapper:
                 "plan_text": plan_text,
                 "plan_summary": plan_summary,
             }
-            self._collector.record_plan(event)
+            self._record_plan(event)
             # return res unchanged for caller
         except Exception:
             # never fail the plan due to collector problems
@@ -75,10 +122,10 @@ class BackhaulAdapterWrapper:
         return res
 
     def apply_plan(self, plan_id: str, **kwargs) -> Dict[str, Any]:
-        start = time.time()
+        start = time.perf_counter()
         res = self._adapter.apply_plan(plan_id, **kwargs)
         try:
-            duration = res.get("duration") or (time.time() - start)
+            duration = res.get("duration") or (time.perf_counter() - start)
             out = res.get("output") or res.get("stdout") or ""
             apply_event = {
                 "success": bool(res.get("success")),
@@ -92,15 +139,26 @@ class BackhaulAdapterWrapper:
         return res
 
     # convenience wrapper for create_instance used by autoscaler
-    def create_instance(self, name: str, image: str, size: str, region: str, plan_only: bool = True) -> Dict[str, Any]:
+    def create_instance(self, name: str, image: Any = None, size: Optional[str] = None, region: Optional[str] = None, plan_only: bool = True) -> Dict[str, Any]:
         # call underlying adapter's create_instance (adapters may accept different params)
         # Normalize result to include plan_id/diff/summary in plan-only case
-        try:
-            res = self._adapter.create_instance(name, image, size, region, plan_only=plan_only)
-        except TypeError:
-            # fallback: some adapters expect (name, spec, plan_only)
+        if isinstance(image, dict):
+            # autoscaler form: (logical_id, spec, plan_only=...)
+            spec = image
+            try:
+                res = self._adapter.create_instance(name, spec, plan_only=plan_only)
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        else:
+            spec = {"image": image, "size": size, "region": region}
+            legacy, takes_plan_only = _create_signature(type(self._adapter))
+            kwargs = {"plan_only": plan_only} if takes_plan_only else {}
             try:
-                res = self._adapter.create_instance(name, {"image": image, "size": size, "region": region}, plan_only=plan_only)
+                if legacy:
+                    res = self._adapter.create_instance(name, image, size, region, **kwargs)
+                else:
+                    # some adapters expect (name, spec, plan_only)
+                    res = self._adapter.create_instance(name, spec, **kwargs)
             except Exception as e:
                 return {"success": False, "error": str(e)}
         # If plan-only, record plan
@@ -109,10 +167,10 @@ class BackhaulAdapterWrapper:
                 plan_id = res.get("plan_id") or f"plan-fallback-{name}-{int(time.time())}"
                 plan_text = res.get("diff") or ""
                 plan_summary = res.get("summary") or {}
-                self._collector.record_plan({
+                self._record_plan({
                     "logical_id": name,
                     "provider": self.provider,
-                    "spec": redact_secrets({"image": image, "size": size, "region": region}),
+                    "spec": redact_secrets(spec),
                     "plan_id": plan_id,
                     "plan_text": plan_text,
                     "plan_summary": plan_summary
@@ -5,7 +5,6 @@ Handles checking if users are authenticated for specific cloud providers.
 """
 
 from __future__ import annotations
-import json
 import os
 import pathlib
 import typing as t
@@ -13,18 +12,36 @@ from typing import Optional, Dict, Any
 
 import typer
 
+from LCF import jsonx
+
 CONFIG_DIR = pathlib.Path.home() / ".cloudbrew"
 CONFIG_PATH = CONFIG_DIR / "config.json"
 
 
+# parsed config keyed by (path, mtime_ns, size); the file is re-read only when it changes
+_CACHE: Dict[str, Any] = {"key": None, "data": None}
+
+
 def _load_config() -> Optional[dict]:
-    """Load CloudBrew configuration from file."""
-    if not CONFIG_PATH.exists():
+    """Load CloudBrew configuration from file (cached until the file changes)."""
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
+        _CACHE["key"] = _CACHE["data"] = None
         return None
+    key = (str(CONFIG_PATH), st.st_mtime_ns, st.st_size)
+    if _CACHE["key"] == key:
+        return _CACHE["data"]
     try:
-        return json.loads(CONFIG_PATH.read_text())
-    except Exception:
+        data = jsonx.loads(CONFIG_PATH.read_bytes())
+    except FileNotFoundError:
+        # removed between stat() and read
+        _CACHE["key"] = _CACHE["data"] = None
         return None
+    except Exception:
+        data = None
+    _CACHE["key"], _CACHE["data"] = key, data
+    return data
 
 
 def is_authenticated_for_provider(provider: str) -> bool:
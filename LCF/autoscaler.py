@@ -1,30 +1,42 @@
 from __future__ import annotations
+import contextlib
+import heapq
 import time
 import threading
-import json
 import re
 import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
-from LCF import store
+from LCF import jsonx, store
 from LCF.cloud_adapters import get_compute_adapter
 from LCF.cloud_adapters.noop_adapter import NoopComputeAdapter
 
 DEFAULT_COOLDOWN = 60
+# upper bound on concurrent adapter calls per reconcile; adapter calls are I/O-bound
+MAX_PARALLEL = 8
+
+# "min:max" or "min:max@metric:threshold,cooldown" (input is stripped before matching)
+AUTOSCALE_RE = re.compile(r"(\d+)\s*:\s*(\d+)(?:\s*@\s*([a-zA-Z0-9_]+)\s*:\s*(\d+)\s*,\s*(\d+))?")
+
+
+def fixed_autoscale_cfg(n: int = 1) -> Dict[str, Any]:
+    """Config pinned at n instances; the empty policy is a shared tuple since it is only read."""
+    return {"min": n, "max": n, "policy": (), "cooldown": DEFAULT_COOLDOWN}
 
 
 def parse_autoscale_string(s: Optional[str]) -> Dict[str, Any]:
-    if not s or s.strip() == "":
-        return {"min": 1, "max": 1, "policy": [], "cooldown": DEFAULT_COOLDOWN}
+    s = (s or "").strip()
+    if not s:
+        return fixed_autoscale_cfg()
 
-    s = s.strip()
     if s[0] in ("{", "["):
         try:
-            return json.loads(s)
+            return jsonx.loads(s)
         except Exception:
             raise ValueError("Invalid autoscale JSON string")
 
-    m = re.match(r"^\s*(\d+)\s*:\s*(\d+)(?:\s*@\s*([a-zA-Z0-9_]+)\s*:\s*(\d+)\s*,\s*(\d+))?\s*$", s)
+    m = AUTOSCALE_RE.fullmatch(s)
     if m:
         min_c = int(m.group(1))
         max_c = int(m.group(2))
@@ -37,8 +49,7 @@ def parse_autoscale_string(s: Optional[str]) -> Dict[str, Any]:
         return {"min": min_c, "max": max_c, "policy": policy, "cooldown": cooldown}
 
     if s.isdigit():
-        n = int(s)
-        return {"min": n, "max": n, "policy": [], "cooldown": DEFAULT_COOLDOWN}
+        return fixed_autoscale_cfg(int(s))
 
     raise ValueError(f"Unsupported autoscale string: {s}")
 
@@ -53,14 +64,19 @@ class AutoscalerManager:
                 self.adapter = get_compute_adapter(provider or "noop")
             except Exception:
                 self.adapter = NoopComputeAdapter()
+        self._adapter_cls = self.adapter.__class__.__name__
+        self._adapter_name = self._adapter_cls.lower()
         self._cooldowns: Dict[str, int] = {}  # logical_prefix -> last_action_ts
+        self._stop_event = threading.Event()
+        # caller-supplied stop events of the run_loops in progress, so stop() reaches them too
+        self._loop_events: set = set()
 
-    def _in_cooldown(self, logical_prefix: str, cooldown: int) -> bool:
+    def _in_cooldown(self, logical_prefix: str, cooldown: int, now: Optional[float] = None) -> bool:
         last = self._cooldowns.get(logical_prefix, 0)
-        return (time.time() - last) < cooldown
+        return ((time.time() if now is None else now) - last) < cooldown
 
-    def _set_cooldown(self, logical_prefix: str):
-        self._cooldowns[logical_prefix] = int(time.time())
+    def _set_cooldown(self, logical_prefix: str, now: Optional[float] = None):
+        self._cooldowns[logical_prefix] = int(time.time() if now is None else now)
 
     def _evaluate_desired(self, current_count: int, autoscale_cfg: Dict[str, Any], observed: Dict[str, Any]) -> int:
         """
@@ -115,14 +131,24 @@ class AutoscalerManager:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _parallel(self, fn, items: List[Any]) -> List[Any]:
+        """Map fn over items on a small thread pool; results keep input order."""
+        if len(items) <= 1:
+            return [fn(i) for i in items]
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL, len(items))) as pool:
+            return list(pool.map(fn, items))
+
     def run_once(self, logical_prefix: str, spec: Dict[str, Any], autoscale_cfg: Dict[str, Any], observed_metrics: Dict[str, Any], plan_only: bool = True) -> Dict[str, Any]:
         """
         Reconcile once:
         - read store for existing children matching logical_prefix
         - compute desired using policies
         - create or delete to converge
-        - persist actions to store via store.log_action / upsert_instance
+        - persist actions to store via store.log_actions_bulk / upsert_instances
         """
+        # one clock read per reconcile: child names, created_at, action log and cooldown share it
+        stamp = int(time.time())
+
         # current instances that match prefix
         rows = self.store.list_instances()
         current_instances = [r for r in rows if r["logical_id"].startswith(logical_prefix)]
@@ -132,45 +158,57 @@ class AutoscalerManager:
 
         # respect cooldown
         cooldown = int(autoscale_cfg.get("cooldown", DEFAULT_COOLDOWN))
-        if self._in_cooldown(logical_prefix, cooldown):
+        if self._in_cooldown(logical_prefix, cooldown, stamp):
             # do nothing, but return report
-            return {"logical_id": logical_prefix, "desired": desired, "actual": current_count, "actions": [], "actual_after": current_count, "cooldown": True}
+            return {"logical_id": logical_prefix, "desired": desired, "actual": current_count, "actions": [], "actual_after": current_count, "cooldown": True, "plan_id": None}
 
         actions = []
-        stamp = int(time.time())
+        # last plan produced by a create; surfaced at the top level so callers need not scan actions
+        plan_id = None
 
         # scale up
         if desired > current_count:
             to_add = desired - current_count
+            # adapters wrapped by the backhaul collector can buffer plan events and
+            # persist them in one transaction instead of one commit per child
+            batched = getattr(self.adapter, "batched_plans", None)
+            children = []
             for i in range(to_add):
                 child_logical = f"{logical_prefix}-{stamp}-{i}"
                 child_spec = dict(spec)
                 child_spec["name"] = child_logical
-                res = self._safe_create(child_logical, child_spec, plan_only=plan_only)
+                children.append((child_logical, child_spec))
+            with batched() if callable(batched) else contextlib.nullcontext():
+                results = self._parallel(lambda c: self._safe_create(c[0], c[1], plan_only=plan_only), children)
+            created = []
+            for (child_logical, child_spec), res in zip(children, results):
+                plan_id = res.get("plan_id") or plan_id
                 # persist if applied and adapter returned adapter_id
                 if not plan_only and res.get("success"):
-                    adapter_id = res.get("adapter_id") or res.get("InstanceId") or f"{self.adapter.__class__.__name__}-{child_logical}"
-                    inst = {
+                    adapter_id = res.get("adapter_id") or res.get("InstanceId") or f"{self._adapter_cls}-{child_logical}"
+                    created.append({
                         "logical_id": child_logical,
-                        "adapter": getattr(self.adapter, "__class__", type(self.adapter)).__name__.lower(),
+                        "adapter": self._adapter_name,
                         "adapter_id": adapter_id,
                         "spec": child_spec,
                         "state": "running",
                         "created_at": stamp
-                    }
-                    try:
-                        self.store.upsert_instance(inst)
-                    except Exception:
-                        pass
+                    })
                 actions.append({"action": "create", "logical_id": child_logical, "res": res})
+            try:
+                self.store.upsert_instances(created)
+            except Exception:
+                pass
 
         # scale down
         elif desired < current_count:
             to_remove = current_count - desired
-            removable = sorted(current_instances, key=lambda r: r.get("created_at", 0))[:to_remove]
-            for r in removable:
-                adapter_id = r.get("adapter_id")
-                res = self._safe_delete(adapter_id)
+            # only the oldest to_remove rows are needed: O(N log k) instead of a full sort
+            removable = heapq.nsmallest(to_remove, current_instances, key=lambda r: r.get("created_at", 0))
+            ids = [r.get("adapter_id") for r in removable]
+            results = self._parallel(self._safe_delete, ids)
+            # store writes stay on this thread; the store shares a single connection
+            for r, adapter_id, res in zip(removable, ids, results):
                 if res.get("success"):
                     try:
                         self.store.delete_instance_by_adapter_id(adapter_id)
@@ -178,33 +216,55 @@ class AutoscalerManager:
                         pass
                 actions.append({"action": "delete", "logical_id": r["logical_id"], "adapter_id": adapter_id, "res": res})
 
-        # log to actions table
+        # log to actions table: encode each row once, write them all in one transaction
+        log_rows = []
         for a in actions:
             try:
-                self.store.log_action(a.get("action"), {"logical_id": a.get("logical_id"), "res": a.get("res"), "ts": int(time.time())})
+                log_rows.append((stamp, a.get("action"), jsonx.dumps({"logical_id": a.get("logical_id"), "res": a.get("res"), "ts": stamp})))
             except Exception:
                 pass
+        try:
+            self.store.log_actions_bulk(log_rows)
+        except Exception:
+            pass
 
         # set cooldown if we took actions
         if actions:
-            self._set_cooldown(logical_prefix)
+            self._set_cooldown(logical_prefix, stamp)
 
         actual_after = len([r for r in self.store.list_instances() if r["logical_id"].startswith(logical_prefix)]) if not plan_only else max(current_count, desired)
-        return {"logical_id": logical_prefix, "desired": desired, "actual": current_count, "actions": actions, "actual_after": actual_after, "cooldown": False}
+        return {"logical_id": logical_prefix, "desired": desired, "actual": current_count, "actions": actions, "actual_after": actual_after, "cooldown": False, "plan_id": plan_id}
+
+    def stop(self):
+        """Ask a running run_loop to exit; it wakes immediately instead of finishing its sleep."""
+        self._stop_event.set()
+        for ev in list(self._loop_events):
+            ev.set()
 
     def run_loop(self, specs: List[Dict[str, Any]], interval_seconds: int = 30, stop_event: Optional[threading.Event] = None):
         """
         Run reconcile loop. Each spec item: {"logical_prefix":..., "spec":..., "autoscale_cfg":..., "observed_metrics":...}
+        Iterations start every interval_seconds (monotonic clock); the time spent reconciling
+        is subtracted from the wait so the cadence does not drift.
         """
         if stop_event is None:
-            stop_event = threading.Event()
+            stop_event = self._stop_event
+        self._loop_events.add(stop_event)
+        try:
+            self._reconcile_loop(specs, interval_seconds, stop_event)
+        finally:
+            self._loop_events.discard(stop_event)
+            # the stop() that ended this loop must not end the next one
+            self._stop_event.clear()
 
+    def _reconcile_loop(self, specs: List[Dict[str, Any]], interval_seconds: int, stop_event: threading.Event):
         while not stop_event.is_set():
+            started = time.monotonic()
             for s in specs:
                 lp = s.get("logical_prefix") or s.get("name") or (s.get("spec") or {}).get("name")
                 if not lp:
                     continue
-                cfg = s.get("autoscale_cfg") or {"min": s.get("spec", {}).get("count", 1), "max": s.get("spec", {}).get("count", 1), "policy": [], "cooldown": DEFAULT_COOLDOWN}
+                cfg = s.get("autoscale_cfg") or fixed_autoscale_cfg(s.get("spec", {}).get("count", 1))
                 observed = s.get("observed_metrics") or {}
                 try:
                     self.run_once(lp, s.get("spec", {}), cfg, observed, plan_only=True)
@@ -213,4 +273,5 @@ class AutoscalerManager:
                         self.store.log_action("autoscaler.loop.error", {"logical_prefix": lp, "ts": int(time.time())})
                     except Exception:
                         pass
-            stop_event.wait(interval_seconds)
+            if stop_event.wait(max(0.0, interval_seconds - (time.monotonic() - started))):
+                break
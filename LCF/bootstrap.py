@@ -1,11 +1,12 @@
 # cloudbrew/bootstrap.py
 from __future__ import annotations
-import json
+import functools
 import threading
 import typing as t
 import pathlib
 import os
 
+from . import jsonx
 from .secret_store import SecretStore, CONFIG_DIR
 
 CONFIG_PATH = CONFIG_DIR / "config.json"
@@ -13,23 +14,30 @@ store = SecretStore()
 
 
 def load_config() -> dict | None:
-    local_path = pathlib.Path("config.json")
-    if local_path.exists():
+    # 1. ./config.json, 2. ~/.cloudbrew/config.json
+    # read directly instead of exists() + read: one syscall per path and no check/read race
+    for path in (pathlib.Path("config.json"), CONFIG_PATH):
         try:
-            return json.loads(local_path.read_text(encoding="utf-8"))
+            return jsonx.loads(path.read_bytes())
         except Exception:
-            pass 
-
-    # 2. Check Home Directory
-    if CONFIG_PATH.exists():
-        try:
-            return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-            
+            # missing or unreadable: fall through to the next location
+            continue
     return None
 
 
+# Cloud SDKs are heavy; resolve them on first use only and reuse the module afterwards.
+@functools.lru_cache(maxsize=None)
+def _boto3():
+    import boto3  # type: ignore
+    return boto3
+
+
+@functools.lru_cache(maxsize=None)
+def _azure_client_secret_credential():
+    from azure.identity import ClientSecretCredential  # type: ignore
+    return ClientSecretCredential
+
+
 def validate_provider(cfg: dict) -> dict:
     """
     Synchronously validate the configured provider.
@@ -64,8 +72,7 @@ def validate_provider(cfg: dict) -> dict:
             secret = store.retrieve_secret(secret_key_name)
             # Lightweight validation using boto3 if available
             try:
-                import boto3  # type: ignore
-                client = boto3.client(
+                client = _boto3().client(
                     "sts",
                     aws_access_key_id=access,
                     aws_secret_access_key=secret,
@@ -85,8 +92,8 @@ def validate_provider(cfg: dict) -> dict:
             else:
                 try:
                     # Lightweight validation: check if file is valid JSON
-                    with open(sa_path, 'r') as f:
-                        json.load(f)
+                    with open(sa_path, 'rb') as f:
+                        jsonx.loads(f.read())
                     result["notice"] = "GCP service account JSON valid"
                 except Exception as e:
                     result.update({"ok": False, "fallback": True, "notice": f"GCP validation failed: {e}"})
@@ -100,8 +107,7 @@ def validate_provider(cfg: dict) -> dict:
             secret_key_name = secret_meta.get("key") or "azure_client_secret"
             secret = store.retrieve_secret(secret_key_name)
             try:
-                from azure.identity import ClientSecretCredential  # type: ignore
-                cred = ClientSecretCredential(tenant, client_id, secret)
+                cred = _azure_client_secret_credential()(tenant, client_id, secret)
                 cred.get_token("https://management.azure.com/.default")
                 result["notice"] = "Azure credentials valid"
             except Exception as e:
@@ -1,43 +1,24 @@
 from __future__ import annotations  
 
-import json
+import atexit
 import os
 import sys
 import click
 import time
 from pathlib import Path
-import copy  
+import copy
+import functools
 from typing import Optional, List, Dict, Any
 
 import typer
 from typer.core import TyperGroup
-from LCF.cloud_adapters.tofu_validator import run_tofu_validate
-from LCF.cloud_adapters.dynamic_resource_creator import create_resource_with_validation
-
-# Try importing PyYAML for YAML support
-try:
-    import yaml
-except ImportError:
-    yaml = None
 
 # -------------------------------------------------------------
 # Local Imports
 # -------------------------------------------------------------
-from LCF.resource_resolver import ResourceResolver
-from LCF.dsl_parser import parse_cbdsl 
-from LCF.autoscaler import AutoscalerManager, parse_autoscale_string
-from LCF.offload.manager import OffloadManager
-from LCF.cloud_adapters import pulumi_adapter
-from LCF.cloud_adapters.opentofu_adapter import OpenTofuAdapter
-from LCF.intelligent_builder import IntelligentBuilder  # NEW
-from LCF.provisioning.pipeline import ProvisioningPipeline
-
-# Feature Imports
-from LCF.policy_engine import PolicyEngine
-from LCF.stack_manager import StackManager
-from LCF.intelligent_router import IntelligentRouter
-from LCF.pool_manager import WarmPoolManager
-from LCF import store
+# Adapters, managers and the resolver are imported inside the commands that use
+# them, so `cloudbrew --help` and unrelated subcommands don't pay for them.
+from LCF import jsonx
 from LCF.auth_utils import ensure_authenticated_for_resource, get_default_provider
 
 # -------------------------------------------------------------
@@ -46,9 +27,140 @@ from LCF.auth_utils import ensure_authenticated_for_resource, get_default_provid
 DEFAULT_DB = "cloudbrew.db"
 DEFAULT_OFFLOAD_DB = "cloudbrew_offload.db"
 
-# Initialize Intelligent Builder
-intelligent_builder = IntelligentBuilder()
-provisioning_pipeline = ProvisioningPipeline()
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """PyYAML (optional, for .yml specs), imported on first use."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+class _LazyPipeline:
+    """
+    Stands in for the shared ProvisioningPipeline until a command first uses it, so
+    `--help`, status, offload and the other non-provisioning commands never import or
+    build it (resolver, OpenTofu adapter, run store). Attribute reads and writes are
+    forwarded to the real pipeline.
+    """
+    __slots__ = ("_obj",)
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_obj", None)
+
+    def _get(self):
+        obj = object.__getattribute__(self, "_obj")
+        if obj is None:
+            from LCF.provisioning.pipeline import ProvisioningPipeline
+            obj = ProvisioningPipeline()
+            object.__setattr__(self, "_obj", obj)
+        return obj
+
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get(), name)
+
+
+provisioning_pipeline = _LazyPipeline()
+
+
+# -------------------------------------------------------------
+# Output
+# -------------------------------------------------------------
+# None = pretty-print only when stdout is a terminal; set by --pretty/--compact
+_PRETTY: Optional[bool] = None
+# stdout write size for streamed output when not on a terminal
+_STREAM_CHUNK = 1 << 16
+
+
+def _write_json_line(data: bytes) -> None:
+    out = sys.stdout
+    buf = getattr(out, "buffer", None)
+    if buf is None:
+        out.write(data.decode("utf-8") + "\n")
+        out.flush()
+        return
+    # flush pending text (secho/echo) first so ordering is preserved
+    out.flush()
+    buf.write(data + b"\n")
+    buf.flush()
+
+
+def _pretty() -> bool:
+    return sys.stdout.isatty() if _PRETTY is None else _PRETTY
+
+
+def _emit(obj: Any) -> None:
+    """Write obj as JSON bytes straight to stdout (orjson when available)."""
+    _write_json_line(jsonx.dumps_bytes(obj, indent=_pretty()))
+
+
+def _emit_array(key: str, items) -> None:
+    """
+    Write {key: [items...]} incrementally, one encoded item at a time in ~64 KiB
+    writes, so a large result is never materialized as one list or one string.
+    Pretty (terminal) output is small enough to go through _emit.
+    """
+    out = sys.stdout
+    buf = getattr(out, "buffer", None)
+    if buf is None or _pretty():
+        _emit({key: list(items)})
+        return
+    out.flush()
+    pending = bytearray(jsonx.dumps_bytes(key).join((b'{', b':[')))
+    first = True
+    for item in items:
+        if not first:
+            pending += b","
+        first = False
+        pending += jsonx.dumps_bytes(item)
+        if len(pending) >= _STREAM_CHUNK:
+            buf.write(pending)
+            pending.clear()
+    pending += b"]}\n"
+    buf.write(pending)
+    buf.flush()
+
+
+def _emit_lines(key: str, lines) -> None:
+    """Stream adapter output as JSON Lines ({key: line} per line) as it is produced."""
+    for ln in lines:
+        _write_json_line(jsonx.dumps_bytes({key: ln}))
+
+
+def _stream_text(lines) -> None:
+    """
+    Write raw adapter output lines to stdout. On a terminal each line is flushed as it
+    arrives; when piped, lines are batched into ~64 KiB writes instead of one flush each.
+    """
+    out = sys.stdout
+    buf = getattr(out, "buffer", None)
+    if buf is None:
+        for ln in lines:
+            out.write(f"{ln}\n")
+        out.flush()
+        return
+    out.flush()
+    live = out.isatty()
+    pending = bytearray()
+    for ln in lines:
+        pending += ln if isinstance(ln, bytes) else str(ln).encode("utf-8")
+        pending += b"\n"
+        if live or len(pending) >= _STREAM_CHUNK:
+            buf.write(pending)
+            buf.flush()
+            pending.clear()
+    if pending:
+        buf.write(pending)
+    buf.flush()
 
 
 # -------------------------------------------------------------
@@ -56,22 +168,34 @@ provisioning_pipeline = ProvisioningPipeline()
 # -------------------------------------------------------------
 def _load_spec(path_str: str) -> Dict[str, Any]:
     """Load a spec from JSON or YAML file."""
-    p = Path(path_str)
-    if not p.exists():
-        # Fallback: check if user provided just the name without extension
-        if not path_str.endswith(".json") and not path_str.endswith(".yml"):
-            json_p = Path(f"{path_str}.json")
-            yml_p = Path(f"{path_str}.yml")
-            if json_p.exists(): return _load_spec(str(json_p))
-            elif yml_p.exists(): return _load_spec(str(yml_p))
-        
-        raise typer.BadParameter(f"Spec file not found: {path_str}")
+    candidates = [path_str]
+    # Fallback: the user may have provided just the name without extension
+    if not path_str.endswith(".json") and not path_str.endswith(".yml"):
+        candidates += [f"{path_str}.json", f"{path_str}.yml"]
+
+    # one stat per candidate (no exists() pre-check); its mtime/size also key the parse cache
+    for cand in candidates:
+        try:
+            st = os.stat(cand)
+        except OSError:
+            continue
+        # parsed specs are cached per (path, mtime, size); callers get their own copy to mutate
+        return copy.deepcopy(_parse_spec_file(os.path.abspath(cand), st.st_mtime_ns, st.st_size))
 
-    content = p.read_text(encoding="utf-8")
+    raise typer.BadParameter(f"Spec file not found: {path_str}")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_spec_file(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    p = Path(path_str)
+    yaml = _yaml()
+    # one contiguous read; the JSON parser takes the bytes as-is
+    content = p.read_bytes()
 
     if p.suffix == ".cbdsl":
+        from LCF.dsl_parser import parse_cbdsl
         try:
-            return parse_cbdsl(content)
+            return parse_cbdsl(content.decode("utf-8"))
         except Exception as e:
             raise typer.BadParameter(f"Invalid CBDSL in {path_str}: {e}")
     
@@ -86,8 +210,8 @@ def _load_spec(path_str: str) -> Dict[str, Any]:
     
     # Default to JSON
     try:
-        return json.loads(content)
-    except json.JSONDecodeError as e:
+        return jsonx.loads(content)
+    except jsonx.JSONDecodeError as e:
         # If it wasn't explicitly .yml but failed JSON, try YAML as fallback if installed
         if yaml:
             try:
@@ -104,46 +228,7 @@ def prompt_for_missing_fields(spec: Dict[str, Any], resource_type: str) -> Dict[
         err=True,
     )
     return dict(spec)
-    """Load a spec from JSON or YAML file."""
-    p = Path(path_str)
-    if not p.exists():
-        # Fallback: check if user provided just the name without extension
-        if not path_str.endswith(".json") and not path_str.endswith(".yml"):
-            json_p = Path(f"{path_str}.json")
-            yml_p = Path(f"{path_str}.yml")
-            if json_p.exists(): return _load_spec(str(json_p))
-            elif yml_p.exists(): return _load_spec(str(yml_p))
-        
-        raise typer.BadParameter(f"Spec file not found: {path_str}")
 
-    content = p.read_text(encoding="utf-8")
-
-    if p.suffix == ".cbdsl":
-        try:
-            return parse_cbdsl(content)
-        except Exception as e:
-            raise typer.BadParameter(f"Invalid CBDSL in {path_str}: {e}")
-    
-    # Try YAML if extension matches or if json fails
-    if p.suffix in (".yml", ".yaml"):
-        if yaml is None:
-            raise typer.Exit("PyYAML is missing. Install it to use .yml files: pip install PyYAML")
-        try:
-            return yaml.safe_load(content)
-        except yaml.YAMLError as e:
-            raise typer.BadParameter(f"Invalid YAML in {path_str}: {e}")
-    
-    # Default to JSON
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError as e:
-        # If it wasn't explicitly .yml but failed JSON, try YAML as fallback if installed
-        if yaml:
-            try:
-                return yaml.safe_load(content)
-            except Exception:
-                pass
-        raise typer.BadParameter(f"Invalid JSON in {path_str}: {e}")
 
 def parse_autoscale_config(autoscale_str: str) -> Dict:
     """Parse autoscaling configuration string"""
@@ -178,6 +263,18 @@ def parse_autoscale_config(autoscale_str: str) -> Dict:
     except Exception as e:
         raise typer.BadParameter(f"Invalid autoscale format: {str(e)}")
 
+@functools.lru_cache(maxsize=None)
+def _detect_provider(envsig: tuple) -> str:
+    """Provider for `create-vm --provider auto`, keyed on which AWS credentials are present."""
+    return "aws" if any(envsig) else "opentofu"
+
+
+def _default_vm_provider() -> str:
+    # keyed on credential presence rather than cached once: adapters may export AWS keys later
+    env = os.environ
+    return _detect_provider((bool(env.get("AWS_ACCESS_KEY_ID")), bool(env.get("AWS_PROFILE"))))
+
+
 def _get_logical_id(spec: Dict, stack: str) -> str:
     """Helper to determine the logical ID (name) of the resource/stack."""
     name = spec.get("name", "unnamed")
@@ -187,9 +284,208 @@ def _get_logical_id(spec: Dict, stack: str) -> str:
     return name
 
 
+# -------------------------------------------------------------
+# Resource Resolution (one resolver per process, memoized lookups)
+# -------------------------------------------------------------
+_RR = None
+
+
+def _resolver():
+    global _RR
+    if _RR is None:
+        from LCF.resource_resolver import ResourceResolver
+        _RR = ResourceResolver()
+    return _RR
+
+
+@functools.lru_cache(maxsize=256)
+def _canonicalize_cached(resource: str, provider_hint: Any, logical_name: Optional[str]) -> Dict[str, Any]:
+    return _resolver().canonicalize_identity(
+        resource=resource,
+        provider_hint=provider_hint,
+        logical_name=logical_name,
+    )
+
+
+def _canonicalize(resource: str, provider_hint: Any = "auto", logical_name: Optional[str] = None) -> Dict[str, Any]:
+    res = _canonicalize_cached(resource, provider_hint, logical_name)
+    # hand out a copy so callers can't mutate the cached entry
+    return dict(res) if isinstance(res, dict) else res
+
+
+# -------------------------------------------------------------
+# Managers (one instance, and one SQLite handle, per DB path per process)
+# -------------------------------------------------------------
+_pooled: List[Any] = []
+
+
+@atexit.register
+def _close_pooled() -> None:
+    # close pooled SQLite handles on interpreter exit so WAL is checkpointed cleanly
+    while _pooled:
+        close = getattr(_pooled.pop(), "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+
+@functools.lru_cache(maxsize=16)
+def _mgr(kind: str, db_path: Optional[str] = None, provider: Optional[str] = None):
+    """
+    kind: "auto" (AutoscalerManager), "off" (OffloadManager), "store" (SQLiteStore)
+    or "tofu" (OpenTofuAdapter).
+    Repeated calls in the same process reuse the instance instead of reopening the DB
+    and re-running its schema script; pooled instances are closed at exit.
+    """
+    if kind == "auto":
+        from LCF.autoscaler import AutoscalerManager
+        obj = AutoscalerManager(db_path=db_path, provider=provider)
+        _pooled.append(obj.store)
+    elif kind == "off":
+        from LCF.offload.manager import OffloadManager
+        obj = OffloadManager(db_path or DEFAULT_OFFLOAD_DB)
+        _pooled.append(obj)
+    elif kind == "store":
+        from LCF import store
+        obj = store.SQLiteStore(db_path)
+        _pooled.append(obj)
+    elif kind == "tofu":
+        from LCF.cloud_adapters.opentofu_adapter import OpenTofuAdapter
+        obj = OpenTofuAdapter(db_path)
+        _pooled.append(obj.store)
+    else:
+        raise ValueError(f"unknown manager kind: {kind}")
+    return obj
+
+
+def _enqueue(adapter: str, task_type: str, payload: Dict[str, Any], db_path: str = DEFAULT_OFFLOAD_DB, **extra) -> None:
+    """Shared --async/--offload branch: queue the task and report its id (plus any extra keys)."""
+    tid = _mgr("off", db_path).enqueue(adapter, task_type, payload)
+    _emit({"enqueued_task_id": tid, **extra})
+
+
 # -------------------------------------------------------------
 # Dynamic Command Fallback System
 # -------------------------------------------------------------
+def _parse_dynamic_args(raw_args) -> tuple:
+    """
+    Single pass over the dynamic verb's argv.
+    Returns (name, params, apply_flag): the first positional token is the logical
+    name, `--key value` pairs and bare `--flag` booleans go to params, and
+    `--apply` / `-apply` set apply_flag.
+    """
+    name = None
+    params: Dict[str, Any] = {}
+    apply_flag = False
+    n = len(raw_args)
+    i = 0
+    while i < n:
+        tok = raw_args[i]
+        i += 1
+        if tok == "--apply" or tok == "-apply":
+            apply_flag = True
+        elif tok[:2] == "--":
+            # treat `--flag value` or `--flag` (boolean)
+            if i < n and raw_args[i][:2] != "--":
+                params[tok[2:]] = raw_args[i]
+                i += 1
+            else:
+                params[tok[2:]] = True
+        elif name is None and tok[:1] != "-":
+            name = tok
+    return name or "unnamed", params, apply_flag
+
+
+# flags consumed by the dynamic verb itself rather than passed to the resource
+_CTRL = frozenset({"yes", "y", "async", "provider"})
+# raw schema keys from the resolver that are not echoed back in "resolved"
+_IGNORED_META = ("block", "version", "description_kind")
+
+
+def _dyn_out(mode: str, resource: str, name: str, resolved: Dict[str, Any], **fields) -> Dict[str, Any]:
+    """Output record for a dynamic verb: the shared header followed by the exit-specific fields."""
+    return {"mode": mode, "resource": resource, "name": name, "resolved": resolved, **fields}
+
+
+@functools.lru_cache(maxsize=64)
+def _dynamic_command(cmd_name: str) -> click.Command:
+    """
+    Build the fallback command for a resource verb that has no static command.
+    Cached per verb: click commands are stateless between invocations, so the group
+    lookup and main() reuse one object instead of rebuilding its params each time.
+    """
+    def dynamic_command(_args):
+        name, params, apply_flag = _parse_dynamic_args(_args or ())
+
+        # control flags: one sweep splits them off from the resource attributes
+        control = {k: params.pop(k) for k in [k for k in params if k in _CTRL]}
+        yes = bool(control.get("yes") or control.get("y") or apply_flag)
+        should_apply = bool(apply_flag or yes)
+        async_apply = bool(control.get("async"))
+        provider_hint = control.get("provider", "auto")
+
+        resolved_meta = _canonicalize(cmd_name, provider_hint, name)
+        if not isinstance(resolved_meta, dict):
+            resolved_meta = {}
+        resolved_provider = resolved_meta.get("_provider") or "opentofu"
+        resolved_name = resolved_meta.get("_resolved") or cmd_name
+
+        # Build a resolved dict that will be included in every output:
+        # resolver meta minus raw schema keys, with the core keys winning
+        extra = dict(resolved_meta)
+        for k in _IGNORED_META:
+            extra.pop(k, None)
+        resolved_block = {
+            **extra,
+            "_provider": resolved_provider,
+            "_resolved": resolved_name,
+            "_identity": resolved_meta.get("_identity"),
+        }
+
+        # If not resolved, return helpful diagnostic JSON
+        if not resolved_meta or not resolved_meta.get("_resolved"):
+            _emit(_dyn_out(
+                "dynamic-fallback", cmd_name, name, resolved_block,
+                params=params,
+                error=f"could not resolve resource '{cmd_name}'",
+                failure=resolved_meta,
+            ))
+            return
+
+        # --- AUTHENTICATION CHECK ---
+        if resolved_provider != "noop":
+            ensure_authenticated_for_resource(resolved_provider, cmd_name)
+
+        pipeline_request = {
+            "name": name,
+            "resource_type": resolved_name or cmd_name,
+            "provider": resolved_provider,
+            "attributes": params,
+            "plan_only": not should_apply,
+            "non_interactive": yes,
+        }
+
+        try:
+            result = provisioning_pipeline.execute(pipeline_request)
+        except Exception as e:
+            _emit(_dyn_out("create-pipeline", cmd_name, name, resolved_block, error=str(e)))
+            return
+
+        _emit(_dyn_out("create-pipeline", cmd_name, name, resolved_block, result=result))
+        return
+
+    # return click.Command accepting varargs and ignoring unknown options
+    return click.Command(
+        name=cmd_name,
+        callback=dynamic_command,
+        params=[click.Argument(["_args"], nargs=-1)],
+        context_settings={"ignore_unknown_options": True},
+        add_help_option=False,
+    )
+
+
 class CloudbrewGroup(TyperGroup):
     def get_command(self, ctx, cmd_name: str):
         # check if static command exists first
@@ -198,132 +494,7 @@ class CloudbrewGroup(TyperGroup):
             return cmd
 
         # dynamic command fallback
-        def dynamic_command(_args):
-            raw_args = list(_args or [])
-            name = "unnamed"
-            params: Dict[str, Any] = {}
-
-            # first non-flag token is the logical name (if present)
-            idx = 0
-            while idx < len(raw_args):
-                if not raw_args[idx].startswith("--"):
-                    name = raw_args[idx]
-                    idx += 1
-                    break
-                idx += 1
-
-            apply_flag=False
-            if "-apply" in raw_args:
-                raw_args.remove("-apply")
-                apply_flag = True
-            elif "--apply" in raw_args:
-                raw_args.remove("--apply")
-                apply_flag = True
-
-            # parse --key value or boolean flags
-            i = 0
-            while i < len(raw_args):
-                tok = raw_args[i]
-                if tok.startswith("--"):
-                    key = tok.lstrip("-")
-                    # treat `--flag value` or `--flag` (boolean)
-                    if i + 1 < len(raw_args) and not raw_args[i + 1].startswith("--"):
-                        params[key] = raw_args[i + 1]
-                        i += 2
-                    else:
-                        params[key] = True
-                        i += 1
-                else:
-                    i += 1
-
-            # control flags
-            yes = bool(params.pop("yes", False) or params.pop("y", False) or apply_flag)
-            should_apply = bool(apply_flag or yes)
-            async_apply = bool(params.pop("async", False))
-            provider_hint = params.pop("provider", "auto")
-
-            # prepare resolver
-            rr = ResourceResolver()
-
-            resolved_meta = rr.canonicalize_identity(
-                resource=cmd_name,
-                provider_hint=provider_hint,
-                logical_name=name,
-            )
-            if not isinstance(resolved_meta, dict):
-                resolved_meta = {}
-            resolved_provider = resolved_meta.get("_provider") or "opentofu"
-            resolved_name = resolved_meta.get("_resolved") or cmd_name
-
-            # Build a resolved dict that will be included in every output
-            resolved_block = {
-                "_provider": resolved_provider,
-                "_resolved": resolved_name,
-                "_identity": resolved_meta.get("_identity"),
-            }
-            if isinstance(resolved_meta, dict):
-                # merge meta but keep core keys
-                ignored_keys = {"block", "version", "description_kind"}
-                for k, v in resolved_meta.items():
-                    if k not in resolved_block and k not in ignored_keys:
-                        resolved_block[k] = v
-
-            # If not resolved, return helpful diagnostic JSON
-            if not resolved_meta or not resolved_meta.get("_resolved"):
-                out = {
-                    "mode": "dynamic-fallback",
-                    "resource": cmd_name,
-                    "name": name,
-                    "params": params,
-                    "resolved": resolved_block,
-                    "error": f"could not resolve resource '{cmd_name}'",
-                    "failure": resolved_meta,
-                }
-                typer.echo(json.dumps(out, indent=2))
-                return
-
-            # --- AUTHENTICATION CHECK ---
-            if resolved_provider != "noop":
-                ensure_authenticated_for_resource(resolved_provider, cmd_name)
-
-            pipeline_request = {
-                "name": name,
-                "resource_type": resolved_name or cmd_name,
-                "provider": resolved_provider,
-                "attributes": params,
-                "plan_only": not should_apply,
-                "non_interactive": yes,
-            }
-
-            try:
-                result = provisioning_pipeline.execute(pipeline_request)
-            except Exception as e:
-                typer.echo(json.dumps({
-                    "mode": "create-pipeline",
-                    "resource": cmd_name,
-                    "name": name,
-                    "resolved": resolved_block,
-                    "error": str(e),
-                }, indent=2))
-                return
-
-            typer.echo(json.dumps({
-                "mode": "create-pipeline",
-                "resource": cmd_name,
-                "name": name,
-                "resolved": resolved_block,
-                "result": result,
-            }, indent=2))
-            return
-
-        # return click.Command accepting varargs and ignoring unknown options
-        return click.Command(
-            name=cmd_name,
-            callback=dynamic_command,
-            params=[click.Argument(["_args"], nargs=-1)],
-            context_settings={"ignore_unknown_options": True},
-            add_help_option=False,
-        )
+        return _dynamic_command(cmd_name)
 
 
 # -------------------------------------------------------------
@@ -334,6 +505,14 @@ offload_app = typer.Typer()
 pool_app = typer.Typer()  # <--- NEW: Pool Management Group
 runs_app = typer.Typer()
 
+@app.callback()
+def _root_options(
+    pretty: Optional[bool] = typer.Option(None, "--pretty/--compact", help="Indent JSON output (default: only on a terminal)"),
+):
+    global _PRETTY
+    _PRETTY = pretty
+
+
 app.add_typer(offload_app, name="offload")
 app.add_typer(pool_app, name="pool")
 app.add_typer(runs_app, name="runs")
@@ -373,6 +552,8 @@ def check_policy_or_die(spec: dict, skip: bool = False):
     """
     Runs policy engine, prints violations, and exits on ERROR severity.
     """
+    from LCF.policy_engine import PolicyEngine
+
     if skip:
         return
 
@@ -401,6 +582,8 @@ def pool_worker(
     Starts the Warm Pool Manager background worker.
     Keeps Hot/Warm tiers filled based on targets.
     """
+    from LCF.pool_manager import WarmPoolManager
+
     wm = WarmPoolManager()
     typer.secho(f"Warm Pool Worker started. Interval: {interval}s", fg=typer.colors.GREEN)
     
@@ -420,6 +603,8 @@ def pool_status():
     """
     Shows the current state of the Hot/Warm pools.
     """
+    from LCF.pool_manager import WarmPoolManager
+
     # Simple query to the pool DB
     db_path = WarmPoolManager.DB_PATH
     import sqlite3
@@ -437,8 +622,8 @@ def pool_status():
     typer.secho("Pool Status:", bold=True)
     if not rows:
         typer.echo("  (Empty)")
-    for r in rows:
-        typer.echo(f"  {r['tier'].upper():<5} | {r['status']:<10} : {r['cnt']}")
+    else:
+        typer.echo("\n".join(f"  {r['tier'].upper():<5} | {r['status']:<10} : {r['cnt']}" for r in rows))
 
 
 @runs_app.command("show")
@@ -449,7 +634,7 @@ def runs_show(
     data = provisioning_pipeline.get_run(run_id)
     if not data:
         raise typer.BadParameter(f"Unknown run_id: {run_id}")
-    typer.echo(json.dumps(data, indent=2))
+    _emit(data)
 
 
 @runs_app.command("replay")
@@ -458,7 +643,7 @@ def runs_replay(
 ):
     """Replay a prior run deterministically using the saved final merged spec."""
     result = provisioning_pipeline.replay(run_id)
-    typer.echo(json.dumps(result, indent=2))
+    _emit(result)
     if not result.get("success"):
         raise typer.Exit(1)
 
@@ -472,11 +657,13 @@ def stack_modify(
     """
     Interactive stack management: Create, Destroy, or Status.
     """
+    from LCF.stack_manager import StackManager
+
     typer.secho(f"Modifying Stack: {stack_name}", bold=True, fg=typer.colors.BLUE)
     action = typer.prompt("Select action (Create/Destroy/Status)").strip().lower()
 
     sm = StackManager()
-    st = store.SQLiteStore(DEFAULT_DB)
+    st = _mgr("store", DEFAULT_DB)
 
     if action == "create":
         # Scaffold logic
@@ -505,7 +692,7 @@ def stack_modify(
 
         typer.echo(f"Found {len(targets)} resources.")
         if click.confirm("Destroy them?"):
-            ta = OpenTofuAdapter() # Or use OffloadManager here for async
+            ta = _mgr("tofu")  # Or use OffloadManager here for async
             for t in targets:
                 adapter_id = t.get("adapter_id")
                 if adapter_id:
@@ -516,22 +703,21 @@ def stack_modify(
     elif action == "status":
         # Real-time state check
         all_inst = st.list_instances()
-        found = False
-        typer.echo(f"{'RESOURCE':<30} | {'STATE':<15} | {'PROVIDER':<10}")
-        typer.echo("-" * 60)
+        # the table is built in memory and written once instead of one write per row
+        lines = [f"{'RESOURCE':<30} | {'STATE':<15} | {'PROVIDER':<10}", "-" * 60]
         
         for inst in all_inst:
             spec = inst.get("spec", {})
             tags = spec.get("tags", {})
             
             if tags.get("stack") == stack_name or stack_name in inst["logical_id"]:
-                found = True
                 state = inst.get("state", "unknown").upper()
                 color = typer.colors.GREEN if state == "RUNNING" else typer.colors.YELLOW
-                typer.secho(f"{inst['logical_id']:<30} | {state:<15} | {inst['adapter']:<10}", fg=color)
+                lines.append(typer.style(f"{inst['logical_id']:<30} | {state:<15} | {inst['adapter']:<10}", fg=color))
         
-        if not found:
-            typer.echo("Stack not found or empty.")
+        if len(lines) == 2:
+            lines.append("Stack not found or empty.")
+        typer.echo("\n".join(lines))
 
     else:
         typer.secho("Invalid option.", fg=typer.colors.RED)
@@ -550,6 +736,8 @@ def stack_deploy(
     """
     Deploy a multi-resource stack using stack blueprints.
     """
+    from LCF.stack_manager import StackManager
+
     sm = StackManager()
 
     # Validate blueprint availability
@@ -581,10 +769,11 @@ def list_stacks():
     """
     List supported stack blueprints.
     """
+    from LCF.stack_manager import StackManager
+
     sm = StackManager()
     typer.secho("Available Blueprints:", bold=True)
-    for name, desc in sm.list_stacks().items():
-        typer.echo(f"{name:<15} : {desc}")
+    typer.echo("\n".join(f"{name:<15} : {desc}" for name, desc in sm.list_stacks().items()))
 
 
 # -------------------------------------------------------------
@@ -597,10 +786,11 @@ def check_drift_cmd(
     """
     Check for OpenTofu drift (manual cloud modifications).
     """
+
     # Add authentication check for drift operations
     ensure_authenticated_for_resource("opentofu", "resource")
     
-    ta = OpenTofuAdapter()
+    ta = _mgr("tofu")
 
     typer.echo(f" Checking drift for {name}...")
     res = ta.check_drift(name)
@@ -624,63 +814,18 @@ def check_drift_cmd(
 # -------------------------------------------------------------
 #  Updated create-vm (Policy + Tags + Confirmations + Intelligent Router)
 # -------------------------------------------------------------
-@app.command("create-vm")
-def create_vm(
-    name: str,
-    image: str = typer.Option("ubuntu-22.04"),
-    size: str = typer.Option("small"),
-    region: str = typer.Option("us-east-1"),
-    count: int = typer.Option(1),
-    provider: str = typer.Option("auto"), 
-    db_path: Optional[str] = typer.Option(DEFAULT_DB),
-    yes: bool = typer.Option(False, "--yes", "-y"),
-    async_apply: bool = typer.Option(False, "--async"),
-    offload_db: str = typer.Option(DEFAULT_OFFLOAD_DB),
-
-    # NEW flags
-    tags: str = typer.Option("{}", help="JSON tags"),
-    skip_policy: bool = typer.Option(False, "--skip-policy", help="Bypass governance policy checks"),
-    spec: Optional[str] = typer.Option(None, help="Optional JSON spec file instead of flags"),
-    router_mode: bool = typer.Option(True, "--smart/--standard", help="Use Intelligent Router"),
-):
+def _prepare_vm_spec(s: Dict[str, Any], skip_policy: bool = False) -> str:
     """
-    Create a VM with policy enforcement, intelligent routing (cache), tags, and plan preview.
+    Resolve a create-vm spec in place (type mapping, provider defaults, tags),
+    enforce policy and check auth. Returns the provider to provision with.
     """
-
-    # --------------------------------------------
-    # Build spec
-    # --------------------------------------------
-    if spec:
-        s = _load_spec(spec)
-    else:
-        try:
-            tag_dict = json.loads(tags)
-        except json.JSONDecodeError:
-            raise typer.BadParameter("Invalid JSON passed to --tags")
-
-        s = {
-            "name": name,
-            "type": "vm",
-            "image": image,
-            "size": size,
-            "region": region,
-            "count": count,
-            "tags": tag_dict,
-            "provider": provider
-        }
-    
     # --------------------------------------------
     # RESOLVE & MERGE DEFAULTS 
     # --------------------------------------------
-    rr = ResourceResolver()
-    res = rr.canonicalize_identity(
-        resource=s["type"],
-        provider_hint=s.get("provider", "auto"),
-        logical_name=s.get("name"),
-    )
+    res = _canonicalize(s["type"], s.get("provider", "auto"), s.get("name"))
 
     if isinstance(res, dict) and res.get("mode") == "provider_native_type_unmapped":
-        typer.echo(json.dumps({"error": res.get("message"), "details": res}, indent=2))
+        _emit({"error": res.get("message"), "details": res})
         raise typer.Exit(code=2)
 
     if res and "_resolved" in res:
@@ -701,18 +846,15 @@ def create_vm(
                 
                 # If CLI tags were empty, take defaults
                 if not current_tags:
-                    import copy
                     s["tags"] = copy.deepcopy(default_tags)
                 # If both exist, merge them
                 elif isinstance(current_tags, dict) and isinstance(default_tags, dict):
-                    import copy
                     merged = copy.deepcopy(default_tags)
                     merged.update(current_tags)
                     s["tags"] = merged
             
             # Standard merge for other fields (e.g. ami, instance_type)
             elif k not in s or s[k] is None:
-                import copy
                 s[k] = copy.deepcopy(v)
 
     # --------------------------------------------
@@ -728,11 +870,161 @@ def create_vm(
     if provider != "noop":
         ensure_authenticated_for_resource(provider, "vm")
 
+    return provider
+
+
+def _load_batch_spec(path_str: str) -> List[Dict[str, Any]]:
+    """Read a --batch-spec file: a JSON array of spec objects."""
+    try:
+        arr = jsonx.loads(Path(path_str).read_bytes())
+    except OSError as e:
+        raise typer.BadParameter(f"Cannot read --batch-spec: {e}")
+    except jsonx.JSONDecodeError as e:
+        raise typer.BadParameter(f"Invalid JSON in --batch-spec: {e}")
+    if not isinstance(arr, list) or not all(isinstance(x, dict) for x in arr):
+        raise typer.BadParameter("--batch-spec must contain a JSON array of objects")
+    return arr
+
+
+def _create_vm_batch(
+    path_str: str,
+    db_path: Optional[str],
+    count: int,
+    yes: bool,
+    skip_policy: bool,
+    async_apply: bool = False,
+    offload_db: str = DEFAULT_OFFLOAD_DB,
+) -> None:
+    """
+    create-vm --batch-spec: run every spec through the standard workflow in this
+    process and emit one JSON array. Specs are applied with --yes, planned otherwise;
+    with --async they are planned concurrently and the applies queued in one transaction.
+    """
+    from LCF.autoscaler import fixed_autoscale_cfg
+
+    jobs = []
+    for s in _load_batch_spec(path_str):
+        s.setdefault("type", "vm")
+        provider = _prepare_vm_spec(s, skip_policy)
+        chosen_provider = _default_vm_provider() if provider == "auto" else provider
+        autoscale_cfg = fixed_autoscale_cfg(s.get("count", count))
+        jobs.append((s.get("name", "unnamed"), s, autoscale_cfg, chosen_provider))
+
+    if async_apply:
+        _emit(_plan_and_enqueue_batch(jobs, db_path, offload_db))
+        return
+
+    results = []
+    for name, s, autoscale_cfg, chosen_provider in jobs:
+        # managers are pooled per (db_path, provider), so the batch shares their connections
+        mgr = _mgr("auto", db_path, chosen_provider)
+        results.append(mgr.run_once(name, s, autoscale_cfg,
+                                    observed_metrics={"cpu": 0},
+                                    plan_only=not yes))
+    _emit(results)
+
+
+def _plan_and_enqueue_batch(jobs: List[tuple], db_path: Optional[str], offload_db: str) -> List[Dict[str, Any]]:
+    """Plan every job on a thread pool, then queue one apply_plan task per plan."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from LCF.autoscaler import AutoscalerManager
+
+    # each worker thread gets its own managers (and SQLite connections): run_once's
+    # store transactions must not interleave on one shared handle
+    local = threading.local()
+    opened: List[Any] = []
+    lock = threading.Lock()
+
+    def plan(job):
+        name, s, autoscale_cfg, chosen_provider = job
+        mgrs = getattr(local, "mgrs", None)
+        if mgrs is None:
+            mgrs = local.mgrs = {}
+        mgr = mgrs.get(chosen_provider)
+        if mgr is None:
+            mgr = mgrs[chosen_provider] = AutoscalerManager(db_path=db_path, provider=chosen_provider)
+            with lock:
+                opened.append(mgr)
+        res = mgr.run_once(name, s, autoscale_cfg, observed_metrics={"cpu": 0}, plan_only=True)
+        return chosen_provider, res.get("plan_id")
+
+    if not jobs:
+        return []
+    try:
+        with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as ex:
+            planned = list(ex.map(plan, jobs))
+    finally:
+        for mgr in opened:
+            mgr.store.close()
+
+    tids = _mgr("off", offload_db).enqueue_many(
+        [(provider, "apply_plan", {"plan_path": plan_id}) for provider, plan_id in planned]
+    )
+    return [{"enqueued_task_id": tid, "plan_id": plan_id} for tid, (_, plan_id) in zip(tids, planned)]
+
+
+@app.command("create-vm")
+def create_vm(
+    name: Optional[str] = typer.Argument(None),
+    image: str = typer.Option("ubuntu-22.04"),
+    size: str = typer.Option("small"),
+    region: str = typer.Option("us-east-1"),
+    count: int = typer.Option(1),
+    provider: str = typer.Option("auto"), 
+    db_path: Optional[str] = typer.Option(DEFAULT_DB),
+    yes: bool = typer.Option(False, "--yes", "-y"),
+    async_apply: bool = typer.Option(False, "--async"),
+    offload_db: str = typer.Option(DEFAULT_OFFLOAD_DB),
+
+    # NEW flags
+    tags: str = typer.Option("{}", help="JSON tags"),
+    skip_policy: bool = typer.Option(False, "--skip-policy", help="Bypass governance policy checks"),
+    spec: Optional[str] = typer.Option(None, help="Optional JSON spec file instead of flags"),
+    router_mode: bool = typer.Option(True, "--smart/--standard", help="Use Intelligent Router"),
+    batch_spec: Optional[str] = typer.Option(
+        None, "--batch-spec", help="JSON file with an array of VM specs, provisioned in one process"
+    ),
+):
+    """
+    Create a VM with policy enforcement, intelligent routing (cache), tags, and plan preview.
+    """
+    if batch_spec:
+        _create_vm_batch(batch_spec, db_path, count, yes, skip_policy, async_apply, offload_db)
+        return
+    if not name:
+        raise typer.BadParameter("NAME is required unless --batch-spec is given")
+
+    # --------------------------------------------
+    # Build spec
+    # --------------------------------------------
+    if spec:
+        s = _load_spec(spec)
+    else:
+        try:
+            tag_dict = jsonx.loads(tags)
+        except jsonx.JSONDecodeError:
+            raise typer.BadParameter("Invalid JSON passed to --tags")
+
+        s = {
+            "name": name,
+            "type": "vm",
+            "image": image,
+            "size": size,
+            "region": region,
+            "count": count,
+            "tags": tag_dict,
+            "provider": provider
+        }
+    
+    provider = _prepare_vm_spec(s, skip_policy)
+
     # --------------------------------------------
     # INTELLIGENT ROUTING MODE (Default)
     # --------------------------------------------
     if router_mode and not async_apply:
         typer.secho(" Using Intelligent Router...", fg=typer.colors.MAGENTA)
+        from LCF.intelligent_router import IntelligentRouter
         router = IntelligentRouter()
         
         # This handles L1/L2 Cache hit OR falls back to cold build
@@ -751,7 +1043,7 @@ def create_vm(
         else:
             typer.echo(f" ce ({latency})")
             
-        typer.echo(json.dumps(res, indent=2))
+        _emit(res)
         return
 
     # --------------------------------------------
@@ -760,21 +1052,12 @@ def create_vm(
     typer.echo("Using Standard Provisioning Workflow...")
 
     # Auto provider selection
-    chosen_provider = provider
-    if provider == "auto":
-        if os.environ.get("AWS_ACCESS_KEY_ID") or os.environ.get("AWS_PROFILE"):
-            chosen_provider = "aws"
-        else:
-            chosen_provider = "opentofu"
+    chosen_provider = _default_vm_provider() if provider == "auto" else provider
 
-    autoscale_cfg = {
-        "min": s.get("count", count),
-        "max": s.get("count", count),
-        "policy": [],
-        "cooldown": 60,
-    }
+    from LCF.autoscaler import fixed_autoscale_cfg
+    autoscale_cfg = fixed_autoscale_cfg(s.get("count", count))
 
-    mgr = AutoscalerManager(db_path=db_path, provider=chosen_provider)
+    mgr = _mgr("auto", db_path, chosen_provider)
 
     # Async execution
     if async_apply:
@@ -783,17 +1066,8 @@ def create_vm(
             plan_only=True
         )
 
-        plan_id = None
-        for a in res.get("actions", []):
-            plan_id = a.get("res", {}).get("plan_id") or plan_id
-
-        off = OffloadManager(offload_db)
-        tid = off.enqueue(adapter=chosen_provider, task_type="apply_plan",
-                          payload={"plan_path": plan_id})
-        typer.echo(json.dumps({
-            "enqueued_task_id": tid,
-            "plan_id": plan_id
-        }, indent=2))
+        plan_id = res.get("plan_id")
+        _enqueue(chosen_provider, "apply_plan", {"plan_path": plan_id}, offload_db, plan_id=plan_id)
         return
 
     # Direct apply if confirmed
@@ -802,7 +1076,7 @@ def create_vm(
             observed_metrics={"cpu": 0},
             plan_only=False
         )
-        typer.echo(json.dumps(res, indent=2))
+        _emit(res)
         return
 
     # Plan-only (ask user for confirmation)
@@ -811,7 +1085,7 @@ def create_vm(
         plan_only=True
     )
 
-    typer.echo(json.dumps(res, indent=2))
+    _emit(res)
 
     # Ask for confirmation before apply
     if not click.confirm("Apply this plan?"):
@@ -821,7 +1095,7 @@ def create_vm(
     res = mgr.run_once(name, s, autoscale_cfg,
                        observed_metrics={"cpu": 0},
                        plan_only=False)
-    typer.echo(json.dumps(res, indent=2))
+    _emit(res)
 
 
 # -------------------------------------------------------------
@@ -865,20 +1139,14 @@ def create_resource(
     should_apply = bool(apply and yes)
 
     if async_apply:
-        off = OffloadManager(DEFAULT_OFFLOAD_DB)
-        tid = off.enqueue(
-            adapter=resolved_provider,
-            task_type="pipeline_create",
-            payload={
-                "name": name,
-                "resource_type": resource_type,
-                "provider": resolved_provider,
-                "attributes": attributes,
-                "plan_only": not should_apply,
-                "non_interactive": yes,
-            },
-        )
-        typer.echo(json.dumps({"enqueued_task_id": tid}, indent=2))
+        _enqueue(resolved_provider, "pipeline_create", {
+            "name": name,
+            "resource_type": resource_type,
+            "provider": resolved_provider,
+            "attributes": attributes,
+            "plan_only": not should_apply,
+            "non_interactive": yes,
+        })
         return
 
     result = provisioning_pipeline.execute(
@@ -891,7 +1159,7 @@ def create_resource(
             "non_interactive": yes,
         }
     )
-    typer.echo(json.dumps(result, indent=2))
+    _emit(result)
     if not result.get("success"):
         raise typer.Exit(1)
 
@@ -912,21 +1180,18 @@ def destroy_vm(
     """
 
     if offload:
-        off = OffloadManager(offload_db)
-        tid = (
-            off.enqueue("pulumi", "destroy_stack", {"stack": name})
-            if provider == "pulumi"
-            else off.enqueue("opentofu", "destroy", {"adapter_id": f"opentofu-{name}"})
-        )
-        typer.echo(json.dumps({"enqueued_task_id": tid}))
+        if provider == "pulumi":
+            _enqueue("pulumi", "destroy_stack", {"stack": name}, offload_db)
+        else:
+            _enqueue("opentofu", "destroy", {"adapter_id": f"opentofu-{name}"}, offload_db)
         return
 
     if provider == "pulumi":
-        for line in pulumi_adapter.destroy(name):
-            typer.echo(line)
+        from LCF.cloud_adapters import pulumi_adapter
+        _stream_text(pulumi_adapter.destroy(name))
     else:
-        ta = OpenTofuAdapter(db_path)
-        st = store.SQLiteStore(db_path)
+        ta = _mgr("tofu", db_path)
+        st = _mgr("store", db_path)
         inst = st.get_instance(name)
         target_adapter_id = None
 
@@ -943,7 +1208,7 @@ def destroy_vm(
             target_adapter_id = f"opentofu-{name}"
 
         destroy_res = ta.destroy_instance(target_adapter_id)
-        typer.echo(json.dumps({"destroyed": bool(destroy_res.get("success")), "name": name, "result": destroy_res}))
+        _emit({"destroyed": bool(destroy_res.get("success")), "name": name, "result": destroy_res})
 
 
 # Destroy alias
@@ -977,10 +1242,11 @@ def cli_pulumi_plan(
     """
     Run Pulumi plan/preview.
     """
+    from LCF.cloud_adapters import pulumi_adapter
+
     spec = _load_spec(spec_file)
     typer.secho(f"Planning Pulumi stack '{stack}'...", fg=typer.colors.BLUE)
-    for line in pulumi_adapter.plan(spec, stack):
-        typer.echo(line)
+    _stream_text(pulumi_adapter.plan(spec, stack))
 
 
 @app.command("pulumi-apply")
@@ -993,6 +1259,8 @@ def cli_pulumi_apply(
     """
     Run Pulumi apply/up.
     """
+    from LCF.cloud_adapters import pulumi_adapter
+
     try:
         spec = _load_spec(spec_file)
     except typer.BadParameter:
@@ -1000,14 +1268,11 @@ def cli_pulumi_apply(
         spec = {"name": stack}
 
     if offload:
-        off = OffloadManager(DEFAULT_OFFLOAD_DB)
-        tid = off.enqueue("pulumi", "apply_spec", {"spec": spec, "stack": stack})
-        typer.echo(json.dumps({"enqueued_task_id": tid}))
+        _enqueue("pulumi", "apply_spec", {"spec": spec, "stack": stack})
         return
 
     typer.secho(f"Applying Pulumi stack '{stack}'...", fg=typer.colors.BLUE)
-    for line in pulumi_adapter.apply(spec, stack):
-        typer.echo(line)
+    _stream_text(pulumi_adapter.apply(spec, stack))
 
 
 @app.command("pulumi-destroy")
@@ -1019,18 +1284,17 @@ def cli_pulumi_destroy(
     """
     Run Pulumi destroy.
     """
+    from LCF.cloud_adapters import pulumi_adapter
+
     if offload:
-        off = OffloadManager(DEFAULT_OFFLOAD_DB)
-        tid = off.enqueue("pulumi", "destroy_stack", {"stack": stack})
-        typer.echo(json.dumps({"enqueued_task_id": tid}))
+        _enqueue("pulumi", "destroy_stack", {"stack": stack})
         return
 
     if not yes:
         typer.confirm(f"Are you sure you want to DESTROY Pulumi stack '{stack}'?", abort=True)
 
     typer.secho(f"Destroying Pulumi stack '{stack}'...", fg=typer.colors.RED)
-    for line in pulumi_adapter.destroy(stack):
-        typer.echo(line)
+    _stream_text(pulumi_adapter.destroy(stack))
 
 
 # -------------------------------------------------------------
@@ -1045,18 +1309,19 @@ def cli_tofu_plan(
     Run OpenTofu plan.
     Example: cloudbrew tofu-plan --spec examples/vm.json
     """
+
     spec = _load_spec(spec_file)
     logical_id = _get_logical_id(spec, stack)
     
     typer.secho(f"Planning OpenTofu resource '{logical_id}'...", fg=typer.colors.MAGENTA)
     
-    ta = OpenTofuAdapter()
+    ta = _mgr("tofu")
     res = ta.create_instance(logical_id, spec, plan_only=True)
     
     if isinstance(res, dict) and "diff" in res:
         typer.echo(res["diff"])
     else:
-        typer.echo(json.dumps(res, indent=2))
+        _emit(res)
 
 
 @app.command("tofu-apply")
@@ -1070,13 +1335,12 @@ def cli_tofu_apply(
     Run OpenTofu apply.
     Example: cloudbrew tofu-apply --spec examples/vm.json --yes
     """
+
     spec = _load_spec(spec_file)
     logical_id = _get_logical_id(spec, stack)
 
     if offload:
-        off = OffloadManager(DEFAULT_OFFLOAD_DB)
-        tid = off.enqueue("opentofu", "create_instance", {"name": logical_id, "spec": spec})
-        typer.echo(json.dumps({"enqueued_task_id": tid}))
+        _enqueue("opentofu", "create_instance", {"name": logical_id, "spec": spec})
         return
 
     if not yes:
@@ -1084,7 +1348,7 @@ def cli_tofu_apply(
 
     typer.secho(f"Applying OpenTofu resource '{logical_id}'...", fg=typer.colors.MAGENTA)
     
-    ta = OpenTofuAdapter()
+    ta = _mgr("tofu")
     res = ta.create_instance(logical_id, spec, plan_only=False)
     
     if res.get("success"):
@@ -1093,7 +1357,7 @@ def cli_tofu_apply(
             typer.echo(res["output"])
     else:
         typer.secho(" Failed:", fg=typer.colors.RED)
-        typer.echo(json.dumps(res, indent=2))
+        _emit(res)
         raise typer.Exit(code=1)
 
 
@@ -1109,6 +1373,7 @@ def cli_tofu_destroy(
     Run OpenTofu destroy.
     Example: cloudbrew tofu-destroy --spec examples/vm.json --yes
     """
+
     logical_id = name
     if not logical_id and spec_file:
         try:
@@ -1126,9 +1391,7 @@ def cli_tofu_destroy(
     adapter_id = f"opentofu-{logical_id}"
 
     if offload:
-        off = OffloadManager(DEFAULT_OFFLOAD_DB)
-        tid = off.enqueue("opentofu", "destroy", {"adapter_id": adapter_id})
-        typer.echo(json.dumps({"enqueued_task_id": tid}))
+        _enqueue("opentofu", "destroy", {"adapter_id": adapter_id})
         return
 
     if not yes:
@@ -1136,14 +1399,14 @@ def cli_tofu_destroy(
 
     typer.secho(f"Destroying OpenTofu resource '{adapter_id}'...", fg=typer.colors.RED)
     
-    ta = OpenTofuAdapter()
+    ta = _mgr("tofu")
     try:
         destroy_res = ta.destroy_instance(adapter_id)
         if destroy_res.get("success"):
             typer.secho(" Destroy complete.", fg=typer.colors.GREEN)
         else:
             typer.secho(" Destroy returned failure.", fg=typer.colors.RED)
-            typer.echo(json.dumps(destroy_res, indent=2))
+            _emit(destroy_res)
     except Exception as e:
         typer.secho(f" Destroy failed: {e}", fg=typer.colors.RED)
 
@@ -1160,7 +1423,7 @@ def autoscale_cmd(
     """
     Attach or update autoscaling policies for a target.
     """
-    st = store.SQLiteStore(db_path)
+    st = _mgr("store", db_path)
     instance = st.get_instance(target)
     
     if not instance:
@@ -1188,38 +1451,66 @@ def plan_cmd(
     spec_file: Optional[str] = typer.Option(None, "--spec-file", "-f", "--spec"),
     spec_json: Optional[str] = typer.Option(None, "--spec-json"),
     db_path: Optional[str] = typer.Option(DEFAULT_DB),
+    batch_spec: Optional[str] = typer.Option(
+        None, "--batch-spec", help="JSON file with an array of specs; prints one JSON array of plans"
+    ),
 ):
     """
     Produce a plan for a given provider. Prints JSON summary.
     """
-
-    if spec_file and spec_json:
-        raise typer.BadParameter("Use only one of --spec-file or --spec-json")
+    from LCF.cloud_adapters import pulumi_adapter
+
+
+    if sum(x is not None for x in (spec_file, spec_json, batch_spec)) > 1:
+        raise typer.BadParameter("Use only one of --spec-file, --spec-json or --batch-spec")
+
+    if batch_spec:
+        specs = _load_batch_spec(batch_spec)
+        if provider in ("opentofu", "tofu"):
+            ta = _mgr("tofu", db_path)
+            # one batch call: the workspaces' `tofu init`s run concurrently. Every spec needs its
+            # own workspace, so a name that is already taken gets the spec's index appended.
+            items, used = [], set()
+            for i, s in enumerate(specs):
+                base = logical_id = s.get("name") or "plan-object"
+                n = i
+                while logical_id in used:
+                    logical_id = f"{base}-{n}"
+                    n += 1
+                used.add(logical_id)
+                items.append((logical_id, s))
+            _emit(ta.create_instances(items, plan_only=True))
+        elif provider == "pulumi":
+            from concurrent.futures import ThreadPoolExecutor
+
+            # every pulumi plan runs in its own project dir, so they can run side by side
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(specs)))) as ex:
+                _emit(list(ex.map(lambda s: {"plan_output": list(pulumi_adapter.plan(s, "dev"))}, specs)))
+        else:
+            raise typer.BadParameter(f"Unsupported provider: {provider}")
+        return
 
     if spec_file:
         s = _load_spec(spec_file)
     elif spec_json:
         try:
-            s = json.loads(spec_json)
+            s = jsonx.loads(spec_json)
         except Exception as e:
             raise typer.BadParameter(f"Invalid --spec-json: {e}")
     else:
-        raise typer.BadParameter("Either --spec-file or --spec-json must be provided")
+        raise typer.BadParameter("One of --spec-file, --spec-json or --batch-spec must be provided")
 
     if provider in ("opentofu", "tofu"):
-        ta = OpenTofuAdapter(db_path=db_path)
+        ta = _mgr("tofu", db_path)
         res = ta.create_instance(s.get("name", "plan-object"), s, plan_only=True)
-        typer.echo(json.dumps(res, indent=2))
+        _emit(res)
 
     elif provider == "pulumi":
         gen = pulumi_adapter.plan(s, "dev")
         try:
-            lines = []
-            for ln in gen:
-                lines.append(ln)
-            typer.echo(json.dumps({"plan_output": lines}, indent=2))
+            _emit_lines("plan_output", gen)
         except TypeError:
-            typer.echo(json.dumps(gen, indent=2))
+            _emit(gen)
 
     else:
         raise typer.BadParameter(f"Unsupported provider: {provider}")
@@ -1236,27 +1527,23 @@ def apply_plan_cmd(
     """
     Apply a previously generated plan (OpenTofu or Pulumi).
     """
+    from LCF.cloud_adapters import pulumi_adapter
 
     if async_apply:
-        off = OffloadManager(offload_db)
-        tid = off.enqueue(provider, "apply_plan", {"plan_id": plan_id})
-        typer.echo(json.dumps({"enqueued_task_id": tid, "plan_id": plan_id}, indent=2))
+        _enqueue(provider, "apply_plan", {"plan_id": plan_id}, offload_db, plan_id=plan_id)
         return
 
     if provider in ("opentofu", "tofu"):
-        ta = OpenTofuAdapter()
+        ta = _mgr("tofu")
         res = ta.apply_plan(plan_id)
-        typer.echo(json.dumps(res, indent=2))
+        _emit(res)
 
     elif provider == "pulumi":
         gen = pulumi_adapter.apply(plan_id, "dev")
         try:
-            lines = []
-            for ln in gen:
-                lines.append(ln)
-            typer.echo(json.dumps({"apply_output": lines}, indent=2))
+            _emit_lines("apply_output", gen)
         except TypeError:
-            typer.echo(json.dumps(gen, indent=2))
+            _emit(gen)
 
     else:
         raise typer.BadParameter(f"Unsupported provider: {provider}")
@@ -1268,16 +1555,45 @@ def apply_plan_cmd(
 @offload_app.command("enqueue")
 def offload_enqueue(
     adapter: str = typer.Option("opentofu"),
-    task_type: str = typer.Option(...),
+    task_type: Optional[str] = typer.Option(None),
     payload: str = typer.Option("{}", help="JSON payload"),
+    batch_file: Optional[Path] = typer.Option(
+        None, "--batch-file",
+        help="JSONL file, one task per line: {\"adapter\", \"task_type\", \"payload\"}; queued in one transaction",
+    ),
 ):
     """
-    Enqueue an async task.
+    Enqueue an async task (or a batch of tasks with --batch-file).
     """
-    off = OffloadManager()
-    p = json.loads(payload)
-    tid = off.enqueue(adapter=adapter, task_type=task_type, payload=p)
-    typer.echo(json.dumps({"task_id": tid}))
+    off = _mgr("off")
+    if batch_file is not None:
+        items = []
+        with batch_file.open("rb") as fh:
+            for ln in fh:
+                if not ln.strip():
+                    continue
+                t = jsonx.loads(ln)
+                tt = t.get("task_type") or task_type
+                if not tt:
+                    raise typer.BadParameter(f"task_type missing for batch entry: {ln.decode('utf-8', 'replace').strip()}")
+                p = t.get("payload", {})
+                if not isinstance(p, dict):
+                    raise typer.BadParameter(f"payload must be a JSON object for batch entry: {ln.decode('utf-8', 'replace').strip()}")
+                items.append((t.get("adapter") or adapter, tt, p))
+        _emit({"task_ids": off.enqueue_many(items)})
+        return
+
+    if not task_type:
+        raise typer.BadParameter("--task-type is required")
+    # validated here, but stored as given so the CLI doesn't re-encode it
+    try:
+        parsed = jsonx.loads(payload)
+    except jsonx.JSONDecodeError as e:
+        raise typer.BadParameter(f"Invalid JSON in --payload: {e}")
+    if not isinstance(parsed, dict):
+        raise typer.BadParameter("--payload must be a JSON object")
+    tid = off.enqueue(adapter=adapter, task_type=task_type, payload_json=payload)
+    _emit({"task_id": tid})
 
 
 @offload_app.command("run-worker")
@@ -1289,7 +1605,7 @@ def offload_run_worker(
     """
     Run the async task worker.
     """
-    off = OffloadManager(db_path)
+    off = _mgr("off", db_path)
     typer.secho(f"Starting Offload Worker (DB: {db_path})...", fg=typer.colors.MAGENTA)
     try:
         off.run_worker(poll_interval=poll_interval, concurrency=concurrency)
@@ -1303,17 +1619,41 @@ def offload_run_worker(
 @app.command("status")
 def status_cmd(
     db_path: Optional[str] = typer.Option(DEFAULT_DB, help="Path to SQLite DB (default cloudbrew.db)"),
+    limit: Optional[int] = typer.Option(None, "--limit", min=0, help="Show at most this many instances"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Skip this many instances first"),
 ):
     """
     Display all known instances from the local CloudBrew DB.
     """
-    st = store.SQLiteStore(db_path)
-    instances = st.list_instances()
-    typer.echo(json.dumps({"instances": instances}, indent=2))
+    st = _mgr("store", db_path)
+    _emit_array("instances", st.iter_instances(limit=limit, offset=offset))
 
 
 # -------------------------------------------------------------
 # CLI Entrypoint
 # -------------------------------------------------------------
+def _static_command_names() -> set:
+    names = {g.name for g in app.registered_groups if g.name}
+    for c in app.registered_commands:
+        names.add(c.name or c.callback.__name__.replace("_", "-"))
+    return names
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Console entrypoint. Dynamic resource verbs (`cloudbrew aws_s3_bucket ...`) run as a
+    plain click command, skipping Typer's per-invocation build of every static command;
+    everything else (static commands, --help, no args) goes through the Typer app.
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    if args and not args[0].startswith("-") and args[0] not in _static_command_names():
+        try:
+            return _dynamic_command(args[0]).main(args=args[1:], prog_name=f"cloudbrew {args[0]}")
+        except typer.Exit as e:
+            # newer Typer releases no longer derive Exit from click's
+            sys.exit(e.exit_code)
+    return app(args=args)
+
+
 if __name__ == "__main__":
-    app()
+    main()
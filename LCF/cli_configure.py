@@ -9,10 +9,7 @@ import typing as t
 
 import typer
 
-try:
-    import keyring
-except Exception:
-    keyring = None  # fallback will be used
+from LCF.secret_store import _keyring  # imported lazily; fallback is used when missing
 
 app = typer.Typer(help="CloudBrew interactive init/configure")
 
@@ -29,6 +26,7 @@ def save_config(config: dict):
     os.chmod(CONFIG_PATH, 0o600)
 
 def store_secret(key: str, secret: str):
+    keyring = _keyring()
     if keyring:
         keyring.set_password("cloudbrew", key, secret)
         return {"method": "keyring", "key": key}
@@ -44,7 +42,7 @@ def store_secret(key: str, secret: str):
 def get_secret_meta(key: str):
     # return metadata showing where secret stored
     # not fetching secret value here for security
-    if keyring:
+    if _keyring():
         return {"method": "keyring", "key": key}
     else:
         path = CONFIG_DIR / f"{key}.secret"
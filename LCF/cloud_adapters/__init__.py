@@ -1,7 +1,7 @@
 # LCF/cloud_adapters/__init__.py
 import os
 import logging
-from typing import Any, Dict, Optional, Protocol, Type
+from typing import Any, Callable, Dict, Optional, Protocol, Type
 
 # Configure logging
 logger = logging.getLogger("cloudbrew.adapters")
@@ -16,10 +16,26 @@ class ComputeAdapter(Protocol):
     def apply_plan(self, plan_id: str, **kwargs) -> Dict[str, Any]: ...
 
 _REGISTRY: Dict[str, Type[ComputeAdapter]] = {}
+# optional per-class capabilities, e.g. {"build_hcl": fn(adapter, provider, resource, schema, user_inputs)}
+_CAPS: Dict[type, Dict[str, Callable[..., Any]]] = {}
 
-def register_adapter(provider: str, adapter_cls: Type[ComputeAdapter]) -> None:
-    """Register a new adapter class for a specific provider string."""
+def register_adapter(
+    provider: str,
+    adapter_cls: Type[ComputeAdapter],
+    capabilities: Optional[Dict[str, Callable[..., Any]]] = None,
+) -> None:
+    """Register a new adapter class for a specific provider string (plus any capabilities it offers)."""
     _REGISTRY[provider.lower()] = adapter_cls
+    if capabilities:
+        _CAPS.setdefault(adapter_cls, {}).update(capabilities)
+
+def adapter_capability(adapter: Any, name: str) -> Optional[Callable[..., Any]]:
+    """Capability registered for the adapter's class (or a base class), or None."""
+    for klass in type(adapter).__mro__:
+        fn = _CAPS.get(klass, {}).get(name)
+        if fn is not None:
+            return fn
+    return None
 
 def get_compute_adapter(provider: str = "noop", **kwargs) -> ComputeAdapter:
     
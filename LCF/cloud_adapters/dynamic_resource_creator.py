@@ -1,18 +1,73 @@
 """Schema-driven dynamic resource creation with interactive gap filling."""
 
+import functools
+import inspect
 import logging
+import os
+import shutil
 import tempfile
+import warnings
 from pathlib import Path
+from typing import Optional
+from LCF.cloud_adapters import adapter_capability
 from LCF.cloud_adapters.opentofu_adapter import OpenTofuAdapter
 from LCF.provisioning.validator import ProvisioningValidator
 
 logger = logging.getLogger("cloudbrew.dynamic_resource_creator")
 
+# per user: another user's dir under /dev/shm would not be writable
+SHM_SCRATCH_ROOT = Path(f"/dev/shm/cloudbrew-{os.getuid()}" if hasattr(os, "getuid") else "/dev/shm/cloudbrew")
+DISK_SCRATCH_ROOT = Path(".cloudbrew_providers")
+
+
+def _scratch_root() -> Path:
+    """
+    Parent dir for validate-loop workdirs: CLOUDBREW_SCRATCH_DIR if set, else tmpfs
+    (/dev/shm) when writable so the per-iteration main.tf rewrite stays in memory,
+    else .cloudbrew_providers in the cwd.
+    """
+    env = os.environ.get("CLOUDBREW_SCRATCH_DIR")
+    if env:
+        return Path(env)
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return SHM_SCRATCH_ROOT
+    return DISK_SCRATCH_ROOT
+
+
+def _make_scratch_dir(root: Path, provider: str) -> Path:
+    provider_root = root / provider
+    provider_root.mkdir(parents=True, exist_ok=True, mode=0o700)
+    return Path(tempfile.mkdtemp(prefix="cb_run_", dir=str(provider_root)))
+
+
+@functools.lru_cache(maxsize=256)
+def _positional_arity(fn) -> Optional[int]:
+    """Number of positional parameters `fn` takes; None if unbounded or not introspectable."""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    n = 0
+    for p in params:
+        if p.kind is p.VAR_POSITIONAL:
+            return None
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
+            n += 1
+    return n
+
 
 def _call_flexibly(fn, *args, **kwargs):
+    # cache on the plain function so bound methods don't keep their adapter alive
+    arity = _positional_arity(getattr(fn, "__func__", fn))
+    if arity is not None:
+        if hasattr(fn, "__func__"):
+            arity = max(arity - 1, 0)
+        return fn(*args[:arity], **kwargs)
+
+    # builtins/extension callables without a signature: probe by dropping trailing args
     try:
         return fn(*args, **kwargs)
-    except TypeError as e:
+    except TypeError:
         for n in range(len(args) - 1, -1, -1):
             try:
                 return fn(*args[:n], **kwargs)
@@ -21,45 +76,26 @@ def _call_flexibly(fn, *args, **kwargs):
         raise
 
 def _render_hcl_with_adapter(adapter, provider, resource, schema, user_inputs):
-    if hasattr(adapter, "build_hcl_from_schema"):
-        fn = adapter.build_hcl_from_schema
-        try:
-            return _call_flexibly(fn, provider, resource, schema, user_inputs)
-        except TypeError:
-            try:
-                return _call_flexibly(fn, resource, provider, schema, user_inputs)
-            except TypeError:
-                try:
-                    return _call_flexibly(fn, provider, resource, schema)
-                except TypeError:
-                    pass
-
-    try:
-        from LCF.cloud_adapters.opentofu_adapter import build_hcl_from_schema as top_fn
-    except Exception:
-        top_fn = None
-
-    if top_fn:
-        try:
-            return _call_flexibly(top_fn, provider, resource, schema, user_inputs)
-        except TypeError:
-            try:
-                return _call_flexibly(top_fn, provider, resource, schema)
-            except TypeError:
-                pass
-
-    if hasattr(adapter, "_render_hcl_from_schema"):
+    build = adapter_capability(adapter, "build_hcl")
+    if build is not None:
+        return build(adapter, provider, resource, schema, user_inputs)
+
+    warnings.warn(
+        f"{type(adapter).__name__} has no registered build_hcl capability; "
+        "falling back to renderer discovery",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    fn = getattr(adapter, "build_hcl_from_schema", None)
+    if fn is not None:
+        return _call_flexibly(fn, provider, resource, schema, user_inputs)
+
+    render = getattr(adapter, "_render_hcl_from_schema", None)
+    if render is not None:
         spec = {"provider": provider}
         if isinstance(user_inputs, dict):
-            for k, v in user_inputs.items():
-                spec[k] = v
-        try:
-            return _call_flexibly(adapter._render_hcl_from_schema, resource, resource, spec, schema)
-        except TypeError:
-            try:
-                return _call_flexibly(adapter._render_hcl_from_schema, resource, resource, spec)
-            except TypeError:
-                pass
+            spec.update(user_inputs)
+        return _call_flexibly(render, resource, resource, spec, schema)
 
     raise RuntimeError("Could not find an HCL renderer on OpenTofuAdapter.")
 
@@ -67,81 +103,98 @@ def create_resource_with_validation(provider, resource, schema, args):
     adapter = OpenTofuAdapter()
     validator = ProvisioningValidator(tofu_bin=adapter.tofu_path or "tofu")
     user_inputs = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
+    # required attributes per nested block, read from the schema once rather than per prompt round
+    required_by_block = {
+        blk: [a for a, aspec in (b.get("block") or {}).get("attributes", {}).items() if aspec.get("required")]
+        for blk, b in (schema.get("block") or {}).get("block_types", {}).items()
+    }
+
+    # one scratch dir for the whole loop; the validator rewrites main.tf in it each pass
+    root = _scratch_root()
+    try:
+        tmp = _make_scratch_dir(root, provider)
+    except OSError:
+        if root != SHM_SCRATCH_ROOT:
+            raise
+        # tmpfs dir unusable (e.g. taken by someone else): fall back to disk
+        root = DISK_SCRATCH_ROOT
+        tmp = _make_scratch_dir(root, provider)
 
-    loop = 0
-    while True:
-        loop += 1
-        logger.debug("create_resource_with_validation loop=%s provider=%s resource=%s", loop, provider, resource)
-        hcl = _render_hcl_with_adapter(adapter, provider, resource, schema, user_inputs)
-        logger.debug("generated_hcl_snippet=%s", hcl[:500].replace("\n", "\\n"))
-
-        provider_root = Path(f".cloudbrew_providers/{provider}")
-        provider_root.mkdir(parents=True, exist_ok=True)
-        tmp = Path(tempfile.mkdtemp(prefix="cb_run_", dir=str(provider_root)))
-        (tmp / "main.tf").write_text(hcl, encoding="utf-8")
-        logger.debug("wrote main.tf to %s", (tmp / "main.tf"))
-
-        report = validator.validate(schema=schema, values=user_inputs, rendered_hcl=hcl, workdir=tmp)
-        retryable = [
-            d
-            for d in report.diagnostics
-            if d.rule_id in {
-                "SCHEMA_REQUIRED_ATTRIBUTE_MISSING",
-                "SCHEMA_REQUIRED_BLOCK_MISSING",
-                "SCHEMA_MIN_ITEMS_VIOLATION",
-                "TOFU_REQUIRED_ARGUMENT_MISSING",
-                "TOFU_REQUIRED_BLOCK_MISSING",
-            }
-        ]
-        logger.debug(
-            "validation success=%s retryable=%s",
-            report.success,
-            [d.rule_id + ":" + d.path for d in retryable],
-        )
-
-        if report.success:
-            return {"success": True, "hcl": hcl, "diagnostics": []}
-
-        if not retryable:
-            return {
-                "success": False,
-                "hcl": hcl,
-                "diagnostics": [diag.__dict__ for diag in report.diagnostics],
-                "validation_raw": "\n".join(
-                    f"[{step['command']}]\n{step.get('stdout', '')}\n{step.get('stderr', '')}" for step in report.command_results
-                ).strip(),
-            }
-
-        missing_args = []
-        missing_blocks = []
-        for diag in retryable:
-            if diag.rule_id in {"SCHEMA_REQUIRED_ATTRIBUTE_MISSING", "TOFU_REQUIRED_ARGUMENT_MISSING"}:
-                if diag.path not in missing_args:
-                    missing_args.append(diag.path)
-            elif diag.rule_id in {"SCHEMA_REQUIRED_BLOCK_MISSING", "SCHEMA_MIN_ITEMS_VIOLATION", "TOFU_REQUIRED_BLOCK_MISSING"}:
-                if diag.path not in missing_blocks:
-                    missing_blocks.append(diag.path)
-
-        if getattr(args, "yes", False):
-            return {
-                "success": False,
-                "hcl": hcl,
-                "diagnostics": [diag.__dict__ for diag in report.diagnostics],
-                "error": (
-                    "Missing required inputs in non-interactive mode (--yes). "
-                    "Please provide all required flags explicitly."
-                ),
-                "missing_args": missing_args,
-                "missing_blocks": missing_blocks,
-            }
-
-        logger.debug("interactive mode prompting for missing inputs")
-        for a in missing_args:
-            user_inputs[a] = input(f"Enter value for {a}: ")
-
-        for blk in missing_blocks:
-            user_inputs.setdefault(blk, {})
-            nested = schema.get("block", {}).get("block_types", {}).get(blk, {}).get("block", {}).get("attributes", {})
-            for aname, aspec in nested.items():
-                if aspec.get("required") and aname not in user_inputs[blk]:
-                    user_inputs[blk][aname] = input(f"{blk}.{aname}: ")
+    try:
+        loop = 0
+        while True:
+            loop += 1
+            hcl = _render_hcl_with_adapter(adapter, provider, resource, schema, user_inputs)
+            if debug:
+                logger.debug("create_resource_with_validation loop=%s provider=%s resource=%s", loop, provider, resource)
+                logger.debug("generated_hcl_snippet=%s", hcl[:500].replace("\n", "\\n"))
+
+            report = validator.validate(schema=schema, values=user_inputs, rendered_hcl=hcl, workdir=tmp)
+            retryable = [
+                d
+                for d in report.diagnostics
+                if d.rule_id in {
+                    "SCHEMA_REQUIRED_ATTRIBUTE_MISSING",
+                    "SCHEMA_REQUIRED_BLOCK_MISSING",
+                    "SCHEMA_MIN_ITEMS_VIOLATION",
+                    "TOFU_REQUIRED_ARGUMENT_MISSING",
+                    "TOFU_REQUIRED_BLOCK_MISSING",
+                }
+            ]
+            if debug:
+                logger.debug(
+                    "validation success=%s retryable=%s",
+                    report.success,
+                    [d.rule_id + ":" + d.path for d in retryable],
+                )
+
+            if report.success:
+                return {"success": True, "hcl": hcl, "diagnostics": []}
+
+            if not retryable:
+                return {
+                    "success": False,
+                    "hcl": hcl,
+                    "diagnostics": [diag.__dict__ for diag in report.diagnostics],
+                    "validation_raw": "\n".join(
+                        f"[{step['command']}]\n{step.get('stdout', '')}\n{step.get('stderr', '')}" for step in report.command_results
+                    ).strip(),
+                }
+
+            missing_args = []
+            missing_blocks = []
+            for diag in retryable:
+                if diag.rule_id in {"SCHEMA_REQUIRED_ATTRIBUTE_MISSING", "TOFU_REQUIRED_ARGUMENT_MISSING"}:
+                    if diag.path not in missing_args:
+                        missing_args.append(diag.path)
+                elif diag.rule_id in {"SCHEMA_REQUIRED_BLOCK_MISSING", "SCHEMA_MIN_ITEMS_VIOLATION", "TOFU_REQUIRED_BLOCK_MISSING"}:
+                    if diag.path not in missing_blocks:
+                        missing_blocks.append(diag.path)
+
+            if getattr(args, "yes", False):
+                return {
+                    "success": False,
+                    "hcl": hcl,
+                    "diagnostics": [diag.__dict__ for diag in report.diagnostics],
+                    "error": (
+                        "Missing required inputs in non-interactive mode (--yes). "
+                        "Please provide all required flags explicitly."
+                    ),
+                    "missing_args": missing_args,
+                    "missing_blocks": missing_blocks,
+                }
+
+            logger.debug("interactive mode prompting for missing inputs")
+            for a in missing_args:
+                user_inputs[a] = input(f"Enter value for {a}: ")
+
+            for blk in missing_blocks:
+                user_inputs.setdefault(blk, {})
+                for aname in required_by_block.get(blk, ()):
+                    if aname not in user_inputs[blk]:
+                        user_inputs[blk][aname] = input(f"{blk}.{aname}: ")
+    finally:
+        # tmpfs is memory: don't leave workdirs behind there
+        if root == SHM_SCRATCH_ROOT:
+            shutil.rmtree(tmp, ignore_errors=True)
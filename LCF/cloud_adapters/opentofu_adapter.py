@@ -1,4 +1,6 @@
 # opentofu_adapter.py
+import functools
+import hashlib
 import os
 import re
 import json
@@ -6,10 +8,14 @@ import time
 import shutil
 import subprocess
 import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
-from LCF import store, utils
+from LCF import jsonx, store, utils
+from LCF.cloud_adapters import register_adapter
 from .schema_manager import SchemaManager
 from LCF.auth_utils import _load_config
 from LCF.secret_store import SecretStore
@@ -22,13 +28,404 @@ TOFU_ROOT = os.environ.get("CLOUDBREW_TOFU_ROOT", ".cloudbrew_tofu")
 if os.name == "nt" and "CLOUDBREW_TOFU_ROOT" not in os.environ:
     TOFU_ROOT = r"C:\tmp\.cloudbrew_tofu"
 
+# sha256 of the main.tf that .terraform was last initialized for; unchanged HCL skips `tofu init`
+HCL_HASH_FILE = ".cloudbrew.hcl.sha256"
+
+# lines of stdout/stderr kept per tofu command; earlier output is dropped as it streams
+OUTPUT_TAIL_LINES = 2000
+
+# rendered HCL documents each adapter keeps for repeated identical specs
+HCL_CACHE_SIZE = 256
+
+# precomputed HCL indents; deeper nesting falls back to building the string
+_INDENT = tuple("  " * i for i in range(16))
+
+
+def _indent(depth: int) -> str:
+    return _INDENT[depth] if depth < 16 else "  " * depth
+
+
+# typed=True keeps True/1 and 1/1.0 apart, since they encode differently
+@functools.lru_cache(maxsize=2048, typed=True)
+def _dumps_scalar(value: Any) -> str:
+    return jsonx.dumps(value)
+
+
+def _dumps(value: Any) -> str:
+    """
+    JSON-encode an HCL value (orjson when installed, see LCF.jsonx), memoized for the
+    scalars (regions, sizes, flags) repeated across resources.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return _dumps_scalar(value)
+    return jsonx.dumps(value)
+
+
+_WORKDIR_SAFE = re.compile(r"[^a-zA-Z0-9_-]")
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Compiled templates persisted under TOFU_ROOT/.jinja_cache for later runs; None if not writable."""
+    cache_dir = os.path.join(TOFU_ROOT, ".jinja_cache")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(directory=cache_dir)
+
+
+@functools.lru_cache(maxsize=None)
+def _jinja_env(template_dir: str) -> Optional[Environment]:
+    """
+    One Environment per template dir for the whole process, so compiled templates are
+    shared by every adapter instance. Templates ship with the package: no auto-reload.
+    """
+    try:
+        if not os.path.exists(template_dir):
+            return None
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=_bytecode_cache(),
+        )
+    except Exception as e:
+        logger.error(f"Failed to init Jinja2: {e}")
+        return None
+    # opt-in warm-up for long-lived processes: compile every template now rather than
+    # on first render (short CLI runs skip it; most never touch the Jinja fallback)
+    if os.environ.get("CLOUDBREW_PRECOMPILE_TEMPLATES") == "1":
+        for name in env.list_templates(filter_func=lambda n: n.endswith(".tf.j2")):
+            try:
+                env.get_template(name)
+            except Exception:
+                logger.debug("Template precompile failed for %s", name, exc_info=True)
+    return env
+
+
+@functools.lru_cache(maxsize=None)
+def _template_names(template_dir: str) -> frozenset:
+    env = _jinja_env(template_dir)
+    try:
+        return frozenset(env.list_templates()) if env is not None else frozenset()
+    except Exception:
+        return frozenset()
+
+
+# ---------------------------------------------------------------------------
+# Provider alias tables
+# ---------------------------------------------------------------------------
+# Each transform rewrites friendly/CLI aliases (image, size) in place on a spec copy.
+def _alias_aws(s: Dict[str, Any]) -> None:
+    if "image" in s and "ami" not in s:
+        s["ami"] = s.pop("image")
+    else:
+        s.pop("image", None)
+    if "size" in s and "instance_type" not in s:
+        s["instance_type"] = s.pop("size")
+    else:
+        s.pop("size", None)
+
+
+def _alias_gcp(s: Dict[str, Any]) -> None:
+    if "image" in s and "boot_disk" not in s:
+        s["boot_disk"] = {"initialize_params": {"image": s.pop("image")}}
+    else:
+        s.pop("image", None)
+    if "size" in s and "machine_type" not in s:
+        s["machine_type"] = s.pop("size")
+
+
+def _normalize_gcp(s: Dict[str, Any]) -> None:
+    _alias_gcp(s)
+    s.pop("size", None)
+
+
+def _alias_azure(s: Dict[str, Any]) -> None:
+    # Azure often keeps "size" as-is
+    if "image" in s and "source_image_reference" not in s:
+        s["source_image_reference"] = {"sku": s.pop("image")}
+    else:
+        s.pop("image", None)
+
+
+def _normalize_azure(s: Dict[str, Any]) -> None:
+    if "image" in s and "source_image_reference" not in s:
+        s["source_image_reference"] = {"publisher": "", "offer": "", "sku": s.pop("image")}
+    else:
+        s.pop("image", None)
+
+
+def _parse_tags(s: Dict[str, Any]) -> None:
+    # Normalize tags if provided as JSON string
+    if isinstance(s.get("tags"), str):
+        try:
+            s["tags"] = json.loads(s["tags"])
+        except Exception:
+            pass
+
+
+def _normalize_aws(s: Dict[str, Any]) -> None:
+    _alias_aws(s)
+    _parse_tags(s)
+
+
+def _noop(s: Dict[str, Any]) -> None:
+    return None
+
+
+def _provider_key(provider: Optional[str]) -> str:
+    """'hashicorp/aws', 'aws_instance' and 'AWS' all key as 'aws'."""
+    return (provider or "").split("/")[-1].split("_")[0].lower()
+
+
+# ---------------------------------------------------------------------------
+# Provider headers
+# ---------------------------------------------------------------------------
+_AWS_HEADER = """
+terraform {{
+  required_providers {{
+    aws = {{
+      source  = "hashicorp/aws"
+      version = ">= 5.0"
+    }}
+  }}
+}}
+
+provider "aws" {{
+  region = "{region}"
+}}
+"""
+
+_AZURE_HEADER = """
+terraform {{
+  required_providers {{
+    azurerm = {{
+      source  = "hashicorp/azurerm"
+      version = "~> 3.0"
+    }}
+  }}
+}}
+
+provider "azurerm" {{
+  features {{}}
+}}
+"""
+
+_GOOGLE_HEADER = """
+terraform {{
+  required_providers {{
+    google = {{
+      source = "hashicorp/google"
+      version = ">= 4.0"
+    }}
+  }}
+}}
+
+provider "google" {{
+  region = "{region}"
+}}
+"""
+
+# provider -> (header template, region env var, default region)
+_PROVIDER_HEADERS = {
+    "aws": (_AWS_HEADER, "AWS_REGION", "us-east-1"),
+    "amazon": (_AWS_HEADER, "AWS_REGION", "us-east-1"),
+    "azure": (_AZURE_HEADER, None, None),
+    "azurerm": (_AZURE_HEADER, None, None),
+    "google": (_GOOGLE_HEADER, "GOOGLE_REGION", "us-central1"),
+    "gcp": (_GOOGLE_HEADER, "GOOGLE_REGION", "us-central1"),
+    "hashicorp/google": (_GOOGLE_HEADER, "GOOGLE_REGION", "us-central1"),
+}
+
+
+def _header_region(provider: str, spec: Dict[str, Any]) -> Optional[str]:
+    entry = _PROVIDER_HEADERS.get(provider)
+    if entry is None or entry[1] is None:
+        return None
+    return spec.get("region") or os.environ.get(entry[1]) or entry[2]
+
+
+@functools.lru_cache(maxsize=64)
+def _provider_header(provider: str, region: Optional[str]) -> str:
+    """terraform/provider preamble for provider ("" when there is none)."""
+    entry = _PROVIDER_HEADERS.get(provider)
+    return entry[0].format(region=region) if entry else ""
+
+
+# ---------------------------------------------------------------------------
+# Minimal HCL from required schema arguments
+# ---------------------------------------------------------------------------
+_DEFAULT_BY_TYPE = {"string": '"AUTO"', "number": "0", "bool": "false"}
+_DEFAULT_BY_COLLECTION = {"list": "[]", "map": "{}"}
+
+
+def _default_value_for_type(t: Any) -> str:
+    """HCL placeholder for a required attribute of schema type t."""
+    if isinstance(t, list):
+        return _DEFAULT_BY_COLLECTION.get(t[0], '"AUTO"') if t and isinstance(t[0], str) else '"AUTO"'
+    return _DEFAULT_BY_TYPE.get(t, '"AUTO"') if isinstance(t, str) else '"AUTO"'
+
+
+def _build_hcl_from_schema(provider: str, resource: str, schema: dict, user_inputs: Optional[dict] = None) -> str:
+    """
+    Generate a minimal valid HCL resource using only required arguments.
+    """
+    user_inputs = user_inputs or {}
+
+    # Accept both raw provider schema and normalized schema-manager format.
+    block = schema.get("block", {}) if isinstance(schema, dict) else {}
+    if block:
+        attrs = block.get("attributes", {})
+        blocks = block.get("block_types", {})
+        raw_shape = True
+    else:
+        attrs = schema.get("attributes", {}) if isinstance(schema, dict) else {}
+        blocks = schema.get("blocks", {}) if isinstance(schema, dict) else {}
+        raw_shape = False
+
+    lines = [f'resource "{resource}" "{provider}" {{']
+
+    # Required attributes
+    for name, spec in attrs.items():
+        required = spec.get("required") if isinstance(spec, dict) else False
+        if required:
+            if name in user_inputs:
+                lines.append(f'  {name} = {user_inputs[name]}')
+            else:
+                attr_type = spec.get("type") if isinstance(spec, dict) else None
+                val = _default_value_for_type(attr_type)
+                lines.append(f'  {name} = {val}')
+
+    # Required nested blocks
+    for blk, blk_spec in blocks.items():
+        min_items = blk_spec.get("min_items", 0) if isinstance(blk_spec, dict) else 0
+        if (min_items or 0) > 0:
+            lines.append(f'  {blk} {{')
+            nested = (
+                blk_spec.get("block", {}).get("attributes", {})
+                if raw_shape
+                else blk_spec.get("schema", {}).get("attributes", {})
+            )
+            for aname, aspec in nested.items():
+                if aspec.get("required"):
+                    if blk in user_inputs and aname in user_inputs[blk]:
+                        lines.append(f'    {aname} = {user_inputs[blk][aname]}')
+                    else:
+                        val = _default_value_for_type(aspec.get("type"))
+                        lines.append(f'    {aname} = {val}')
+            lines.append("  }")
+
+    lines.append("}")
+    return "\n".join(lines)
+
+
+# provider family -> cloud whose CloudBrew credentials it needs
+_CRED_FAMILIES = {
+    "aws": "aws", "amazon": "aws",
+    "google": "gcp", "google-beta": "gcp", "gcp": "gcp",
+    "azure": "azure", "azurerm": "azure",
+}
+# a cloud whose env vars are all set is already authenticated
+_CRED_ENV = {
+    "aws": ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"),
+    "gcp": ("GOOGLE_APPLICATION_CREDENTIALS",),
+    "azure": ("ARM_CLIENT_ID", "ARM_CLIENT_SECRET"),
+}
+
+# used for IR rendering (_alias_and_defaults)
+_PROVIDER_ALIASES = {
+    "aws": _alias_aws, "amazon": _alias_aws,
+    "google": _alias_gcp, "google-beta": _alias_gcp, "gcp": _alias_gcp,
+    "azure": _alias_azure, "azurerm": _alias_azure,
+}
+# used for template rendering (_normalize_spec_for_provider)
+_PROVIDER_NORMALIZERS = {
+    "aws": _normalize_aws, "amazon": _normalize_aws,
+    "google": _normalize_gcp, "google-beta": _normalize_gcp, "gcp": _normalize_gcp,
+    "azure": _normalize_azure, "azurerm": _normalize_azure,
+}
+
+
+def _drain(stream: Any, tail: deque, label: str) -> None:
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for line in stream:
+        tail.append(line)
+        if debug:
+            logger.debug("%s | %s", label, line.rstrip("\n"))
+    stream.close()
+
+
+def _run_capped(
+    cmd: List[str],
+    cwd: str,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    tail_lines: int = OUTPUT_TAIL_LINES,
+) -> subprocess.CompletedProcess:
+    """
+    Like subprocess.run(cmd, capture_output=True, text=True), but both streams are drained
+    line by line into bounded deques, so a huge plan keeps only its last tail_lines in memory.
+    On timeout the process is killed and subprocess.TimeoutExpired raised, as run() does.
+    """
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        # a stray non-UTF-8 byte must not kill a reader thread and leave the pipe unread
+        encoding="utf-8", errors="replace", bufsize=1,
+    )
+    out: deque = deque(maxlen=tail_lines)
+    err: deque = deque(maxlen=tail_lines)
+    label = " ".join(cmd[:2])
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, out, label), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, err, label), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+    try:
+        rc = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        # provider plugins spawned by tofu may still hold the pipes open
+        for t in readers:
+            t.join(5)
+        raise
+    for t in readers:
+        t.join()
+    return subprocess.CompletedProcess(cmd, rc, "".join(out), "".join(err))
+
+
+@functools.lru_cache(maxsize=None)
+def _secret_store() -> SecretStore:
+    """One SecretStore for every credential lookup in the process."""
+    return SecretStore()
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_manager(work_dir: str, tofu_bin: Optional[str]) -> SchemaManager:
+    """
+    SchemaManager loads (or fetches) every provider schema up front, so it is built once per
+    workdir/binary and shared by all adapter instances; lookups are plain dict reads after that.
+    Failures are not cached and are retried by the next adapter.
+    """
+    return SchemaManager(work_dir=work_dir, tofu_bin=tofu_bin)
+
 
 class OpenTofuAdapter:
     def __init__(self, db_path: Optional[str] = None):
         self.store = store.SQLiteStore(db_path)
-        self.tofu_path = self._find_binary()
+        # tofu settings go into os.environ once; every command inherits them instead of copying the env
+        utils.export_tofu_env()
         try:
-            self.schema_mgr = SchemaManager(work_dir=TOFU_ROOT, tofu_bin=self.tofu_path)
+            self.schema_mgr = _schema_manager(TOFU_ROOT, self.tofu_path)
         except Exception as e:
             logger.warning("Schema manager init failed; continuing without schema cache: %s", e)
             self.schema_mgr = type("FallbackSchemaMgr", (), {"get": lambda self, *_args, **_kwargs: {}})()
@@ -39,28 +436,42 @@ class OpenTofuAdapter:
         except Exception:
             logger.debug("GC on init failed or skipped.")
 
-        try:
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            template_dir = os.path.join(base_dir, "templates")
-
-            if os.path.exists(template_dir):
-                self.jinja_env = Environment(
-                    loader=FileSystemLoader(template_dir),
-                    autoescape=select_autoescape(),
-                    trim_blocks=True,
-                    lstrip_blocks=True,
-                )
-            else:
-                self.jinja_env = None
-        except Exception as e:
-            logger.error(f"Failed to init Jinja2: {e}")
-            self.jinja_env = None
-
-        # Load CloudBrew credentials for provider authentication
-        self._setup_cloudbrew_credentials()
+        self.jinja_env = _jinja_env(TEMPLATE_DIR)
+        # templates ship with the package, so the name set is built once per process
+        self._template_names = _template_names(TEMPLATE_DIR)
+
+        # CloudBrew credentials are exported per cloud on first use (see _ensure_creds)
+        self._creds_loaded: set = set()
+        # one export per cloud even when several threads share this adapter
+        self._creds_lock = threading.Lock()
+        # workdirs known to hold an initialized .terraform, so repeat calls skip the probe
+        self._initialized_wds: set = set()
+        # workdirs whose current HCL already passed `tofu validate`
+        self._validated_wds: set = set()
         self.ir_renderer = HCLIRRenderer()
+        # rendered HCL by _hcl_cache_key, least recently used first
+        self._hcl_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._hcl_cache_lock = threading.Lock()
 
-    def _setup_cloudbrew_credentials(self):
+    def _ensure_creds(self, provider: Optional[str] = None) -> None:
+        """
+        Export CloudBrew-configured credentials for provider's cloud (every cloud when None)
+        the first time it is needed. Clouds already authenticated via env vars are skipped,
+        so the config file and keyring are only touched for the cloud actually in use.
+        """
+        families = (_CRED_FAMILIES.get(_provider_key(provider)),) if provider else tuple(_CRED_ENV)
+        if all(f in self._creds_loaded for f in families if f):
+            return
+        with self._creds_lock:
+            pending = [f for f in families if f and f not in self._creds_loaded]
+            missing = [f for f in pending if not all(os.environ.get(var) for var in _CRED_ENV[f])]
+            if missing:
+                self._setup_cloudbrew_credentials(missing)
+            # marked only once exported, so a concurrent caller waits on the lock instead of
+            # running tofu without credentials
+            self._creds_loaded.update(pending)
+
+    def _setup_cloudbrew_credentials(self, providers=("aws", "gcp", "azure")):
         """Set up environment variables with CloudBrew credentials for provider authentication."""
         try:
             config = _load_config()
@@ -71,7 +482,7 @@ class OpenTofuAdapter:
             creds = config.get("creds", {})
             
             # Set up AWS credentials if available
-            if creds.get("aws"):
+            if "aws" in providers and creds.get("aws"):
                 aws_creds = creds["aws"]
                 access_key = aws_creds.get("access_key_id")
                 
@@ -80,8 +491,7 @@ class OpenTofuAdapter:
                     os.environ["AWS_ACCESS_KEY_ID"] = access_key
                     
                     # Retrieve secret key from secure storage
-                    secret_store = SecretStore()
-                    secret_key = secret_store.retrieve_secret("aws_secret_key")
+                    secret_key = _secret_store().retrieve_secret("aws_secret_key")
                     if secret_key:
                         os.environ["AWS_SECRET_ACCESS_KEY"] = secret_key
                     
@@ -93,7 +503,7 @@ class OpenTofuAdapter:
                     logger.info("AWS credentials loaded from CloudBrew config")
             
             # Set up GCP credentials if available
-            if creds.get("gcp"):
+            if "gcp" in providers and creds.get("gcp"):
                 gcp_creds = creds["gcp"]
                 sa_path = gcp_creds.get("service_account_path")
                 
@@ -102,7 +512,7 @@ class OpenTofuAdapter:
                     logger.info("GCP credentials loaded from CloudBrew config")
             
             # Set up Azure credentials if available
-            if creds.get("azure"):
+            if "azure" in providers and creds.get("azure"):
                 azure_creds = creds["azure"]
                 tenant_id = azure_creds.get("tenant_id")
                 client_id = azure_creds.get("client_id")
@@ -112,8 +522,7 @@ class OpenTofuAdapter:
                     os.environ["ARM_CLIENT_ID"] = client_id
                     
                     # Retrieve client secret from secure storage
-                    secret_store = SecretStore()
-                    client_secret = secret_store.retrieve_secret("azure_client_secret")
+                    client_secret = _secret_store().retrieve_secret("azure_client_secret")
                     if client_secret:
                         os.environ["ARM_CLIENT_SECRET"] = client_secret
                     
@@ -127,36 +536,43 @@ class OpenTofuAdapter:
         except Exception as e:
             logger.error(f"Failed to load CloudBrew credentials: {e}")
 
+    @functools.cached_property
+    def tofu_path(self) -> str:
+        return self._find_binary()
+
     def _find_binary(self) -> str:
-        path = (
-            os.environ.get("CLOUDBREW_OPENTOFU_BIN")
-            or shutil.which("tofu")
-            or shutil.which("opentofu")
-        )
-        return path or ""
+        return utils.tofu_bin()
 
     def _workdir_for(self, logical_id: str) -> str:
-        safe_name = re.sub(r"[^a-zA-Z0-9_-]", "-", logical_id)
+        safe_name = _WORKDIR_SAFE.sub("-", logical_id)
         path = os.path.join(TOFU_ROOT, safe_name)
         os.makedirs(path, exist_ok=True)
         return path
 
     def _cleanup(self, workdir: str) -> None:
-        for file in ["plan.tfplan", "spec.json"]:
+        """
+        Drop per-run artifacts after an apply. .terraform/ (the provider download that makes
+        init expensive), the lock file and the state stay so the next run can skip init;
+        CLOUDBREW_FULL_CLEAN=1 also removes .terraform/ to reclaim disk (state is always kept).
+        """
+        for file in ["plan.tfplan", "spec.json", "crash.log"]:
             try:
                 os.remove(os.path.join(workdir, file))
             except OSError:
                 pass
+        if os.environ.get("CLOUDBREW_FULL_CLEAN") == "1":
+            shutil.rmtree(os.path.join(workdir, ".terraform"), ignore_errors=True)
+            self._initialized_wds.discard(workdir)
+            self._validated_wds.discard(workdir)
+            try:
+                os.remove(os.path.join(workdir, HCL_HASH_FILE))
+            except OSError:
+                pass
 
     def _ensure_azure_cli(self, provider: str) -> str:
         # Placeholder — kept for compatibility with other code paths.
         return ""
 
-    def _get_env(self) -> Dict[str, str]:
-        env = os.environ.copy()
-        env["TF_IN_AUTOMATION"] = "1"
-        return env
-
     # -------------------------
     # HCL Rendering Helpers
     # -------------------------
@@ -165,63 +581,73 @@ class OpenTofuAdapter:
         Render a single field/key using a Python-driven renderer.
         Uses schema.get('block_types') for nested blocks (correct OpenTofu schema key).
         """
-        indent = "  " * depth
+        buf: List[str] = []
+        self._write_hcl_field(buf, key, value, schema, depth)
+        if buf:
+            buf.pop()  # trailing newline of the last line
+        return "".join(buf)
+
+    def _render_block_body(self, key: str, value: Any, depth: int) -> str:
+        buf: List[str] = []
+        self._write_block_body(buf, key, value, depth)
+        buf.pop()
+        return "".join(buf)
+
+    # The writers below append newline-terminated lines to one buffer that is joined once by
+    # the caller, instead of joining a list at every nesting level.
+    def _write_hcl_field(self, buf: List[str], key: str, value: Any, schema: Optional[Dict[str, Any]], depth: int) -> None:
         blocks = schema.get("block_types", {}) if schema else {}
 
         # Special handling for AWS S3 bucket versioning (common case)
         if key == "versioning" and isinstance(value, dict):
             # AWS S3 bucket versioning should be rendered as a block, not an attribute
-            return self._render_block_body("versioning", value, depth)
-
-        # Special handling for GCP nested blocks when schema is unavailable
-        if key in ("boot_disk", "network_interface"):
-            if isinstance(value, list):
-                return "\n".join([self._render_block_body(key, item, depth) for item in value])
-            if isinstance(value, dict):
-                return self._render_block_body(key, value, depth)
+            self._write_block_body(buf, "versioning", value, depth)
+            return
 
-        if key in blocks:
-            # nested block type
-            if isinstance(value, list):
-                return "\n".join([self._render_block_body(key, item, depth) for item in value])
-            return self._render_block_body(key, value, depth)
+        # Special handling for GCP nested blocks when schema is unavailable (dicts/lists only),
+        # plus nested block types from the schema
+        if (key in ("boot_disk", "network_interface") and isinstance(value, (list, dict))) or key in blocks:
+            for item in value if isinstance(value, list) else (value,):
+                self._write_block_body(buf, key, item, depth)
+            return
 
+        indent = _indent(depth)
         if isinstance(value, dict):
-            lines = [f'{indent}{key} = {{']
+            # keys go through str() like the f-strings did: YAML specs can have int keys
+            buf += (indent, str(key), " = {\n")
             for sub_k, sub_v in value.items():
                 # use JSON dump to correctly quote/escape
-                lines.append(f'{indent}  "{sub_k}" = {json.dumps(sub_v)}')
-            lines.append(f'{indent}}}')
-            return "\n".join(lines)
-        return f'{indent}{key} = {json.dumps(value)}'
-
-    def _render_block_body(self, key: str, value: Any, depth: int) -> str:
-        indent = "  " * depth
-        lines = [f"{indent}{key} {{"]
+                buf += (indent, '  "', str(sub_k), '" = ', _dumps(sub_v), "\n")
+            buf += (indent, "}", "\n")
+            return
+        buf += (indent, str(key), " = ", _dumps(value), "\n")
+
+    def _write_block_body(self, buf: List[str], key: str, value: Any, depth: int) -> None:
+        indent = _indent(depth)
+        buf += (indent, str(key), " {\n")
         if isinstance(value, dict):
             for k, v in value.items():
                 if isinstance(v, dict):
                     if key == "boot_disk" and k == "initialize_params":
-                        lines.append(f'{indent}  {k} {{')
+                        buf += (indent, "  ", str(k), " {\n")
                         for sk, sv in v.items():
-                            lines.append(f'{indent}    {sk} = {json.dumps(sv)}')
-                        lines.append(f'{indent}  }}')
+                            buf += (indent, "    ", str(sk), " = ", _dumps(sv), "\n")
+                        buf += (indent, "  }\n")
                         continue
-                    lines.append(f'{indent}  {k} = {{')
+                    buf += (indent, "  ", str(k), " = {\n")
                     for sk, sv in v.items():
-                        lines.append(f'{indent}    "{sk}" = {json.dumps(sv)}')
-                    lines.append(f'{indent}  }}')
+                        buf += (indent, '    "', str(sk), '" = ', _dumps(sv), "\n")
+                    buf += (indent, "  }\n")
                 else:
-                    lines.append(f'{indent}  {k} = {json.dumps(v)}')
+                    buf += (indent, "  ", str(k), " = ", _dumps(v), "\n")
         elif isinstance(value, list):
             # list of primitives or dicts
             for item in value:
                 if isinstance(item, dict):
-                    lines.append(self._render_block_body(key, item, depth + 1))
+                    self._write_block_body(buf, key, item, depth + 1)
                 else:
-                    lines.append(f'{indent}  {json.dumps(item)}')
-        lines.append(f"{indent}}}")
-        return "\n".join(lines)
+                    buf += (indent, "  ", _dumps(item), "\n")
+        buf += (indent, "}", "\n")
 
     def _alias_and_defaults(self, spec: Dict[str, Any], resource_type: str, provider: str) -> Dict[str, Any]:
         """
@@ -234,43 +660,8 @@ class OpenTofuAdapter:
                 continue
             s.pop(forbidden, None)
 
-        p = (provider or "").lower()
-
-        # ---------- AWS ----------
-        if p.startswith("aws") or p.startswith("amazon"):
-            if "image" in s and "ami" not in s:
-                s["ami"] = s.pop("image")
-            else:
-                s.pop("image", None)
-            if "size" in s and "instance_type" not in s:
-                s["instance_type"] = s.pop("size")
-            else:
-                s.pop("size", None)
-
-        # ---------- GOOGLE ----------
-        elif p.startswith("google") or p.startswith("gcp"):
-            if "image" in s and "boot_disk" not in s:
-                s["boot_disk"] = {"initialize_params": {"image": s.pop("image")}}
-            else:
-                s.pop("image", None)
-            if "size" in s and "machine_type" not in s:
-                s["machine_type"] = s.pop("size")
-
-        # ---------- AZURE ----------
-        elif p.startswith("azurerm") or p.startswith("azure"):
-            if "image" in s and "source_image_reference" not in s:
-                s["source_image_reference"] = {"sku": s.pop("image")}
-            else:
-                s.pop("image", None)
-            # Azure often keeps "size" as-is
-
-        # Normalize tags if provided as JSON string
-        if isinstance(s.get("tags"), str):
-            try:
-                s["tags"] = json.loads(s["tags"])
-            except Exception:
-                pass
-
+        _PROVIDER_ALIASES.get(_provider_key(provider), _noop)(s)
+        _parse_tags(s)
         return s
 
     # -------------------------
@@ -288,114 +679,12 @@ class OpenTofuAdapter:
         for forbidden in ("name", "_resolver_meta", "_provider_hint"):
             s.pop(forbidden, None)
 
-        p = (provider or "").lower()
-
-        # Generic mapping common across clouds
-        if p in ("aws", "amazon", "hashicorp/aws", "aws_instance"):
-            # image -> ami
-            if "ami" not in s:
-                if "image" in s:
-                    s["ami"] = s.pop("image")
-            else:
-                s.pop("image", None)
-
-            # size -> instance_type
-            if "instance_type" not in s:
-                if "size" in s:
-                    s["instance_type"] = s.pop("size")
-            else:
-                s.pop("size", None)
-
-            if isinstance(s.get("tags"), str):
-                try:
-                    s["tags"] = json.loads(s["tags"])
-                except Exception:
-                    pass
-
-        elif p in ("gcp", "google", "hashicorp/google", "google_compute_instance"):
-            if "image" in s and "boot_disk" not in s:
-                s["boot_disk"] = {"initialize_params": {"image": s.pop("image")}}
-            else:
-                s.pop("image", None)
-            if "size" in s and "machine_type" not in s:
-                s["machine_type"] = s.pop("size")
-            else:
-                s.pop("size", None)
-
-        elif p in ("azure", "azurerm", "hashicorp/azurerm", "azurerm_linux_virtual_machine"):
-            if "image" in s and "source_image_reference" not in s:
-                s["source_image_reference"] = {"publisher": "", "offer": "", "sku": s.pop("image")}
-            else:
-                s.pop("image", None)
-
+        _PROVIDER_NORMALIZERS.get(_provider_key(provider), _noop)(s)
         return s
 
-    @staticmethod
-    def default_value_for_type(t):
-        if isinstance(t, list) and t and t[0] == "list":
-            return "[]"
-        if isinstance(t, list) and t and t[0] == "map":
-            return "{}"
-        if t == "string":
-            return '"AUTO"'
-        if t == "number":
-            return "0"
-        if t == "bool":
-            return "false"
-        return '"AUTO"'
-
-    @staticmethod
-    def build_hcl_from_schema(provider: str, resource: str, schema: dict, user_inputs: dict=None):
-        """
-        Generate a minimal valid HCL resource using only required arguments.
-        """
-        user_inputs = user_inputs or {}
-
-        # Accept both raw provider schema and normalized schema-manager format.
-        block = schema.get("block", {}) if isinstance(schema, dict) else {}
-        if block:
-            attrs = block.get("attributes", {})
-            blocks = block.get("block_types", {})
-            raw_shape = True
-        else:
-            attrs = schema.get("attributes", {}) if isinstance(schema, dict) else {}
-            blocks = schema.get("blocks", {}) if isinstance(schema, dict) else {}
-            raw_shape = False
-
-        lines = [f'resource "{resource}" "{provider}" {{']
-
-        # Required attributes
-        for name, spec in attrs.items():
-            required = spec.get("required") if isinstance(spec, dict) else False
-            if required:
-                if name in user_inputs:
-                    lines.append(f'  {name} = {user_inputs[name]}')
-                else:
-                    attr_type = spec.get("type") if isinstance(spec, dict) else None
-                    val = OpenTofuAdapter.default_value_for_type(attr_type)
-                    lines.append(f'  {name} = {val}')
-
-        # Required nested blocks
-        for blk, blk_spec in blocks.items():
-            min_items = blk_spec.get("min_items", 0) if isinstance(blk_spec, dict) else 0
-            if (min_items or 0) > 0:
-                lines.append(f'  {blk} {{')
-                nested = (
-                    blk_spec.get("block", {}).get("attributes", {})
-                    if raw_shape
-                    else blk_spec.get("schema", {}).get("attributes", {})
-                )
-                for aname, aspec in nested.items():
-                    if aspec.get("required"):
-                        if blk in user_inputs and aname in user_inputs[blk]:
-                            lines.append(f'    {aname} = {user_inputs[blk][aname]}')
-                        else:
-                            val = OpenTofuAdapter.default_value_for_type(aspec.get("type"))
-                            lines.append(f'    {aname} = {val}')
-                lines.append("  }")
-
-        lines.append("}")
-        return "\n".join(lines)
+    # kept as class attributes for callers that reach them through the adapter
+    default_value_for_type = staticmethod(_default_value_for_type)
+    build_hcl_from_schema = staticmethod(_build_hcl_from_schema)
 
     # -------------------------
     # Schema-driven renderer
@@ -423,7 +712,40 @@ class OpenTofuAdapter:
     def _generate_hcl(self, logical_id: str, spec: Dict[str, Any]) -> str:
         if "_hcl_override" in spec:
             return spec["_hcl_override"]
-        
+
+        key = self._hcl_cache_key(logical_id, spec)
+        if key is None:
+            return self._render_hcl(logical_id, spec)
+        # The autoscaler and batch runner render on several threads through one adapter.
+        with self._hcl_cache_lock:
+            hcl = self._hcl_cache.get(key)
+            if hcl is not None:
+                self._hcl_cache.move_to_end(key)
+                return hcl
+        hcl = self._render_hcl(logical_id, spec)
+        with self._hcl_cache_lock:
+            self._hcl_cache[key] = hcl
+            while len(self._hcl_cache) > HCL_CACHE_SIZE:
+                self._hcl_cache.popitem(last=False)
+        return hcl
+
+    @staticmethod
+    def _hcl_cache_key(logical_id: str, spec: Dict[str, Any]) -> Optional[tuple]:
+        """Everything _render_hcl reads: the spec, the label and the region fallbacks; None if not plain JSON."""
+        try:
+            canonical = json.dumps(spec, sort_keys=True).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+        return (
+            logical_id,
+            spec.get("type"),
+            spec.get("provider"),
+            hashlib.blake2b(canonical, digest_size=16).digest(),
+            os.environ.get("AWS_REGION"),
+            os.environ.get("GOOGLE_REGION"),
+        )
+
+    def _render_hcl(self, logical_id: str, spec: Dict[str, Any]) -> str:
         resource_type = spec.get("type", "null_resource")
         provider = spec.get("provider", "aws").lower()
 
@@ -437,55 +759,8 @@ class OpenTofuAdapter:
         except Exception:
             schema = None
 
-        # Generate provider header for common providers
-        header = ""
-        if provider in ("aws", "amazon"):
-            region = spec_for_render.get("region") or os.environ.get("AWS_REGION") or "us-east-1"
-            header = f"""
-terraform {{
-  required_providers {{
-    aws = {{
-      source  = "hashicorp/aws"
-      version = ">= 5.0"
-    }}
-  }}
-}}
-
-provider "aws" {{
-  region = "{region}"
-}}
-"""
-        elif provider in ("azure", "azurerm"):
-            header = """
-terraform {
-  required_providers {
-    azurerm = {
-      source  = "hashicorp/azurerm"
-      version = "~> 3.0"
-    }
-  }
-}
-
-provider "azurerm" {
-  features {}
-}
-"""
-        elif provider in ("google", "gcp", "hashicorp/google"):
-            region = spec_for_render.get("region") or os.environ.get("GOOGLE_REGION", "us-central1")
-            header = f"""
-terraform {{
-  required_providers {{
-    google = {{
-      source = "hashicorp/google"
-      version = ">= 4.0"
-    }}
-  }}
-}}
-
-provider "google" {{
-  region = "{region}"
-}}
-"""
+        # Provider header for common providers; one cached string per (provider, region)
+        header = _provider_header(provider, _header_region(provider, spec_for_render))
 
         # Provider/resource-specific gentle fixes (example)
         clean_spec = {k: v for k, v in spec_for_render.items() if not k.startswith("_") and k not in {"type", "provider", "region"}}
@@ -529,10 +804,7 @@ provider "google" {{
         if not self.jinja_env:
             return None
         expected = f"{resource_type}.tf.j2"
-        try:
-            return expected if expected in self.jinja_env.list_templates() else None
-        except Exception:
-            return None
+        return expected if expected in self._template_names else None
 
     def _render_jinja_template(self, template_name: str, logical_id: str, spec: Dict[str, Any], resource_type: str, schema: Any = None) -> str:
         if not self.jinja_env:
@@ -545,9 +817,7 @@ provider "google" {{
                 resource_type,
             )
 
-        clean_name = re.sub(r"[^A-Za-z0-9_]", "_", logical_id.replace(" ", "_"))
-        if clean_name and clean_name[0].isdigit():
-            clean_name = f"res_{clean_name}"
+        clean_name = HCLIRRenderer._sanitize_name(logical_id)
 
         def python_renderer(k, v):
             return self._render_hcl_field_python(k, v, schema)
@@ -574,21 +844,23 @@ provider "google" {{
         try:
             now = time.time()
             cutoff = now - (max_age_hours * 3600)
-            root = TOFU_ROOT
-            if not os.path.exists(root):
+            try:
+                it = os.scandir(TOFU_ROOT)
+            except FileNotFoundError:
                 return
-            for name in os.listdir(root):
-                path = os.path.join(root, name)
-                try:
-                    if not os.path.isdir(path):
+            with it:
+                for entry in it:
+                    # dot-dirs are shared caches (.jinja_cache, .terraform), not workspaces
+                    if entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
                         continue
-                    mtime = os.path.getmtime(path)
+                    try:
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                    except OSError:
+                        continue  # removed concurrently
                     # do not remove if recently modified (race safeguard)
                     if mtime < cutoff:
-                        logger.info("GC removing old workspace: %s (age %.1f hours)", path, (now - mtime) / 3600.0)
-                        shutil.rmtree(path, ignore_errors=True)
-                except Exception:
-                    logger.exception("Error during GC for %s", path)
+                        logger.info("GC removing old workspace: %s (age %.1f hours)", entry.path, (now - mtime) / 3600.0)
+                        shutil.rmtree(entry.path, ignore_errors=True)
         except Exception:
             logger.exception("gc_old_workdirs failure")
 
@@ -621,14 +893,7 @@ provider "google" {{
 
     def _run_tofu_command(self, wd: str, args: List[str], timeout: int = 300) -> Dict[str, Any]:
         cmd = [self.tofu_path, *args]
-        proc = subprocess.run(
-            cmd,
-            cwd=wd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=self._get_env(),
-        )
+        proc = _run_capped(cmd, cwd=wd, timeout=timeout)
         return {
             "command": " ".join(cmd),
             "returncode": proc.returncode,
@@ -644,8 +909,32 @@ provider "google" {{
             f.write(hcl)
         return wd, self._normalized_adapter_id(logical_id)
 
+    def _stale_hcl_hash(self, wd: str) -> Optional[str]:
+        """
+        sha256 of wd/main.tf when `tofu init` has to run for it, or None when .terraform was
+        already initialized for byte-identical HCL (recorded in HCL_HASH_FILE).
+        """
+        with open(os.path.join(wd, "main.tf"), "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if not os.path.isdir(os.path.join(wd, ".terraform")):
+            return digest
+        try:
+            with open(os.path.join(wd, HCL_HASH_FILE), "r", encoding="utf-8") as f:
+                return None if f.read().strip() == digest else digest
+        except OSError:
+            return digest
+
     def plan_instance(self, logical_id: str, spec: Dict[str, Any]) -> Dict[str, Any]:
+        self._ensure_creds(spec.get("provider", "aws"))
         wd, adapter_id = self._prepare_workspace(logical_id, spec)
+        return self._plan_workspace(wd, adapter_id)
+
+    def _plan_workspace(self, wd: str, adapter_id: str, init: Optional[Future] = None) -> Dict[str, Any]:
+        """
+        init/validate/plan a written workspace; init may already be running as a Future.
+        init and validate only run for HCL they have not seen yet, so replanning an unchanged
+        workspace is a single `tofu plan` process.
+        """
         command_outputs: Dict[str, Dict[str, Any]] = {}
         if not self.tofu_path:
             return self._build_error_response(
@@ -656,24 +945,32 @@ provider "google" {{
                 command_outputs=command_outputs,
             )
         try:
-            command_outputs["init"] = self._run_tofu_command(wd, ["init", "-no-color"])
-            if command_outputs["init"]["returncode"] != 0:
-                return self._build_error_response(
-                    adapter_id=adapter_id,
-                    workspace_path=wd,
-                    error_category="init_failed",
-                    error=command_outputs["init"]["stderr"] or command_outputs["init"]["stdout"] or "OpenTofu init failed.",
-                    command_outputs=command_outputs,
-                )
-            command_outputs["validate"] = self._run_tofu_command(wd, ["validate", "-no-color"])
-            if command_outputs["validate"]["returncode"] != 0:
-                return self._build_error_response(
-                    adapter_id=adapter_id,
-                    workspace_path=wd,
-                    error_category="validate_failed",
-                    error=command_outputs["validate"]["stderr"] or command_outputs["validate"]["stdout"] or "OpenTofu validate failed.",
-                    command_outputs=command_outputs,
-                )
+            hcl_hash = self._stale_hcl_hash(wd)
+            if hcl_hash is not None:
+                self._validated_wds.discard(wd)
+                command_outputs["init"] = init.result() if init is not None else self._run_tofu_command(wd, ["init", "-no-color"])
+                if command_outputs["init"]["returncode"] != 0:
+                    return self._build_error_response(
+                        adapter_id=adapter_id,
+                        workspace_path=wd,
+                        error_category="init_failed",
+                        error=command_outputs["init"]["stderr"] or command_outputs["init"]["stdout"] or "OpenTofu init failed.",
+                        command_outputs=command_outputs,
+                    )
+                with open(os.path.join(wd, HCL_HASH_FILE), "w", encoding="utf-8") as f:
+                    f.write(hcl_hash)
+                self._initialized_wds.add(wd)
+            if wd not in self._validated_wds:
+                command_outputs["validate"] = self._run_tofu_command(wd, ["validate", "-no-color"])
+                if command_outputs["validate"]["returncode"] != 0:
+                    return self._build_error_response(
+                        adapter_id=adapter_id,
+                        workspace_path=wd,
+                        error_category="validate_failed",
+                        error=command_outputs["validate"]["stderr"] or command_outputs["validate"]["stdout"] or "OpenTofu validate failed.",
+                        command_outputs=command_outputs,
+                    )
+                self._validated_wds.add(wd)
             command_outputs["plan"] = self._run_tofu_command(wd, ["plan", "-no-color"])
             if command_outputs["plan"]["returncode"] != 0:
                 return self._build_error_response(
@@ -712,7 +1009,9 @@ provider "google" {{
             )
 
     def apply_instance(self, logical_id: str, spec: Dict[str, Any]) -> Dict[str, Any]:
-        plan_res = self.plan_instance(logical_id, spec)
+        return self._apply_planned(self.plan_instance(logical_id, spec))
+
+    def _apply_planned(self, plan_res: Dict[str, Any]) -> Dict[str, Any]:
         if not plan_res.get("success"):
             return plan_res
         wd = plan_res["workspace_path"]
@@ -728,6 +1027,7 @@ provider "google" {{
                     error=command_outputs["apply"]["stderr"] or command_outputs["apply"]["stdout"] or "OpenTofu apply failed.",
                     command_outputs=command_outputs,
                 )
+            self._cleanup(wd)
             return {
                 "success": True,
                 "adapter_id": adapter_id,
@@ -758,8 +1058,46 @@ provider "google" {{
     def create_instance(self, logical_id: str, spec: Dict[str, Any], plan_only: bool = False) -> Dict[str, Any]:
         return self.plan_instance(logical_id, spec) if plan_only else self.apply_instance(logical_id, spec)
 
+    def create_instances(self, items: List[tuple], plan_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Batch create_instance over (logical_id, spec) pairs. Every workspace is written first and
+        the `tofu init`s they need (the slow, fully independent step) run concurrently; plan/apply then
+        run serially, or concurrently as well with CLOUDBREW_PARALLEL_APPLY=1.
+        Results are returned in input order. Each logical_id owns one workspace, so ids must be unique.
+        """
+        if not items:
+            return []
+        seen: set = set()
+        dupes = set()
+        for logical_id, _ in items:
+            (dupes if logical_id in seen else seen).add(logical_id)
+        if dupes:
+            raise ValueError(f"create_instances: duplicate logical ids {sorted(dupes)}")
+        prepared = []
+        for logical_id, spec in items:
+            self._ensure_creds(spec.get("provider", "aws"))
+            prepared.append(self._prepare_workspace(logical_id, spec))
+        if not self.tofu_path:
+            return [self._plan_workspace(wd, adapter_id) for wd, adapter_id in prepared]
+
+        def finish(i: int) -> Dict[str, Any]:
+            wd, adapter_id = prepared[i]
+            res = self._plan_workspace(wd, adapter_id, init=inits[i])
+            return res if plan_only else self._apply_planned(res)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(prepared))) as pool:
+            # inits are queued first, so a worker only picks up finish() once every init has started
+            inits = [
+                pool.submit(self._run_tofu_command, wd, ["init", "-no-color"]) if self._stale_hcl_hash(wd) else None
+                for wd, _ in prepared
+            ]
+            if os.environ.get("CLOUDBREW_PARALLEL_APPLY") == "1":
+                return list(pool.map(finish, range(len(prepared))))
+            return [finish(i) for i in range(len(prepared))]
+
     def destroy_instance(self, adapter_id: str) -> Dict[str, Any]:
         """Destroys an instance managed by OpenTofu."""
+        self._ensure_creds()
         normalized_adapter_id = self._normalized_adapter_id(adapter_id)
         logical_id = normalized_adapter_id.removeprefix("opentofu-")
         wd = self._workdir_for(logical_id)
@@ -805,6 +1143,8 @@ provider "google" {{
 
             self.store.delete_instance_by_adapter_id(normalized_adapter_id)
             shutil.rmtree(wd, ignore_errors=True)
+            self._initialized_wds.discard(wd)
+            self._validated_wds.discard(wd)
             return {
                 "success": True,
                 "adapter_id": normalized_adapter_id,
@@ -832,6 +1172,8 @@ provider "google" {{
         if not self.tofu_path:
             return {"drifted": None, "msg": "OpenTofu binary not found."}
 
+        # the workspace alone doesn't say which cloud it targets
+        self._ensure_creds()
         wd = self._workdir_for(logical_id)
 
         # 1. Check for State Lock (Common failure point)
@@ -843,16 +1185,18 @@ provider "google" {{
             }
 
         # 2. Ensure workspace is initialized
-        if not os.path.exists(os.path.join(wd, ".terraform")):
-            init_res = subprocess.run([self.tofu_path, "init", "-no-color"], cwd=wd, capture_output=True, text=True)
-            if init_res.returncode != 0:
-                return {"drifted": None, "msg": f"Init failed: {init_res.stderr or init_res.stdout}"}
+        if wd not in self._initialized_wds:
+            if not os.path.exists(os.path.join(wd, ".terraform")):
+                init_res = _run_capped([self.tofu_path, "init", "-no-color"], cwd=wd)
+                if init_res.returncode != 0:
+                    return {"drifted": None, "msg": f"Init failed: {init_res.stderr or init_res.stdout}"}
+            self._initialized_wds.add(wd)
 
         # 3. Command with exit code flag
         cmd = [self.tofu_path, "plan", "-detailed-exitcode", "-no-color"]
 
         try:
-            proc = subprocess.run(cmd, cwd=wd, capture_output=True, text=True, timeout=120)
+            proc = _run_capped(cmd, cwd=wd, timeout=120)
 
             # Exit code 0: No changes (No Drift)
             if proc.returncode == 0:
@@ -897,12 +1241,13 @@ provider "google" {{
         if not os.path.exists(plan_path):
             return {"success": False, "error": f"Plan file not found: {plan_path}"}
 
+        self._ensure_creds()
         wd = os.path.dirname(plan_path)
 
         cmd = [self.tofu_path, "apply", "-no-color", plan_path]
 
         try:
-            proc = subprocess.run(cmd, cwd=wd, capture_output=True, text=True, timeout=600)
+            proc = _run_capped(cmd, cwd=wd, timeout=600)
 
             if proc.returncode == 0:
                 return {"success": True, "output": proc.stdout, "path": wd}
@@ -912,3 +1257,12 @@ provider "google" {{
         except Exception as e:
             logger.exception("Error applying plan")
             return {"success": False, "error": str(e)}
+
+
+def _build_hcl(adapter: OpenTofuAdapter, provider: str, resource: str, schema: Optional[Dict[str, Any]], user_inputs: Any) -> str:
+    # the required-only renderer: missing required arguments come out as "AUTO" placeholders
+    return adapter.build_hcl_from_schema(provider, resource, schema, user_inputs)
+
+
+for _key in ("opentofu", "tofu"):
+    register_adapter(_key, OpenTofuAdapter, capabilities={"build_hcl": _build_hcl})
@@ -8,11 +8,14 @@ Pulumi adapter for CloudBrew (hardened).
 - Also exposes module-level convenience functions plan(), apply(), destroy() and helpers used by tests.
 """
 
+import atexit
 import json
 import os
+import selectors
 import shutil
 import tempfile
 import subprocess
+import threading
 from typing import Dict, Any, Generator, Optional, Iterable, List
 
 from LCF import store
@@ -40,6 +43,48 @@ def _make_project_dir(prefix: str = "cloudbrew_pulumi_") -> str:
     return d
 
 
+# Idle project dirs per stack name. A dir is checked out for the length of one
+# operation, so concurrent runs on the same stack never share spec.json; a
+# reused dir only has its spec.json rewritten.
+_PROJECT_POOL: Dict[str, List[str]] = {}
+_POOL_DIRS: List[str] = []
+_POOL_LOCK = threading.Lock()
+
+
+def _acquire_project_dir(stack_name: str) -> str:
+    with _POOL_LOCK:
+        idle = _PROJECT_POOL.get(stack_name)
+        if idle:
+            return idle.pop()
+    d = _make_project_dir()
+    with _POOL_LOCK:
+        _POOL_DIRS.append(d)
+    return d
+
+
+def _release_project_dir(stack_name: str, project_dir: str) -> None:
+    with _POOL_LOCK:
+        _PROJECT_POOL.setdefault(stack_name, []).append(project_dir)
+
+
+def _discard_project_dir(project_dir: str) -> None:
+    # a failed run may leave the dir half-written; don't hand it out again
+    with _POOL_LOCK:
+        if project_dir in _POOL_DIRS:
+            _POOL_DIRS.remove(project_dir)
+    shutil.rmtree(project_dir, ignore_errors=True)
+
+
+@atexit.register
+def _clear_project_pool() -> None:
+    with _POOL_LOCK:
+        dirs = list(_POOL_DIRS)
+        _POOL_DIRS.clear()
+        _PROJECT_POOL.clear()
+    for d in dirs:
+        shutil.rmtree(d, ignore_errors=True)
+
+
 def _write_spec(project_dir: str, spec: Dict):
     path = os.path.join(project_dir, "spec.json")
     with open(path, "w", encoding="utf-8") as f:
@@ -47,23 +92,7 @@ def _write_spec(project_dir: str, spec: Dict):
     return path
 
 
-def _make_project_template(project_dir: str, project_name: str = "cloudbrew-pulumi"):
-    """
-    Ensure a minimal Pulumi python project template exists in project_dir.
-    This creates Pulumi.yaml and a small __main__ program both at top-level
-    and inside a __main__ package dir (tests expect nested __main__/__main__.py).
-    """
-    os.makedirs(project_dir, exist_ok=True)
-
-    # Pulumi.yaml
-    with open(os.path.join(project_dir, "Pulumi.yaml"), "w", encoding="utf-8") as f:
-        f.write(f"name: {project_name}\nruntime: python\n")
-
-    # requirements.txt
-    with open(os.path.join(project_dir, "requirements.txt"), "w", encoding="utf-8") as f:
-        f.write("pulumi\n")
-
-    program = """\
+_PROGRAM = """\
 import json
 import os
 from pulumi import export
@@ -79,15 +108,36 @@ except Exception:
 export("cloudbrew_spec_summary", len(spec.get("resources", [])))
 """
 
-    # top-level __main__.py
-    with open(os.path.join(project_dir, "__main__.py"), "w", encoding="utf-8") as f:
-        f.write(program)
 
-    # nested package __main__/__main__.py (some Pulumi test harnesses look here)
+def _write_if_changed(path: str, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that. Returns True if written."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+def _make_project_template(project_dir: str, project_name: str = "cloudbrew-pulumi"):
+    """
+    Ensure a minimal Pulumi python project template exists in project_dir.
+    This creates Pulumi.yaml and a small __main__ program both at top-level
+    and inside a __main__ package dir (tests expect nested __main__/__main__.py).
+    Files that already have the expected content are left untouched.
+    """
+    # the nested dir implies project_dir
     nested_dir = os.path.join(project_dir, "__main__")
     os.makedirs(nested_dir, exist_ok=True)
-    with open(os.path.join(nested_dir, "__main__.py"), "w", encoding="utf-8") as f:
-        f.write(program)
+
+    _write_if_changed(os.path.join(project_dir, "Pulumi.yaml"), f"name: {project_name}\nruntime: python\n")
+    _write_if_changed(os.path.join(project_dir, "requirements.txt"), "pulumi\n")
+    # top-level __main__.py, plus the nested package copy (some Pulumi test harnesses look there)
+    _write_if_changed(os.path.join(project_dir, "__main__.py"), _PROGRAM)
+    _write_if_changed(os.path.join(nested_dir, "__main__.py"), _PROGRAM)
 
 
 # ----------------------
@@ -131,15 +181,65 @@ if _HAS_AUTOMATION:
 # ----------------------
 # Subprocess fallback (signature test-friendly)
 # ----------------------
+_READ_CHUNK = 1 << 16
+_POLL_INTERVAL = 0.1  # seconds between exit checks while a pipe is idle
+
+
+def _read_chunks(fd: int, proc: Optional[subprocess.Popen] = None) -> Generator[bytes, None, None]:
+    """
+    Raw chunks from a pipe until EOF. Given the process that writes it, waits with a selector
+    instead of a blocking read, so the stream also ends once that process has exited and gone
+    quiet even if a child it spawned (e.g. a Pulumi plugin) still holds the pipe open.
+    """
+    if proc is None or os.name == "nt":  # select() only handles sockets on Windows
+        while True:
+            chunk = os.read(fd, _READ_CHUNK)
+            if not chunk:
+                return
+            yield chunk
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            if sel.select(timeout=_POLL_INTERVAL):
+                chunk = os.read(fd, _READ_CHUNK)
+                if not chunk:
+                    return
+                yield chunk
+            elif proc.poll() is not None:
+                # it may have written its last output between the select and the poll
+                while sel.select(timeout=0):
+                    chunk = os.read(fd, _READ_CHUNK)
+                    if not chunk:
+                        return
+                    yield chunk
+                return
+
+
+def _iter_lines(stream: Any, proc: Optional[subprocess.Popen] = None) -> Generator[str, None, None]:
+    """
+    Lines (without line endings) from a binary pipe. Reads 64 KiB at a time with os.read and
+    decodes each batch of complete lines once, instead of text mode's small per-line reads.
+    """
+    tail = b""
+    for chunk in _read_chunks(stream.fileno(), proc):
+        # b"\n" never occurs inside a multi-byte UTF-8 sequence, so head decodes cleanly
+        head, nl, tail = (tail + chunk).rpartition(b"\n")
+        if nl:
+            for line in head.decode("utf-8", errors="replace").split("\n"):
+                yield line[:-1] if line.endswith("\r") else line
+    if tail:
+        line = tail.decode("utf-8", errors="replace")
+        yield line[:-1] if line.endswith("\r") else line
+
+
 def _stream_subprocess(cmd: Iterable[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> Generator[str, None, None]:
     """
     Stream subprocess stdout/stderr. Accepts cwd and env (both optional) so tests can call it easily.
     """
-    proc = subprocess.Popen(list(cmd), cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True)
+    proc = subprocess.Popen(list(cmd), cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=_READ_CHUNK)
     assert proc.stdout is not None
     try:
-        for line in proc.stdout:
-            yield line.rstrip("\n")
+        yield from _iter_lines(proc.stdout, proc)
         proc.wait()
         if proc.returncode != 0:
             # collect tail for easier debugging
@@ -164,11 +264,10 @@ def _run_cli(project_dir: str, spec: Dict, stack_name: str, action: str) -> Gene
         pass
 
     def _run_cmd_collect(cmd):
-        proc = subprocess.Popen(list(cmd), cwd=project_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, text=True, bufsize=1)
+        proc = subprocess.Popen(list(cmd), cwd=project_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, bufsize=_READ_CHUNK)
         assert proc.stdout is not None
         out_lines: List[str] = []
-        for line in proc.stdout:
-            line = line.rstrip("\n")
+        for line in _iter_lines(proc.stdout, proc):
             out_lines.append(line)
             yield line
         proc.wait()
@@ -198,16 +297,34 @@ class PulumiAdapter:
     def __init__(self, db_path: Optional[str] = None):
         self.store = store.SQLiteStore(db_path)
 
-    def _run_action(self, spec: Dict, stack_name: str, action: str) -> List[str]:
-        project_dir = _make_project_dir()
+    def _stream_action(self, spec: Dict, stack_name: str, action: str) -> Generator[str, None, None]:
+        """Yield output lines while the operation runs; the project dir goes back to the pool when the stream ends."""
+        project_dir = _acquire_project_dir(stack_name)
         try:
             if _HAS_AUTOMATION:
-                out = list(_run_automation_op(project_dir, spec, stack_name, action))
+                yield from _run_automation_op(project_dir, spec, stack_name, action)
             else:
-                out = list(_run_cli(project_dir, spec, stack_name, action))
-            return out
-        finally:
-            shutil.rmtree(project_dir, ignore_errors=True)
+                yield from _run_cli(project_dir, spec, stack_name, action)
+        except BaseException:
+            _discard_project_dir(project_dir)
+            raise
+        _release_project_dir(stack_name, project_dir)
+
+    def _run_action(self, spec: Dict, stack_name: str, action: str) -> List[str]:
+        return list(self._stream_action(spec, stack_name, action))
+
+    def _record_instance(self, logical_id: str, spec: Dict[str, Any]) -> str:
+        adapter_id = f"pulumi-{logical_id}"
+        inst = {
+            "logical_id": logical_id,
+            "adapter": "pulumi",
+            "adapter_id": adapter_id,
+            "spec": spec,
+            "state": "running",
+            "created_at": int(__import__("time").time()),
+        }
+        self.store.upsert_instance(inst)
+        return adapter_id
 
     def create_instance(self, logical_id: str, spec: Dict[str, Any], plan_only: bool = False) -> Dict[str, Any]:
         stack_name = logical_id
@@ -216,18 +333,15 @@ class PulumiAdapter:
             return {"plan_id": f"pulumi-{stack_name}", "diff": "\n".join(out)}
         else:
             out = self._run_action(spec, stack_name, "up")
-            adapter_id = f"pulumi-{stack_name}"
-            inst = {
-                "logical_id": logical_id,
-                "adapter": "pulumi",
-                "adapter_id": adapter_id,
-                "spec": spec,
-                "state": "running",
-                "created_at": int(__import__("time").time()),
-            }
-            self.store.upsert_instance(inst)
+            adapter_id = self._record_instance(logical_id, spec)
             return {"success": True, "adapter_id": adapter_id, "output": "\n".join(out)}
 
+    def stream_create_instance(self, logical_id: str, spec: Dict[str, Any], plan_only: bool = False) -> Generator[str, None, None]:
+        """Streaming create_instance: lines are yielded as Pulumi prints them, the instance is recorded once `up` finishes."""
+        yield from self._stream_action(spec, logical_id, "preview" if plan_only else "up")
+        if not plan_only:
+            self._record_instance(logical_id, spec)
+
     def plan(self, logical_id: str, spec: Dict[str, Any]) -> Dict[str, Any]:
         out = self._run_action(spec, logical_id, "preview")
         return {"plan_id": f"pulumi-{logical_id}", "diff": "\n".join(out)}
@@ -250,30 +364,30 @@ class PulumiAdapter:
 # ----------------------
 # Module-level convenience wrappers (tests and CLI expect these)
 # ----------------------
+def _lines(chunks: Iterable[Any]) -> Generator[str, None, None]:
+    # automation API output may arrive as multi-line chunks; the CLI fallback is already per line
+    for chunk in chunks:
+        text = str(chunk)
+        yield from (text.splitlines() or [text])
+
+
 def plan(spec: Dict[str, Any], stack: str = "dev") -> Generator[str, None, None]:
-    pa = PulumiAdapter()
-    # stream the preview
-    out = pa.plan(stack, spec)
-    # if pa.plan returns dict, yield text; if it streams, adapt accordingly
-    diff = out.get("diff") if isinstance(out, dict) else out
-    if isinstance(diff, str):
-        for ln in diff.splitlines():
-            yield ln
-    else:
-        # fallback: send entire repr
-        yield json.dumps(out)
+    # lines reach the caller while `pulumi preview` is still running
+    yield from _lines(PulumiAdapter()._stream_action(spec, stack, "preview"))
 
 
 def apply(spec: Dict[str, Any], stack: str = "dev") -> Generator[str, None, None]:
-    pa = PulumiAdapter()
-    res = pa.create_instance(stack, spec, plan_only=False)
-    out = res.get("output") or ""
-    for ln in str(out).splitlines():
-        yield ln
+    yield from _lines(PulumiAdapter().stream_create_instance(stack, spec, plan_only=False))
+
+
+def stream_create_instance(logical_id: str, spec: Dict[str, Any], plan_only: bool = False) -> Generator[str, None, None]:
+    # used by the offload worker for pulumi plan_spec/apply_spec tasks
+    yield from _lines(PulumiAdapter().stream_create_instance(logical_id, spec, plan_only=plan_only))
 
 
 def destroy(stack: str) -> Generator[str, None, None]:
     pa = PulumiAdapter()
-    # call destroy_instance and stream a completion line
-    pa.destroy_instance(f"pulumi-{stack}")
+    adapter_id = f"pulumi-{stack}"
+    yield from _lines(pa._stream_action({}, stack, "destroy"))
+    pa.store.delete_instance_by_adapter_id(adapter_id)
     yield f"destroyed:{stack}"
@@ -2,10 +2,11 @@ import hashlib
 import json
 import os
 import re
-import shutil
 import subprocess
 from typing import Any, Dict, List
 
+from LCF import utils
+
 CACHE_FILE = "schema_cache.json"
 CACHE_VERSION = "v2"
 
@@ -13,12 +14,7 @@ CACHE_VERSION = "v2"
 class SchemaManager:
     def __init__(self, work_dir=".", tofu_bin: str | None = None):
         self.work_dir = work_dir
-        self.tofu_bin = (
-            tofu_bin
-            or os.environ.get("CLOUDBREW_OPENTOFU_BIN")
-            or shutil.which("tofu")
-            or shutil.which("opentofu")
-        )
+        self.tofu_bin = tofu_bin or utils.tofu_bin()
         self.cache_path = os.path.join(work_dir, CACHE_FILE)
         os.makedirs(self.work_dir, exist_ok=True)
         self.cache_key = self._build_cache_key()
@@ -88,7 +84,8 @@ class SchemaManager:
             return {}
 
         if not os.path.exists(os.path.join(self.work_dir, ".terraform")):
-            subprocess.run([self.tofu_bin, "init"], cwd=self.work_dir, check=True, capture_output=True)
+            # only the exit status (and stderr, on failure) matters; init's progress log is discarded
+            subprocess.run([self.tofu_bin, "init"], cwd=self.work_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
         try:
             result = subprocess.run(
@@ -5,6 +5,7 @@ Uses reverse engineering approach to build valid OpenTofu configurations
 with minimal user input and negligible latency.
 """
 
+import functools
 import json
 import os
 import subprocess
@@ -33,6 +34,62 @@ except ImportError:
         pass
 
 
+# ---------------------------------------------------------------------------
+# Config -> HCL
+# ---------------------------------------------------------------------------
+# line templates are built once; each render only fills them in
+_RESOURCE_OPEN = 'resource "{}" "{}" {{'.format
+_BLOCK_OPEN = '  {} {{'.format
+_BLOCK_ATTR = '    {} = "{}"'.format
+_LIST_ATTR = '  {} = ["{}"]'.format
+_ATTR = '  {} = "{}"'.format
+
+
+def _render_config_hcl(config: Dict) -> str:
+    hcl_lines = []
+    append = hcl_lines.append
+    for resource_type, resources in config['resource'].items():
+        for name, attrs in resources.items():
+            append(_RESOURCE_OPEN(resource_type, name))
+            for key, value in attrs.items():
+                if isinstance(value, dict):
+                    append(_BLOCK_OPEN(key))
+                    for subkey, subvalue in value.items():
+                        append(_BLOCK_ATTR(subkey, subvalue))
+                    append('  }')
+                elif isinstance(value, list):
+                    if value and key == 'attribute':
+                        for attr in value:
+                            append(_BLOCK_OPEN(key))
+                            for attr_key, attr_value in attr.items():
+                                append(_BLOCK_ATTR(attr_key, attr_value))
+                            append('  }')
+                    elif value:
+                        append(_LIST_ATTR(key, ", ".join(str(v) for v in value)))
+                else:
+                    append(_ATTR(key, value))
+            append('}')
+    return '\n'.join(hcl_lines)
+
+
+@functools.lru_cache(maxsize=512)
+def _config_to_hcl_cached(config_json: str) -> str:
+    return _render_config_hcl(json.loads(config_json))
+
+
+def config_to_hcl(config: Dict) -> str:
+    """
+    Convert a configuration dict ({"resource": {type: {name: attrs}}}) to HCL.
+    Configs are plain JSON data, so renders are memoized on their JSON text: the
+    validate/fix loop re-renders the same configuration over and over.
+    """
+    try:
+        config_json = json.dumps(config)
+    except (TypeError, ValueError):
+        return _render_config_hcl(config)
+    return _config_to_hcl_cached(config_json)
+
+
 class IntelligentBuilder:
     """
     Builds valid OpenTofu configurations through iterative validation
@@ -1154,30 +1211,7 @@ class IntelligentBuilder:
     
     def _config_to_hcl(self, config: Dict) -> str:
         """Convert configuration dict to HCL"""
-        hcl_lines = []
-        for resource_type, resources in config['resource'].items():
-            for name, attrs in resources.items():
-                hcl_lines.append(f'resource "{resource_type}" "{name}" {{')
-                for key, value in attrs.items():
-                    if isinstance(value, dict):
-                        hcl_lines.append(f'  {key} {{')
-                        for subkey, subvalue in value.items():
-                            hcl_lines.append(f'    {subkey} = "{subvalue}"')
-                        hcl_lines.append(f'  }}')
-                    elif isinstance(value, list):
-                        if value and key == 'attribute':
-                            for attr in value:
-                                hcl_lines.append(f'  {key} {{')
-                                for attr_key, attr_value in attr.items():
-                                    hcl_lines.append(f'    {attr_key} = "{attr_value}"')
-                                hcl_lines.append(f'  }}')
-                        elif value:
-                            items = ", ".join(str(v) for v in value)
-                            hcl_lines.append(f'  {key} = ["{items}"]')
-                    else:
-                        hcl_lines.append(f'  {key} = "{value}"')
-                hcl_lines.append('}')
-        return '\n'.join(hcl_lines)
+        return config_to_hcl(config)
     
     def _merge_with_user_input(self, base_config: Dict, user_input: Dict) -> Dict:
         """Merge user input with base configuration"""
@@ -41,7 +41,7 @@ class IntelligentRouter:
             # Hardcoded preference for AWS in 'auto' mode for this demo
             target_provider = "aws" if provider == "auto" else provider
             
-            logger.info(f"Checking L1 Hot Pool for {target_provider}:{size}...")
+            logger.info("Checking L1 Hot Pool for %s:%s...", target_provider, size)
             cached_vm = self.pool_manager.get_available_resource(target_provider, size, image)
             
             if cached_vm:
@@ -62,7 +62,7 @@ class IntelligentRouter:
         if provider == "auto":
             best_provider, reason = self._arbitrage_decision(size, spec.get("region", "us-east-1"))
             spec["provider"] = best_provider
-            logger.info(f"Arbitrage Engine selected {best_provider}: {reason}")
+            logger.info("Arbitrage Engine selected %s: %s", best_provider, reason)
         
         # 5. L3 Cold Build (Standard)
         logger.info("Cache Miss. Initiating standard cold build via OpenTofu...")
@@ -0,0 +1,54 @@
+# LCF/jsonx.py
+"""
+Small JSON shim: uses orjson when it is installed, stdlib json otherwise.
+
+Both backends produce the same compact (or 2-space indented), UTF-8 output so
+hashes of encoded documents do not depend on which one is available.
+  - dumps(obj, sort_keys=False, indent=False) -> str
+  - dumps_bytes(obj, sort_keys=False, indent=False) -> bytes
+  - loads(str | bytes) -> Any
+  - JSONDecodeError: raised by loads on either backend (orjson's subclasses json's)
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Union
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+        opts = _OPTS
+        if sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        if indent:
+            opts |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=opts)
+
+    def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> str:
+        return dumps_bytes(obj, sort_keys, indent).decode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return orjson.loads(data)
+
+else:
+    def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, sort_keys=sort_keys, indent=2, separators=(",", ": "), ensure_ascii=False)
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+        return dumps(obj, sort_keys, indent).encode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
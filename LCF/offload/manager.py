@@ -3,6 +3,9 @@ OffloadManager - SQLite-backed offload queue and worker.
 
 Features:
 - enqueue(adapter, task_type, payload) to queue tasks (opentofu|pulumi adapters supported)
+- enqueue_many([(adapter, task_type, payload), ...]) to queue a batch in one transaction
+- payloads are stored as JSON text; CLOUDBREW_OFFLOAD_MSGPACK=1 stores msgpack blobs instead
+  (needs the "msgpack" extra in every process using the queue). decode_payload reads either form.
 - run_worker(...) loop that fetches pending tasks, dispatches them to adapters,
   persists line-by-line logs into offload_logs, and marks tasks done/failed with retries.
 - dispatch_task public wrapper for programmatic dispatch.
@@ -19,9 +22,14 @@ import traceback
 import shlex
 import subprocess
 import os
-from typing import Optional, Dict, Any, List, Iterable, Generator
+from typing import Optional, Dict, Any, List, Iterable, Generator, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import msgpack  # optional ("msgpack" extra): smaller rows and faster decode for large payloads
+except ImportError:
+    msgpack = None
+
 # Adapters
 from LCF.cloud_adapters.opentofu_adapter import OpenTofuAdapter
 from LCF.cloud_adapters import pulumi_adapter
@@ -50,6 +58,26 @@ CREATE TABLE IF NOT EXISTS offload_logs (
 DEFAULT_MAX_ATTEMPTS = int(os.environ.get("CLOUDBREW_OFFLOAD_MAX_ATTEMPTS") or 3)
 DEFAULT_BACKOFF_SEC = int(os.environ.get("CLOUDBREW_OFFLOAD_BACKOFF") or 5)
 DEFAULT_POLL_INTERVAL = int(os.environ.get("CLOUDBREW_OFFLOAD_POLL") or 5)
+# opt-in: a worker without msgpack (or from before blob payloads) cannot read blob rows
+USE_MSGPACK = os.environ.get("CLOUDBREW_OFFLOAD_MSGPACK") == "1"
+
+
+def encode_payload(payload: Optional[Dict[str, Any]]) -> Union[str, bytes]:
+    if USE_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("CLOUDBREW_OFFLOAD_MSGPACK=1 but msgpack is not installed (pip install 'cloudbrew[msgpack]')")
+        return msgpack.packb(payload or {}, use_bin_type=True)
+    return json.dumps(payload or {})
+
+
+def decode_payload(raw: Union[str, bytes, None]) -> Dict[str, Any]:
+    if not raw:
+        return {}
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        if msgpack is None:
+            raise RuntimeError("task payload is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(raw, raw=False)
+    return json.loads(raw)
 
 
 class OffloadManager:
@@ -58,9 +86,19 @@ class OffloadManager:
         # SQLite connection shared between threads (check_same_thread=False is safe for read-mostly or locked writes)
         self._conn = sqlite3.connect(self.path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._setup_pragmas()
         self._init_db()
         self._stop = threading.Event()
 
+    def _setup_pragmas(self):
+        # WAL lets CLI enqueues and a running worker use the queue without blocking each other
+        cur = self._conn.cursor()
+        try:
+            cur.execute("PRAGMA journal_mode=WAL;")
+            cur.execute("PRAGMA synchronous=NORMAL;")
+        finally:
+            cur.close()
+
     def _init_db(self):
         cur = self._conn.cursor()
         try:
@@ -71,12 +109,26 @@ class OffloadManager:
     # -----------------------
     # Task lifecycle / DB
     # -----------------------
-    def enqueue(self, adapter: str, task_type: str, payload: Optional[Dict[str, Any]] = None) -> int:
+    def enqueue(
+        self,
+        adapter: str,
+        task_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        payload_json: Optional[Union[str, bytes]] = None,
+    ) -> int:
+        """
+        Queue one task. payload_json, when given, is an already-serialized JSON object
+        stored as-is (as text, which decode_payload reads back) instead of encoding payload.
+        """
+        if payload_json is not None:
+            raw = payload_json.decode("utf-8") if isinstance(payload_json, bytes) else payload_json
+        else:
+            raw = encode_payload(payload)
         cur = self._conn.cursor()
         try:
             cur.execute(
                 "INSERT INTO offload_tasks(ts,status,adapter,task_type,payload) VALUES (?, ?, ?, ?, ?)",
-                (int(time.time()), "pending", adapter, task_type, json.dumps(payload or {}))
+                (int(time.time()), "pending", adapter, task_type, raw)
             )
             task_id = cur.lastrowid
             self._conn.commit()
@@ -84,6 +136,29 @@ class OffloadManager:
         finally:
             cur.close()
 
+    def enqueue_many(self, items: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]) -> List[int]:
+        """
+        Queue several (adapter, task_type, payload) tasks in a single transaction,
+        so a batch costs one commit instead of one per task. Returns the task ids in order.
+        """
+        now = int(time.time())
+        ids: List[int] = []
+        cur = self._conn.cursor()
+        try:
+            for adapter, task_type, payload in items:
+                cur.execute(
+                    "INSERT INTO offload_tasks(ts,status,adapter,task_type,payload) VALUES (?, ?, ?, ?, ?)",
+                    (now, "pending", adapter, task_type, encode_payload(payload))
+                )
+                ids.append(cur.lastrowid)
+            self._conn.commit()
+            return ids
+        except Exception:
+            self._conn.rollback()
+            raise
+        finally:
+            cur.close()
+
     def fetch_pending(self, limit: int = 1) -> List[Dict[str, Any]]:
         cur = self._conn.cursor()
         try:
@@ -200,7 +275,7 @@ class OffloadManager:
         task_id = int(task_row["id"])
         adapter = task_row["adapter"]
         task_type = task_row["task_type"]
-        payload = json.loads(task_row.get("payload") or "{}")
+        payload = decode_payload(task_row.get("payload"))
 
         # --- OpenTofu Tasks ---
         if adapter in ("opentofu", "tofu"):
@@ -448,3 +523,10 @@ class OffloadManager:
 
     def stop(self):
         self._stop.set()
+
+    def close(self):
+        self._stop.set()
+        try:
+            self._conn.close()
+        except Exception:
+            pass
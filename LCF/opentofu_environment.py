@@ -70,7 +70,8 @@ class OpenTofuEnvironment:
                     '-input=false'    # Non-interactive
                 ],
                 cwd=self.workdir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # output is never read
+                stderr=subprocess.DEVNULL,
                 timeout=120
             )
         except subprocess.TimeoutExpired:
@@ -95,7 +96,8 @@ class OpenTofuEnvironment:
             result = subprocess.run(
                 ['tofu', 'validate', str(temp_config_file)],
                 cwd=self.workdir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # only stderr is parsed for errors
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=30  # Much shorter timeout since environment is pre-initialized
             )
@@ -138,9 +140,8 @@ class OpenTofuEnvironment:
     
     def _dict_to_hcl(self, config: Dict) -> str:
         """Convert configuration dict to HCL"""
-        from LCF.intelligent_builder import IntelligentBuilder
-        builder = IntelligentBuilder()
-        return builder._config_to_hcl(config)
+        from LCF.intelligent_builder import config_to_hcl
+        return config_to_hcl(config)
     
     def cleanup(self):
         """Clean up temporary files"""
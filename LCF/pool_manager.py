@@ -75,7 +75,7 @@ class WarmPoolManager:
                 
                 if current_hot < targets["hot"]:
                     needed = targets["hot"] - current_hot
-                    logger.info(f"Pool '{key}' (Hot): {current_hot}/{targets['hot']}. Provisioning {needed}...")
+                    logger.info("Pool '%s' (Hot): %s/%s. Provisioning %s...", key, current_hot, targets['hot'], needed)
                     self._trigger_provisioning(needed, "hot", provider, size, image)
 
                 # Check Warm Tier
@@ -87,7 +87,7 @@ class WarmPoolManager:
                 
                 if current_warm < targets["warm"]:
                     needed = targets["warm"] - current_warm
-                    logger.info(f"Pool '{key}' (Warm): {current_warm}/{targets['warm']}. Provisioning {needed}...")
+                    logger.info("Pool '%s' (Warm): %s/%s. Provisioning %s...", key, current_warm, targets['warm'], needed)
                     self._trigger_provisioning(needed, "warm", provider, size, image)
 
     def _trigger_provisioning(self, count: int, tier: str, provider: str, size: str, image: str):
@@ -111,7 +111,7 @@ class WarmPoolManager:
                 (pool_id, logical_name, provider, tier, 'creating', spec_hash, int(time.time()), int(time.time()))
             )
 
-        logger.info(f"Provisioning {logical_name} ({tier})...")
+        logger.info("Provisioning %s (%s)...", logical_name, tier)
         
         # 2. Call OpenTofu
         spec = {
@@ -139,7 +139,7 @@ class WarmPoolManager:
                         "UPDATE resource_pool SET status='available', details=?, updated_at=? WHERE id=?",
                         (json.dumps(details), int(time.time()), pool_id)
                     )
-                logger.info(f"Instance {logical_name} is now AVAILABLE in {tier} pool.")
+                logger.info("Instance %s is now AVAILABLE in %s pool.", logical_name, tier)
             else:
                 raise Exception(res.get("error"))
 
@@ -173,7 +173,7 @@ class WarmPoolManager:
                 )
                 
                 if cursor.rowcount == 1:
-                    logger.info(f"Claimed Hot Resource: {row['logical_id']}")
+                    logger.info("Claimed Hot Resource: %s", row['logical_id'])
                     return dict(row)
         
         return None
\ No newline at end of file
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import hashlib
 import json
-import os
 import subprocess
 import time
 from dataclasses import dataclass, field
@@ -19,6 +18,7 @@ from LCF.provisioning.prompt_engine import (
 )
 from LCF.resource_resolver import ResourceResolver
 from LCF.provisioning.run_metadata import RunMetadataStore
+from LCF.utils import tofu_env
 
 
 @dataclass
@@ -257,8 +257,7 @@ class ProvisioningPipeline:
             commands.append([self.tofu_bin, "apply", "-auto-approve", "-no-color"])
 
         results = []
-        env = os.environ.copy()
-        env["TF_IN_AUTOMATION"] = "1"
+        env = tofu_env()
         for cmd in commands:
             started = time.time()
             proc = subprocess.run(cmd, cwd=str(workdir), capture_output=True, text=True, env=env)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+_HCL_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_HCL_NAME_SAFE = re.compile(r"[^A-Za-z0-9_]")
 
 
 class HCLIRRenderer:
@@ -33,13 +36,7 @@ class HCLIRRenderer:
 
         lines: List[str] = [f'resource "{resource_type}" "{safe_name}" {{']
 
-        attr_names = sorted(k for k in ir.keys() if k in attrs_schema)
-        block_names = sorted(k for k in ir.keys() if k in block_types)
-        extra_names = sorted(
-            k
-            for k in ir.keys()
-            if k not in attrs_schema and k not in block_types and not k.startswith("_") and k != "provider"
-        )
+        attr_names, block_names, extra_names = self._partition_keys(ir, attrs_schema, block_types)
 
         for name in attr_names:
             lines.append(self._render_attribute(name, ir[name], depth=1))
@@ -54,6 +51,26 @@ class HCLIRRenderer:
         lines.append("}")
         return "\n".join(lines)
 
+    @staticmethod
+    def _partition_keys(
+        value: Dict[str, Any], attrs: Dict[str, Any], blocks: Dict[str, Any], top_level: bool = True
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Splits keys into (schema attributes, schema blocks, extras), each sorted, with a
+        single sort and one pass. At the top level internal "_" keys and "provider" are dropped.
+        """
+        attr_names: List[str] = []
+        block_names: List[str] = []
+        extra_names: List[str] = []
+        for k in sorted(value):
+            if k in attrs:
+                attr_names.append(k)
+            elif k in blocks:
+                block_names.append(k)
+            elif not top_level or (not k.startswith("_") and k != "provider"):
+                extra_names.append(k)
+        return attr_names, block_names, extra_names
+
     def _render_block_type(self, name: str, value: Any, block_schema: Dict[str, Any], depth: int) -> List[str]:
         mode = (block_schema or {}).get("nesting_mode") or "single"
         nested_block = (block_schema or {}).get("block", {})
@@ -76,9 +93,7 @@ class HCLIRRenderer:
             attrs = nested_schema.get("attributes", {}) if nested_schema else {}
             nested_blocks = nested_schema.get("block_types", {}) if nested_schema else {}
 
-            attr_names = sorted(k for k in value.keys() if k in attrs)
-            block_names = sorted(k for k in value.keys() if k in nested_blocks)
-            extra_names = sorted(k for k in value.keys() if k not in attrs and k not in nested_blocks)
+            attr_names, block_names, extra_names = self._partition_keys(value, attrs, nested_blocks, top_level=False)
 
             for name in attr_names:
                 lines.append(self._render_attribute(name, value[name], depth + 1))
@@ -123,13 +138,13 @@ class HCLIRRenderer:
 
     @staticmethod
     def _render_object_key(key: str) -> str:
-        if re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", key):
+        if _HCL_IDENT.match(key):
             return key
         return json.dumps(key)
 
     @staticmethod
     def _sanitize_name(logical_name: str) -> str:
-        clean_name = re.sub(r"[^A-Za-z0-9_]", "_", logical_name.replace(" ", "_"))
+        clean_name = _HCL_NAME_SAFE.sub("_", logical_name.replace(" ", "_"))
         if clean_name and clean_name[0].isdigit():
             clean_name = f"res_{clean_name}"
         return clean_name
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import os
 import re
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from LCF.utils import tofu_env
+
 
 @dataclass
 class ValidationDiagnostic:
@@ -224,8 +225,7 @@ class ProvisioningValidator:
         workdir.mkdir(parents=True, exist_ok=True)
         (workdir / "main.tf").write_text(rendered_hcl, encoding="utf-8")
 
-        env = os.environ.copy()
-        env["TF_IN_AUTOMATION"] = "1"
+        env = tofu_env()
         commands = [
             [self.tofu_bin, "init", "-no-color"],
             [self.tofu_bin, "validate", "-no-color"],
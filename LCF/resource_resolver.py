@@ -1,5 +1,4 @@
 from __future__ import annotations
-import shutil
 import os
 import sqlite3
 import json
@@ -7,8 +6,11 @@ import subprocess
 import time
 import difflib
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
+from LCF import jsonx, utils
 from LCF.canonical_identity import CanonicalIdentity, normalize_provider
 
 # Try importing SchemaManager; handle case if LCF module is missing to avoid immediate crash
@@ -52,8 +54,31 @@ CREATE TABLE IF NOT EXISTS provider_index (
 _MATCH_THRESHOLD = 0.3
 _MAX_CANDIDATES = 8
 _SCHEMA_QUERY_TIMEOUT = 30
+# main.tf that forces a provider download for schema queries
+_BOOTSTRAP_TF = """
+terraform {{
+  required_providers {{
+    {provider} = {{
+      source = "{source}"
+    }}
+  }}
+}}
+provider "{provider}" {{}}
+"""
 MAPPINGS_DIR = os.path.join(os.path.dirname(__file__), "mappings")
 
+# Scoring runs once per provider resource name (thousands per probe), so the
+# tokenizer patterns are compiled once and candidate tokens are memoized.
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Za-z]+")
+_WORD_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|[0-9]+")
+_PENALIZED_SUFFIXES = frozenset({"tag", "attachment", "association", "accepter", "policy_attachment", "admin_account"})
+
+
+@lru_cache(maxsize=16384)
+def _tokens(s: str) -> Tuple[str, ...]:
+    parts = _WORD_RE.findall(_NON_ALNUM_RE.sub("_", s))
+    return tuple(t.lower() for p in parts for t in p.split("_") if t)
+
 
 # ======================================================================
 # RESOURCE RESOLVER (COMPLETE REWRITE WITH STRICT AZURE OVERRIDE)
@@ -94,14 +119,19 @@ class ResourceResolver:
         except Exception:
             self.conn = None
 
+        # provider probes run on worker threads; the sqlite handle is shared
+        self._db_lock = threading.Lock()
         self._provider_name_cache: Dict[str, List[str]] = {}
         self._last_fetched: Dict[str, int] = {}
         self.static_registry = {}
+        # (alias, normalized provider) -> first matching spec, so an explicit
+        # provider hint is a single dict lookup instead of a scan of candidates
+        self._static_index: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self._load_static_mappings()
         self.tofu_binary = self._find_binary()
 
     def _find_binary(self) -> str:
-        return os.environ.get("CLOUDBREW_OPENTOFU_BIN") or shutil.which("tofu") or shutil.which("opentofu") or "tofu"
+        return utils.tofu_bin() or "tofu"
     
     def _load_static_mappings(self):
         """Loads all JSON files from the mappings/ directory."""
@@ -112,14 +142,16 @@ class ResourceResolver:
             if filename.endswith(".json"):
                 path = os.path.join(MAPPINGS_DIR, filename)
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    with open(path, "rb") as f:
+                        data = jsonx.loads(f.read())
                         # FIX: Append to list instead of overwriting
                         for key, spec in data.items():
                             if key not in self.static_registry:
                                 self.static_registry[key] = []
                             # Store as a list of specs
                             self.static_registry[key].append(spec)
+                            if isinstance(spec, dict):
+                                self._static_index.setdefault((key, self._normalize_provider(spec.get("provider", ""))), spec)
                 except Exception as e:
                     print(f"Warning: Failed to load mapping {filename}: {e}")
 
@@ -195,16 +227,7 @@ class ResourceResolver:
         tf_file = os.path.join(work_dir, "main.tf")
         if not os.path.exists(tf_file):
             with open(tf_file, "w") as f:
-                f.write(f"""
-terraform {{
-  required_providers {{
-    {provider} = {{
-      source = "{source}"
-    }}
-  }}
-}}
-provider "{provider}" {{}}
-""")
+                f.write(_BOOTSTRAP_TF.format(provider=provider, source=source))
 
         # 2. Run Init if .terraform is missing (Optimized check)
         if not os.path.exists(os.path.join(work_dir, ".terraform")):
@@ -244,48 +267,35 @@ provider "{provider}" {{}}
     def _tokenize(self, s: str) -> List[str]:
         if not isinstance(s, str):
             return []
-        s2 = re.sub(r"[^0-9A-Za-z]+", "_", s)
-        parts = re.findall(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|[0-9]+", s2)
-
-        tokens: List[str] = []
-        for p in parts:
-            for t in p.split("_"):
-                if t:
-                    tokens.append(t.lower())
-        return tokens
+        return list(_tokens(s))
 
     def _score_candidate_tokens(self, query_tok: List[str], candidate: str) -> float:
         """Original token scoring for simple list matches (used by _discover_best_match)"""
         if not candidate: return 0.0
-        cand_tok = self._tokenize(candidate)
+        cand_tok = _tokens(candidate)
         if not cand_tok: return 0.0
+        cand_joined = " ".join(cand_tok)
 
         # 1. Identify "Important" words (len > 3, e.g. "cosmosdb", "dynamodb")
         important_keywords = {t for t in query_tok if len(t) > 3}
         
-        # 2. Check if candidate contains them
-        matches_important = 0
-        for kw in important_keywords:
-            if any(kw in ct for ct in cand_tok):
-                matches_important += 1
-        
-        if important_keywords and matches_important == 0:
+        # 2. Check if candidate contains them (tokens have no spaces, so a substring
+        #    hit in the joined string is a hit inside one token)
+        if important_keywords and not any(kw in cand_joined for kw in important_keywords):
             return 0.0
 
         # 3. Standard Scoring
         set_q = set(query_tok)
         set_c = set(cand_tok)
         overlap = len(set_q & set_c) / max(len(set_q), 1)
-        sub_boost = 0.20 if any(q in " ".join(cand_tok) for q in query_tok) else 0.0
-        ratio = difflib.SequenceMatcher(a=" ".join(query_tok), b=" ".join(cand_tok)).ratio()
+        sub_boost = 0.20 if any(q in cand_joined for q in query_tok) else 0.0
+        ratio = difflib.SequenceMatcher(a=" ".join(query_tok), b=cand_joined).ratio()
         
         base_score = 0.5 * overlap + 0.3 * ratio + sub_boost
 
         # 4. Suffix Penalty
-        penalized_suffixes = {"tag", "attachment", "association", "accepter", "policy_attachment", "admin_account"}
-        cand_parts = candidate.lower().split("_")
-        suffix = cand_parts[-1] if cand_parts else ""
-        if suffix in penalized_suffixes and suffix not in query_tok:
+        suffix = candidate.lower().rpartition("_")[2]
+        if suffix in _PENALIZED_SUFFIXES and suffix not in query_tok:
             base_score -= 0.25
 
         return max(0.0, min(1.0, base_score))
@@ -298,17 +308,18 @@ provider "{provider}" {{}}
             return
         try:
             now = int(time.time())
-            cur = self.conn.cursor()
-            for n in names:
-                try:
-                    cur.execute(
-                        "INSERT OR IGNORE INTO provider_index(provider, resource_name, fetched_at) VALUES (?, ?, ?)",
-                        (provider, n, now),
-                    )
-                except Exception:
-                    pass
-            self.conn.commit()
-            cur.close()
+            with self._db_lock:
+                cur = self.conn.cursor()
+                for n in names:
+                    try:
+                        cur.execute(
+                            "INSERT OR IGNORE INTO provider_index(provider, resource_name, fetched_at) VALUES (?, ?, ?)",
+                            (provider, n, now),
+                        )
+                    except Exception:
+                        pass
+                self.conn.commit()
+                cur.close()
         except Exception:
             pass
 
@@ -316,13 +327,14 @@ provider "{provider}" {{}}
         if not self.conn:
             return []
         try:
-            cur = self.conn.cursor()
-            cur.execute(
-                "SELECT resource_name FROM provider_index WHERE provider = ? ORDER BY fetched_at DESC",
-                (provider,),
-            )
-            out = [r[0] for r in cur.fetchall()]
-            cur.close()
+            with self._db_lock:
+                cur = self.conn.cursor()
+                cur.execute(
+                    "SELECT resource_name FROM provider_index WHERE provider = ? ORDER BY fetched_at DESC",
+                    (provider,),
+                )
+                out = [r[0] for r in cur.fetchall()]
+                cur.close()
             return out
         except Exception:
             return []
@@ -694,19 +706,15 @@ provider "azurerm" {
     # ----------------------------------------------
     # 1. STATIC LOOKUP (non-blocking)
     # ----------------------------------------------
-        if resource in self.static_registry:
-            candidates = self.static_registry[resource]
-            
-            # Safety: ensure it's a list (in case of partial load)
-            if not isinstance(candidates, list):
-                candidates = [candidates]
-
-            for match in candidates:
-                mapped_provider = self._normalize_provider(match.get("provider", ""))
-
-                # If provider matches OR user asked for 'auto', return this match
-                if provider == "auto" or provider == mapped_provider:
-                    return self._format_success(resource, match) 
+        if provider == "auto":
+            # 'auto' takes the first mapping registered for the alias
+            candidates = self.static_registry.get(resource)
+            if candidates:
+                return self._format_success(resource, candidates[0])
+        else:
+            match = self._static_index.get((resource, provider))
+            if match is not None:
+                return self._format_success(resource, match)
     # ----------------------------------------------
     # 2. DYNAMIC LOOKUP
     # ----------------------------------------------
@@ -726,8 +734,16 @@ provider "azurerm" {
         best_provider = None
         best_list = []
 
-        for p in providers_to_try:
-            score, results = self._discover_best_match(p, resource)
+    # Each probe may shell out to `tofu providers schema`; run them concurrently so
+    # an auto lookup costs the slowest provider rather than the sum of all of them.
+    # Results are consumed in providers_to_try order so ties resolve as before.
+        if len(providers_to_try) > 1:
+            with ThreadPoolExecutor(max_workers=len(providers_to_try)) as ex:
+                probes = list(ex.map(lambda p: self._discover_best_match(p, resource), providers_to_try))
+        else:
+            probes = [self._discover_best_match(providers_to_try[0], resource)]
+
+        for p, (score, results) in zip(providers_to_try, probes):
             if score > best_score:
                 best_score = score
                 best_provider = p
@@ -42,7 +42,7 @@ class SchemaManager:
 
         # Ensure providers are downloaded
         if not os.path.exists(os.path.join(self.work_dir, ".terraform")):
-            subprocess.run(["tofu", "init"], cwd=self.work_dir, check=True, capture_output=True)
+            subprocess.run(["tofu", "init"], cwd=self.work_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
         # Fetch the schema
         try:
@@ -1,19 +1,31 @@
 # cloudbrew/secret_store.py
 from __future__ import annotations
 import base64
+import functools
 import pathlib
 import os
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
-try:
-    import keyring
-except Exception:
-    keyring = None
 
-try:
-    from cryptography.fernet import Fernet, InvalidToken
-except Exception:
-    Fernet = None
+# keyring and cryptography are imported on first secret access rather than at import:
+# every CLI start imports this module, and keyring alone costs tens of milliseconds
+@functools.lru_cache(maxsize=None)
+def _keyring() -> Any:
+    try:
+        import keyring
+    except Exception:
+        return None
+    return keyring
+
+
+@functools.lru_cache(maxsize=None)
+def _fernet() -> Any:
+    """(Fernet, InvalidToken) from cryptography, or None when it is not installed."""
+    try:
+        from cryptography.fernet import Fernet, InvalidToken
+    except Exception:
+        return None
+    return Fernet, InvalidToken
 
 CONFIG_DIR = pathlib.Path.home() / ".cloudbrew"
 CONFIG_DIR.mkdir(mode=0o700, exist_ok=True)
@@ -30,9 +42,13 @@ class SecretStore:
       - secret_exists(key) -> bool
     """
 
-    def __init__(self):
-        self._has_keyring = keyring is not None
-        self._has_fernet = Fernet is not None
+    @property
+    def _has_keyring(self) -> bool:
+        return _keyring() is not None
+
+    @property
+    def _has_fernet(self) -> bool:
+        return _fernet() is not None
 
     def _fernet_key_path(self) -> pathlib.Path:
         return CONFIG_DIR / f"{FERNET_KEY_NAME}.key"
@@ -42,6 +58,7 @@ class SecretStore:
         if path.exists():
             return path.read_bytes()
         # generate
+        Fernet, _ = _fernet()
         key = Fernet.generate_key()
         path.write_bytes(key)
         os.chmod(path, 0o600)
@@ -50,10 +67,11 @@ class SecretStore:
     def store_secret(self, key: str, secret: str) -> Dict:
         """Store secret and return metadata describing storage method."""
         if self._has_keyring:
-            keyring.set_password("cloudbrew", key, secret)
+            _keyring().set_password("cloudbrew", key, secret)
             return {"method": "keyring", "key": key}
 
         if self._has_fernet:
+            Fernet, _ = _fernet()
             fkey = self._ensure_fernet_key()
             f = Fernet(fkey)
             token = f.encrypt(secret.encode("utf-8"))
@@ -70,13 +88,13 @@ class SecretStore:
 
     def retrieve_secret(self, key: str) -> Optional[str]:
         if self._has_keyring:
-            val = keyring.get_password("cloudbrew", key)
-            return val
+            return _keyring().get_password("cloudbrew", key)
 
         if self._has_fernet:
             path = CONFIG_DIR / f"{key}.secret"
             if not path.exists():
                 return None
+            Fernet, InvalidToken = _fernet()
             try:
                 fkey = self._ensure_fernet_key()
                 f = Fernet(fkey)
@@ -92,7 +110,7 @@ class SecretStore:
 
     def secret_exists(self, key: str) -> bool:
         if self._has_keyring:
-            return keyring.get_password("cloudbrew", key) is not None
+            return _keyring().get_password("cloudbrew", key) is not None
         if self._has_fernet:
             return (CONFIG_DIR / f"{key}.secret").exists()
         return (CONFIG_DIR / f"{key}.secret.b64").exists()
@@ -174,7 +174,7 @@ class StackManager:
                     op_result = future.result()
                     if op_result.get("success", False) or "plan_output" in op_result or "diff" in op_result:
                         result.resources_created.append(res_name)
-                        logger.info(f"Resource {res_name} processed successfully via OpenTofu.")
+                        logger.info("Resource %s processed successfully via OpenTofu.", res_name)
                     else:
                         error_msg = op_result.get("error", "Unknown adapter error")
                         result.errors.append(f"{res_name}: {error_msg}")
@@ -2,7 +2,7 @@
 import json
 import sqlite3
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS instances (
@@ -25,10 +25,44 @@ CREATE INDEX IF NOT EXISTS idx_instances_logical_prefix ON instances(logical_id)
 """
 
 
+_UPSERT_INSTANCE_SQL = """
+INSERT INTO instances(logical_id, adapter, adapter_id, spec_json, state, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(logical_id) DO UPDATE SET
+  adapter=excluded.adapter,
+  adapter_id=excluded.adapter_id,
+  spec_json=excluded.spec_json,
+  state=excluded.state,
+  created_at=excluded.created_at
+"""
+
+
 def _now_ts() -> int:
     return int(time.time())
 
 
+def _instance_dict(r: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "logical_id": r["logical_id"],
+        "adapter": r["adapter"],
+        "adapter_id": r["adapter_id"],
+        "state": r["state"],
+        "spec": json.loads(r["spec_json"] or "{}"),
+        "created_at": r["created_at"],
+    }
+
+
+def _instance_row(inst: Dict[str, Any]) -> tuple:
+    return (
+        inst["logical_id"],
+        inst.get("adapter"),
+        inst.get("adapter_id"),
+        json.dumps(inst.get("spec") or {}),
+        inst.get("state"),
+        inst.get("created_at", _now_ts()),
+    )
+
+
 class SQLiteStore:
     def __init__(self, path: str | None = None):
         self.path = path or ":memory:"
@@ -59,30 +93,26 @@ class SQLiteStore:
 
     # primary upsert used by adapters
     def upsert_instance(self, inst: Dict[str, Any]):
-        spec_json = json.dumps(inst.get("spec") or {})
         cur = self._conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO instances(logical_id, adapter, adapter_id, spec_json, state, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(logical_id) DO UPDATE SET
-              adapter=excluded.adapter,
-              adapter_id=excluded.adapter_id,
-              spec_json=excluded.spec_json,
-              state=excluded.state,
-              created_at=excluded.created_at
-        """,
-            (
-                inst["logical_id"],
-                inst.get("adapter"),
-                inst.get("adapter_id"),
-                spec_json,
-                inst.get("state"),
-                inst.get("created_at", _now_ts()),
-            ),
-        )
+        cur.execute(_UPSERT_INSTANCE_SQL, _instance_row(inst))
         cur.close()
 
+    def upsert_instances(self, insts: List[Dict[str, Any]]):
+        """Bulk upsert in a single transaction (one commit instead of one per row)."""
+        if not insts:
+            return
+        cur = self._conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            cur.executemany(_UPSERT_INSTANCE_SQL, [_instance_row(i) for i in insts])
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+        else:
+            cur.execute("COMMIT")
+        finally:
+            cur.close()
+
     def delete_instance_by_adapter_id(self, adapter_id: str) -> bool:
         cur = self._conn.cursor()
         cur.execute("DELETE FROM instances WHERE adapter_id = ?", (adapter_id,))
@@ -97,14 +127,7 @@ class SQLiteStore:
         cur.close()
         if not r:
             return None
-        return {
-            "logical_id": r["logical_id"],
-            "adapter": r["adapter"],
-            "adapter_id": r["adapter_id"],
-            "state": r["state"],
-            "spec": json.loads(r["spec_json"] or "{}"),
-            "created_at": r["created_at"],
-        }
+        return _instance_dict(r)
 
     def get_instance_by_adapter_id(self, adapter_id: str) -> Optional[Dict]:
         cur = self._conn.cursor()
@@ -113,14 +136,7 @@ class SQLiteStore:
         cur.close()
         if not r:
             return None
-        return {
-            "logical_id": r["logical_id"],
-            "adapter": r["adapter"],
-            "adapter_id": r["adapter_id"],
-            "state": r["state"],
-            "spec": json.loads(r["spec_json"] or "{}"),
-            "created_at": r["created_at"],
-        }
+        return _instance_dict(r)
 
     def list_instances(self, adapter: Optional[str] = None) -> List[Dict]:
         cur = self._conn.cursor()
@@ -128,36 +144,36 @@ class SQLiteStore:
             cur.execute("SELECT * FROM instances WHERE adapter = ?", (adapter,))
         else:
             cur.execute("SELECT * FROM instances")
-        rows = []
-        for r in cur.fetchall():
-            rows.append(
-                {
-                    "logical_id": r["logical_id"],
-                    "adapter": r["adapter"],
-                    "adapter_id": r["adapter_id"],
-                    "state": r["state"],
-                    "spec": json.loads(r["spec_json"] or "{}"),
-                    "created_at": r["created_at"],
-                }
-            )
+        rows = [_instance_dict(r) for r in cur.fetchall()]
         cur.close()
         return rows
 
+    def iter_instances(
+        self, limit: Optional[int] = None, offset: int = 0, batch: int = 500
+    ) -> Iterator[Dict]:
+        """
+        Yield instances in insertion order, fetching `batch` rows at a time so large
+        tables are never held in memory at once. limit/offset page through the table.
+        """
+        cur = self._conn.cursor()
+        try:
+            cur.execute(
+                "SELECT * FROM instances ORDER BY rowid LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset),
+            )
+            while True:
+                chunk = cur.fetchmany(batch)
+                if not chunk:
+                    break
+                for r in chunk:
+                    yield _instance_dict(r)
+        finally:
+            cur.close()
+
     def list_instances_by_prefix(self, prefix: str) -> List[Dict]:
         cur = self._conn.cursor()
         cur.execute("SELECT * FROM instances WHERE logical_id LIKE ?", (f"{prefix}%",))
-        rows = []
-        for r in cur.fetchall():
-            rows.append(
-                {
-                    "logical_id": r["logical_id"],
-                    "adapter": r["adapter"],
-                    "adapter_id": r["adapter_id"],
-                    "state": r["state"],
-                    "spec": json.loads(r["spec_json"] or "{}"),
-                    "created_at": r["created_at"],
-                }
-            )
+        rows = [_instance_dict(r) for r in cur.fetchall()]
         cur.close()
         return rows
 
@@ -179,3 +195,19 @@ class SQLiteStore:
             (int(time.time()), action, json.dumps(details)),
         )
         cur.close()
+
+    def log_actions_bulk(self, rows: List[Tuple[int, str, str]]):
+        """Insert pre-encoded (ts, action, details_json) rows in one transaction."""
+        if not rows:
+            return
+        cur = self._conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            cur.executemany("INSERT INTO actions(ts, action, details) VALUES (?, ?, ?)", rows)
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+        else:
+            cur.execute("COMMIT")
+        finally:
+            cur.close()
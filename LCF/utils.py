@@ -1,12 +1,15 @@
+import functools
 import json
+import shutil
 import uuid
 from pathlib import Path
 from typing import Dict
 import subprocess
 import os
-from typing import Dict, Tuple
+from typing import Dict, MutableMapping, Tuple
 
 STATE_FILE = Path(".cloudbrew_state.json")
+PLUGIN_CACHE_DIR = Path.home() / ".cloudbrew" / "plugin-cache"
 
 
 def save_state(state: Dict):
@@ -57,4 +60,48 @@ def ensure_ssh_key(base_name: str, unique: bool = True) -> Tuple[str, str]:
         # Allow errors to raise so you know if it fails
         subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
-    return public_key_path.read_text(), str(private_key_path)
\ No newline at end of file
+    return public_key_path.read_text(), str(private_key_path)
+
+
+@functools.lru_cache(maxsize=None)
+def which(*names: str) -> str:
+    """First of names found on PATH ("" if none). The PATH walk happens once per process."""
+    for name in names:
+        path = shutil.which(name)
+        if path:
+            return path
+    return ""
+
+
+def tofu_bin() -> str:
+    """OpenTofu binary: CLOUDBREW_OPENTOFU_BIN, else tofu/opentofu from PATH ("" if not installed)."""
+    return os.environ.get("CLOUDBREW_OPENTOFU_BIN") or which("tofu", "opentofu")
+
+
+def _apply_tofu_defaults(env: MutableMapping[str, str]) -> None:
+    env["TF_IN_AUTOMATION"] = "1"
+    if "TF_PLUGIN_CACHE_DIR" not in env:
+        PLUGIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        env["TF_PLUGIN_CACHE_DIR"] = str(PLUGIN_CACHE_DIR)
+    # workdirs start without a lock file; without this the cache is skipped on first init
+    env.setdefault("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "1")
+
+
+def tofu_env() -> Dict[str, str]:
+    """
+    Environment for tofu subprocesses. Providers are shared through a plugin cache
+    (an existing TF_PLUGIN_CACHE_DIR wins), so init in a fresh workdir links the
+    provider instead of downloading it again.
+    """
+    env = os.environ.copy()
+    _apply_tofu_defaults(env)
+    return env
+
+
+def export_tofu_env() -> None:
+    """
+    Apply the tofu_env() settings to os.environ itself, for long-lived callers that run
+    tofu repeatedly: their subprocesses inherit it (env=None) instead of copying the
+    whole environment per command.
+    """
+    _apply_tofu_defaults(os.environ)
@@ -39,6 +39,9 @@ setup(
             "google-api-python-client>=2.0.0",
             "azure-identity>=1.12.0",
         ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
         "dev": [
             "pytest",
             "pytest-cov",
@@ -46,7 +49,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "cloudbrew = LCF.cli:app",
+            "cloudbrew = LCF.cli:main",
             "cloudbrew-init = LCF.cli_init:app",
         ],
     },
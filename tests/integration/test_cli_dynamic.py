@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from LCF import cli
+
+
+def _fake_identity(self, resource, provider_hint="auto", logical_name=None, **_):
+    return {"_provider": "noop", "_resolved": f"noop_{resource}", "_identity": {"logical_name": logical_name}}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_resolver_cache():
+    cli._canonicalize_cached.cache_clear()
+    yield
+    cli._canonicalize_cached.cache_clear()
+
+
+def test_main_runs_dynamic_verb_without_typer_tree(monkeypatch, capsys) -> None:
+    monkeypatch.setattr("LCF.resource_resolver.ResourceResolver.canonicalize_identity", _fake_identity)
+    calls = []
+    monkeypatch.setattr(cli.provisioning_pipeline, "execute", lambda req: calls.append(req) or {"success": True})
+    monkeypatch.setattr(cli, "_static_command_names", lambda: {"create"})
+    monkeypatch.setattr(cli, "app", None)  # the static Typer app must not be needed
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["bucket", "logs", "--acl", "private", "--yes", "--y", "--provider", "noop"])
+
+    assert exc.value.code == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["resolved"]["_resolved"] == "noop_bucket"
+    assert calls[0]["attributes"] == {"acl": "private"}
+    assert calls[0]["plan_only"] is False
+
+
+def test_canonicalize_is_memoized_per_process(monkeypatch) -> None:
+    seen = []
+
+    def fake(self, resource, provider_hint="auto", logical_name=None, **_):
+        seen.append(resource)
+        return _fake_identity(self, resource, provider_hint, logical_name)
+
+    monkeypatch.setattr("LCF.resource_resolver.ResourceResolver.canonicalize_identity", fake)
+
+    first = cli._canonicalize("vm", "auto", "web")
+    first["_resolved"] = "mutated"
+    second = cli._canonicalize("vm", "auto", "web")
+
+    assert seen == ["vm"]
+    assert second["_resolved"] == "noop_vm"
+
+
+def test_parse_dynamic_args_single_pass() -> None:
+    name, params, apply_flag = cli._parse_dynamic_args(["--region", "eu", "logs", "--versioning", "--apply", "--acl", "private"])
+
+    assert name == "logs"
+    assert params == {"region": "eu", "versioning": True, "acl": "private"}
+    assert apply_flag is True
+    assert cli._parse_dynamic_args([]) == ("unnamed", {}, False)
+
+
+def test_dynamic_command_objects_are_reused() -> None:
+    ctx = cli.click.Context(cli.click.Command("cloudbrew"))
+    group = cli.typer.main.get_command(cli.app)
+
+    first = group.get_command(ctx, "bucket")
+
+    assert group.get_command(ctx, "bucket") is first
+    assert cli._dynamic_command("bucket") is first
+    assert group.get_command(ctx, "queue") is not first
+
+
+def test_resolved_block_merges_meta_without_schema_keys(monkeypatch, capsys) -> None:
+    def fake(self, resource, provider_hint="auto", logical_name=None, **_):
+        return {"_resolved": "noop_bucket", "_provider": "noop", "block": {"attributes": {}}, "version": 1, "note": "x"}
+
+    monkeypatch.setattr("LCF.resource_resolver.ResourceResolver.canonicalize_identity", fake)
+    monkeypatch.setattr(cli.provisioning_pipeline, "execute", lambda req: {"success": True})
+
+    with pytest.raises(SystemExit):
+        cli.main(["bucket", "logs"])
+
+    assert json.loads(capsys.readouterr().out)["resolved"] == {
+        "_resolved": "noop_bucket",
+        "_provider": "noop",
+        "note": "x",
+        "_identity": None,
+    }
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+import LCF.provisioning  # noqa: F401  (import order: avoids the adapter/provisioning import cycle)
+from LCF.cli import app
+from LCF.offload.manager import OffloadManager, decode_payload
+
+
+runner = CliRunner()
+
+
+def test_offload_enqueue_batch_file_queues_all_tasks(monkeypatch, tmp_path) -> None:
+    off = OffloadManager(str(tmp_path / "offload.db"))
+    monkeypatch.setattr("LCF.cli._mgr", lambda kind, db_path=None, provider=None: off)
+    batch = tmp_path / "tasks.jsonl"
+    batch.write_text(
+        '{"task_type": "create_instance", "payload": {"name": "a"}}\n'
+        "\n"
+        '{"adapter": "pulumi", "task_type": "apply_spec", "payload": {"stack": "dev"}}\n'
+    )
+
+    result = runner.invoke(app, ["offload", "enqueue", "--batch-file", str(batch)])
+
+    assert result.exit_code == 0
+    ids = json.loads(result.stdout)["task_ids"]
+    assert len(ids) == 2
+    rows = off.fetch_pending(limit=10)
+    assert [(r["id"], r["adapter"], r["task_type"]) for r in rows] == [
+        (ids[0], "opentofu", "create_instance"),
+        (ids[1], "pulumi", "apply_spec"),
+    ]
+    assert decode_payload(rows[0]["payload"]) == {"name": "a"}
+
+
+def test_offload_enqueue_stores_payload_text_verbatim(monkeypatch, tmp_path) -> None:
+    off = OffloadManager(str(tmp_path / "offload.db"))
+    monkeypatch.setattr("LCF.cli._mgr", lambda kind, db_path=None, provider=None: off)
+    payload = '{"spec": {"name": "web"}, "stack": "dev"}'
+
+    result = runner.invoke(app, ["offload", "enqueue", "--task-type", "apply_spec", "--payload", payload])
+
+    assert result.exit_code == 0
+    row = off.fetch_pending(limit=1)[0]
+    assert row["id"] == json.loads(result.stdout)["task_id"]
+    assert row["payload"] == payload
+    assert decode_payload(row["payload"]) == {"spec": {"name": "web"}, "stack": "dev"}
+
+    for bad in ("[1]", '{"plan_path": '):
+        assert runner.invoke(app, ["offload", "enqueue", "--task-type", "apply_plan", "--payload", bad]).exit_code != 0
+    batch = tmp_path / "bad.jsonl"
+    batch.write_text('{"task_type": "apply_plan", "payload": "plan.tfplan"}\n')
+    assert runner.invoke(app, ["offload", "enqueue", "--batch-file", str(batch)]).exit_code != 0
+    assert len(off.fetch_pending(limit=10)) == 1
+
+
+def test_payloads_are_json_text_unless_msgpack_is_opted_in(monkeypatch, tmp_path) -> None:
+    import types
+
+    import pytest
+
+    from LCF.offload import manager
+
+    # stands in for msgpack, which is an optional extra
+    fake = types.SimpleNamespace(
+        packb=lambda obj, use_bin_type: json.dumps(obj).encode(),
+        unpackb=lambda data, raw: json.loads(data),
+    )
+    monkeypatch.setattr(manager, "msgpack", fake)
+    off = OffloadManager(str(tmp_path / "offload.db"))
+
+    off.enqueue("opentofu", "apply_plan", {"plan_path": "a"})
+    monkeypatch.setattr(manager, "USE_MSGPACK", True)
+    off.enqueue("opentofu", "apply_plan", {"plan_path": "b"})
+
+    rows = off.fetch_pending(limit=10)
+    assert [type(r["payload"]) for r in rows] == [str, bytes]
+    assert [decode_payload(r["payload"]) for r in rows] == [{"plan_path": "a"}, {"plan_path": "b"}]
+
+    monkeypatch.setattr(manager, "msgpack", None)
+    with pytest.raises(RuntimeError, match="msgpack"):
+        manager.encode_payload({"plan_path": "c"})
+
+
+def test_mgr_reuses_one_instance_per_db_path(tmp_path) -> None:
+    from LCF.cli import _mgr
+
+    db = str(tmp_path / "offload.db")
+    off = _mgr("off", db)
+
+    assert _mgr("off", db) is off
+    assert _mgr("off", str(tmp_path / "other.db")) is not off
+    assert off._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_pooled_managers_are_closed_at_exit(tmp_path) -> None:
+    import sqlite3
+
+    import pytest
+
+    from LCF import cli
+
+    off = cli._mgr("off", str(tmp_path / "closing.db"))
+    assert off in cli._pooled
+
+    cli._close_pooled()
+    cli._mgr.cache_clear()
+
+    assert cli._pooled == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        off._conn.execute("SELECT 1")
+
+
+def test_default_vm_provider_follows_credential_presence(monkeypatch) -> None:
+    from LCF import cli
+
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    assert cli._default_vm_provider() == "opentofu"
+
+    monkeypatch.setenv("AWS_PROFILE", "dev")
+    assert cli._default_vm_provider() == "aws"
+    assert cli._detect_provider.cache_info().currsize >= 2
+
+
+def test_apply_plan_async_enqueues_and_reports_plan_id(monkeypatch, tmp_path) -> None:
+    off = OffloadManager(str(tmp_path / "offload.db"))
+    monkeypatch.setattr("LCF.cli._mgr", lambda kind, db_path=None, provider=None: off)
+
+    result = runner.invoke(app, ["apply-plan", "--plan-id", "p1", "--async"])
+
+    assert result.exit_code == 0
+    out = json.loads(result.stdout)
+    assert out["plan_id"] == "p1"
+    row = off.fetch_pending()[0]
+    assert row["id"] == out["enqueued_task_id"]
+    assert (row["adapter"], row["task_type"]) == ("opentofu", "apply_plan")
+    assert decode_payload(row["payload"]) == {"plan_id": "p1"}
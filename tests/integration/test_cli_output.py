@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+from LCF.cli import app
+
+
+runner = CliRunner()
+
+
+def test_pulumi_plan_streams_json_lines(monkeypatch) -> None:
+    monkeypatch.setattr("LCF.cloud_adapters.pulumi_adapter.plan", lambda spec, stack: iter(["Previewing", "+ bucket"]))
+
+    result = runner.invoke(app, ["plan", "--provider", "pulumi", "--spec-json", '{"name": "b"}'])
+
+    assert result.exit_code == 0
+    assert [json.loads(ln) for ln in result.stdout.splitlines()] == [
+        {"plan_output": "Previewing"},
+        {"plan_output": "+ bucket"},
+    ]
+
+
+def test_pretty_flag_indents_json(monkeypatch) -> None:
+    monkeypatch.setattr("LCF.cli.provisioning_pipeline.get_run", lambda run_id: {"run_id": run_id})
+
+    compact = runner.invoke(app, ["runs", "show", "r1"])
+    pretty = runner.invoke(app, ["--pretty", "runs", "show", "r1"])
+
+    assert compact.stdout == '{"run_id":"r1"}\n'
+    assert pretty.stdout == '{\n  "run_id": "r1"\n}\n'
+
+
+def test_pulumi_plan_streams_raw_lines_in_order(monkeypatch, tmp_path) -> None:
+    spec = tmp_path / "spec.json"
+    spec.write_text('{"name": "b"}')
+    monkeypatch.setattr("LCF.cloud_adapters.pulumi_adapter.plan", lambda spec, stack: iter(["Previewing", "+ bucket", "done"]))
+
+    result = runner.invoke(app, ["pulumi-plan", "--spec", str(spec)])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["Planning Pulumi stack 'dev'...", "Previewing", "+ bucket", "done"]
+
+
+def test_cli_import_defers_pipeline_construction() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, LCF.cli as cli; "
+        "assert 'LCF.provisioning.pipeline' not in sys.modules; "
+        "assert 'yaml' not in sys.modules; "
+        "assert 'keyring' not in sys.modules; "
+        "cli.provisioning_pipeline.run_store; "
+        "assert 'LCF.provisioning.pipeline' in sys.modules"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_cli_commands_register_once() -> None:
+    from LCF.cli import app
+
+    groups = [app] + [g.typer_instance for g in app.registered_groups]
+    for group in groups:
+        names = [c.name or c.callback.__name__ for c in group.registered_commands]
+        assert len(names) == len(set(names)), names
+
+
+def test_status_streams_instances_with_paging(tmp_path) -> None:
+    from LCF.store import SQLiteStore
+
+    db = str(tmp_path / "cloudbrew.db")
+    st = SQLiteStore(db)
+    st.upsert_instances([
+        {"logical_id": f"vm-{i}", "adapter": "noop", "adapter_id": f"id-{i}", "spec": {"n": i}, "state": "running"}
+        for i in range(5)
+    ])
+
+    full = runner.invoke(app, ["status", "--db-path", db])
+    page = runner.invoke(app, ["status", "--db-path", db, "--limit", "2", "--offset", "1"])
+
+    assert full.exit_code == 0 and page.exit_code == 0
+    assert [i["logical_id"] for i in json.loads(full.stdout)["instances"]] == [f"vm-{i}" for i in range(5)]
+    assert [i["spec"] for i in json.loads(page.stdout)["instances"]] == [{"n": 1}, {"n": 2}]
+    assert list(st.iter_instances(batch=2)) == st.list_instances()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+
+from typer.testing import CliRunner
+
+import LCF.provisioning  # noqa: F401  (import order: avoids the adapter/provisioning import cycle)
+from LCF import cli
+from LCF.cli import app
+
+
+runner = CliRunner()
+
+
+def test_load_spec_reuses_parse_until_file_changes(tmp_path) -> None:
+    cli._parse_spec_file.cache_clear()
+    spec = tmp_path / "spec.json"
+    spec.write_text('{"name": "web", "tags": {"env": "dev"}}')
+
+    first = cli._load_spec(str(spec))
+    first["tags"]["env"] = "mutated"
+    second = cli._load_spec(str(spec))
+
+    assert second == {"name": "web", "tags": {"env": "dev"}}
+    assert cli._parse_spec_file.cache_info().hits == 1
+
+    spec.write_text('{"name": "api"}')
+    st = spec.stat()
+    os.utime(spec, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert cli._load_spec(str(spec)) == {"name": "api"}
+
+
+def test_create_vm_batch_spec_runs_every_spec_in_one_process(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    class FakeMgr:
+        def run_once(self, name, spec, autoscale_cfg, observed_metrics, plan_only):
+            calls.append((name, spec["type"], autoscale_cfg["min"], plan_only))
+            return {"name": name, "plan_only": plan_only}
+
+    mgrs = []
+
+    def fake_mgr(kind, db_path=None, provider=None):
+        mgrs.append((kind, provider))
+        return FakeMgr()
+
+    monkeypatch.setattr("LCF.cli._mgr", fake_mgr)
+    monkeypatch.setattr("LCF.cli._canonicalize", lambda *_a, **_k: {})
+    batch = tmp_path / "vms.json"
+    batch.write_text('[{"name": "a", "provider": "noop"}, {"name": "b", "provider": "noop", "count": 2}]')
+
+    result = runner.invoke(app, ["create-vm", "--batch-spec", str(batch), "--skip-policy"])
+
+    assert result.exit_code == 0, result.stdout
+    assert json.loads(result.stdout) == [{"name": "a", "plan_only": True}, {"name": "b", "plan_only": True}]
+    assert calls == [("a", "vm", 1, True), ("b", "vm", 2, True)]
+    assert mgrs == [("auto", "noop"), ("auto", "noop")]
+
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"name": "a"}')
+    assert runner.invoke(app, ["create-vm", "--batch-spec", str(bad)]).exit_code != 0
+
+
+def test_create_vm_batch_async_plans_concurrently_and_queues_once(monkeypatch, tmp_path) -> None:
+    import threading
+
+    from LCF.offload.manager import OffloadManager, decode_payload
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    class FakeAutoscaler:
+        def __init__(self, db_path=None, provider=None):
+            self.store = self
+
+        def run_once(self, name, spec, autoscale_cfg, observed_metrics, plan_only):
+            barrier.wait()  # only passes if all three plans are in flight together
+            return {"actions": [{"res": {"plan_id": f"plan-{name}"}}], "plan_id": f"plan-{name}"}
+
+        def close(self):
+            pass
+
+    off = OffloadManager(str(tmp_path / "offload.db"))
+    monkeypatch.setattr("LCF.autoscaler.AutoscalerManager", FakeAutoscaler)
+    monkeypatch.setattr("LCF.cli._mgr", lambda kind, db_path=None, provider=None: off)
+    monkeypatch.setattr("LCF.cli._canonicalize", lambda *_a, **_k: {})
+    batch = tmp_path / "vms.json"
+    batch.write_text(json.dumps([{"name": n, "provider": "noop"} for n in ("a", "b", "c")]))
+
+    result = runner.invoke(app, ["create-vm", "--batch-spec", str(batch), "--async", "--skip-policy"])
+
+    assert result.exit_code == 0, result.stdout
+    out = json.loads(result.stdout)
+    assert [o["plan_id"] for o in out] == ["plan-a", "plan-b", "plan-c"]
+    rows = off.fetch_pending(limit=10)
+    assert [r["id"] for r in rows] == [o["enqueued_task_id"] for o in out]
+    assert [decode_payload(r["payload"]) for r in rows] == [{"plan_path": f"plan-{n}"} for n in ("a", "b", "c")]
+
+
+def test_plan_batch_spec_hands_every_spec_to_one_batch_call(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    class FakeAdapter:
+        def create_instances(self, items, plan_only=False):
+            calls.append(([name for name, _ in items], plan_only))
+            return [{"adapter_id": f"opentofu-{name}", "success": True} for name, _ in items]
+
+    monkeypatch.setattr("LCF.cli._mgr", lambda kind, db_path=None, provider=None: FakeAdapter())
+    batch = tmp_path / "plans.json"
+    batch.write_text('[{"name": "a"}, {"name": "b"}, {"type": "vm"}, {"name": "a"}, {}]')
+
+    result = runner.invoke(app, ["plan", "--batch-spec", str(batch)])
+
+    assert result.exit_code == 0, result.stdout
+    ids = ["a", "b", "plan-object", "a-3", "plan-object-4"]
+    assert [r["adapter_id"] for r in json.loads(result.stdout)] == [f"opentofu-{i}" for i in ids]
+    assert calls == [(ids, True)]
+
+
+def test_load_spec_falls_back_to_extension(monkeypatch, tmp_path) -> None:
+    import pytest
+    import typer
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "web.json").write_text('{"name": "web"}')
+
+    assert cli._load_spec("web") == {"name": "web"}
+    with pytest.raises(typer.BadParameter):
+        cli._load_spec("missing")
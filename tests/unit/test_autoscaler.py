@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from LCF.autoscaler import AutoscalerManager
+
+
+class _RecordingAdapter:
+    def __init__(self) -> None:
+        self.deleted: list[str] = []
+
+    def create_instance(self, logical_id: str, spec: dict, plan_only: bool = False) -> dict:
+        return {"success": True, "adapter_id": f"id-{logical_id}"}
+
+    def delete_instance(self, adapter_id: str) -> bool:
+        self.deleted.append(adapter_id)
+        return True
+
+
+def test_scale_down_removes_oldest_instances() -> None:
+    adapter = _RecordingAdapter()
+    mgr = AutoscalerManager(adapter=adapter)
+    for ts in (4, 1, 3, 2):
+        mgr.store.upsert_instance(
+            {"logical_id": f"web-{ts}", "adapter": "test", "adapter_id": f"id-{ts}", "spec": {}, "state": "running", "created_at": ts}
+        )
+
+    res = mgr.run_once("web", {}, {"min": 1, "max": 1, "policy": [], "cooldown": 0}, {}, plan_only=False)
+
+    assert [a["adapter_id"] for a in res["actions"]] == ["id-1", "id-2", "id-3"]
+    assert sorted(adapter.deleted) == ["id-1", "id-2", "id-3"]
+    assert [r["logical_id"] for r in mgr.store.list_instances()] == ["web-4"]
+    assert res["actual_after"] == 1
+
+
+def test_scale_up_creates_in_parallel_and_persists_all() -> None:
+    mgr = AutoscalerManager(adapter=_RecordingAdapter())
+
+    res = mgr.run_once("api", {"size": "small"}, {"min": 5, "max": 5, "policy": [], "cooldown": 0}, {}, plan_only=False)
+
+    created = [a["logical_id"] for a in res["actions"]]
+    assert [c.rsplit("-", 1)[1] for c in created] == ["0", "1", "2", "3", "4"]
+    assert sorted(r["logical_id"] for r in mgr.store.list_instances()) == sorted(created)
+    assert res["actual_after"] == 5
+    logged = mgr.store._conn.execute("SELECT action, details FROM actions").fetchall()
+    assert [r["action"] for r in logged] == ["create"] * 5
+    assert '"logical_id":"api-' in logged[0]["details"]
+
+
+def test_stop_interrupts_run_loop_wait() -> None:
+    import threading
+    import time
+
+    mgr = AutoscalerManager(adapter=_RecordingAdapter())
+    specs = [{"logical_prefix": "loop", "spec": {}, "autoscale_cfg": {"min": 0, "max": 0, "policy": [], "cooldown": 0}}]
+    t = threading.Thread(target=mgr.run_loop, args=(specs, 60), daemon=True)
+
+    t.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    mgr.stop()
+    t.join(timeout=5)
+
+    assert not t.is_alive()
+    assert time.monotonic() - started < 1
+
+
+def test_run_loop_restarts_after_stop_and_keeps_own_event() -> None:
+    import threading
+    import time
+
+    mgr = AutoscalerManager(adapter=_RecordingAdapter())
+    rounds = []
+    mgr.run_once = lambda *a, **k: rounds.append(1)
+    specs = [{"logical_prefix": "loop", "spec": {}}]
+    own = mgr._stop_event
+
+    # a stop() that lands before the loop gets going still ends it
+    mgr.stop()
+    mgr.run_loop(specs, 60)
+    assert rounds == []
+
+    for caller_event in (None, threading.Event()):
+        t = threading.Thread(target=mgr.run_loop, args=(specs, 60, caller_event), daemon=True)
+        t.start()
+        time.sleep(0.05)
+        assert t.is_alive()
+        mgr.stop()
+        t.join(timeout=5)
+        assert not t.is_alive()
+
+    assert len(rounds) == 2
+    assert mgr._stop_event is own
+    assert not mgr._loop_events
+
+
+def test_parse_autoscale_string_fixed_forms_share_one_shape() -> None:
+    from LCF.autoscaler import DEFAULT_COOLDOWN, fixed_autoscale_cfg, parse_autoscale_string
+
+    assert parse_autoscale_string(None) == fixed_autoscale_cfg(1)
+    assert parse_autoscale_string(" 4 ") == {"min": 4, "max": 4, "policy": (), "cooldown": DEFAULT_COOLDOWN}
+    assert fixed_autoscale_cfg(2) is not fixed_autoscale_cfg(2)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from LCF.autoscaler import AutoscalerManager
+from LCF.Backhaul.collector import Collector
+from LCF.Backhaul.wrapper import BackhaulAdapterWrapper, redact_secrets
+from LCF.cloud_adapters.noop_adapter import NoopComputeAdapter
+
+
+def _event(logical_id: str, plan_id: str) -> dict:
+    return {
+        "logical_id": logical_id,
+        "provider": "noop",
+        "spec": {"size": "small"},
+        "plan_id": plan_id,
+        "plan_text": f"[noop] would create {logical_id}",
+        "plan_summary": {"add": 1},
+    }
+
+
+def test_record_plans_inserts_all_rows(tmp_path) -> None:
+    collector = Collector(str(tmp_path / "backhaul.db"))
+
+    assert collector.record_plans([_event("vm-a", "p-a"), _event("vm-b", "p-b")]) == 2
+    assert collector.record_plans([]) == 0
+
+    run = collector.get_run_by_plan("p-b")
+    assert run is not None
+    assert run["logical_id"] == "vm-b"
+    assert run["add_count"] == 1
+    assert collector.record_apply("p-a", {"success": True, "duration_s": 1.5, "output": "ok"})
+    assert collector.get_run_by_plan("p-a")["apply_success"] == 1
+
+
+def test_autoscaler_flushes_wrapped_plans_once(tmp_path) -> None:
+    collector = Collector(str(tmp_path / "backhaul.db"))
+    calls = []
+    original = collector.record_plans
+
+    def spy(events):
+        calls.append(len(events))
+        return original(events)
+
+    collector.record_plans = spy  # type: ignore[assignment]
+    adapter = BackhaulAdapterWrapper(NoopComputeAdapter(), collector)
+    mgr = AutoscalerManager(adapter=adapter)
+
+    res = mgr.run_once("web", {"size": "small"}, {"min": 3, "max": 3, "policy": [], "cooldown": 0}, {}, plan_only=True)
+
+    assert len(res["actions"]) == 3
+    assert res["plan_id"] == res["actions"][-1]["res"]["plan_id"]
+    assert calls == [3]
+    assert len(collector.list_runs()) == 3
+
+
+def test_collector_uses_one_connection_per_thread(tmp_path) -> None:
+    import threading
+
+    collector = Collector(str(tmp_path / "backhaul.db"))
+    seen = []
+
+    def worker(i: int) -> None:
+        seen.append(id(collector._conn()))
+        collector.record_plan(_event(f"vm-{i}", f"p-{i}"))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert id(collector._conn()) not in seen
+    assert len(collector.list_runs()) == 4
+
+
+def test_record_plan_hashes_plan_file(tmp_path) -> None:
+    collector = Collector(str(tmp_path / "backhaul.db"))
+    text = "+ resource \"aws_instance\" \"web\"\n" * 500
+    plan_file = tmp_path / "plan.txt"
+    plan_file.write_text(text)
+
+    ev = _event("vm-f", "p-f")
+    del ev["plan_text"]
+    ev["plan_file"] = str(plan_file)
+    collector.record_plan(ev)
+
+    run = collector.get_run_by_plan("p-f")
+    assert run["plan_hash"] == collector._plan_hash(text)
+    assert run["plan_excerpt"] == text[:2000]
+
+
+def test_redact_secrets_walks_nested_dicts() -> None:
+    spec = {"name": "vm", "Password": "x", "auth": {"token": "t", "user": "u", "deep": {"secret_key": "s"}}}
+
+    out = redact_secrets(spec)
+
+    assert out == {
+        "name": "vm",
+        "Password": "<REDACTED>",
+        "auth": {"token": "<REDACTED>", "user": "u", "deep": {"secret_key": "<REDACTED>"}},
+    }
+    assert spec["auth"]["token"] == "t"
+    assert redact_secrets(None) == {}
+
+
+def test_wrapper_calls_legacy_and_spec_adapters_without_retry(tmp_path) -> None:
+    calls = []
+
+    class LegacyAdapter:
+        def create_instance(self, name, image, size, region):
+            calls.append(("legacy", name, image, size, region))
+            return {"InstanceId": f"i-{name}"}
+
+    collector = Collector(str(tmp_path / "backhaul.db"))
+    legacy = BackhaulAdapterWrapper(LegacyAdapter(), collector)
+    assert legacy.create_instance("web", "ami-1", "small", "eu", plan_only=False) == {"InstanceId": "i-web"}
+    assert calls == [("legacy", "web", "ami-1", "small", "eu")]
+
+    modern = BackhaulAdapterWrapper(NoopComputeAdapter(), collector)
+    res = modern.create_instance("db", "img", "large", "us", plan_only=True)
+    assert res["plan_id"]
+    assert collector.get_run_by_plan(res["plan_id"])["logical_id"] == "db"
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import LCF.provisioning  # noqa: F401  (import order: avoids the adapter/provisioning import cycle)
+from LCF.cloud_adapters import dynamic_resource_creator as drc
+from LCF.cloud_adapters.opentofu_adapter import OpenTofuAdapter
+
+
+def test_call_flexibly_trims_args_to_signature_without_retrying() -> None:
+    calls = []
+
+    class Adapter:
+        def build_hcl_from_schema(self, provider, resource, schema):
+            calls.append((provider, resource, schema))
+            return "hcl"
+
+    adapter = Adapter()
+    with pytest.warns(DeprecationWarning):
+        for _ in range(3):
+            assert drc._render_hcl_with_adapter(adapter, "aws", "aws_s3_bucket", {"block": {}}, {"x": 1}) == "hcl"
+
+    assert calls == [("aws", "aws_s3_bucket", {"block": {}})] * 3
+    info = drc._positional_arity.cache_info()
+    assert info.hits >= 2
+
+
+def test_render_falls_back_to_schema_renderer_with_merged_spec() -> None:
+    seen = {}
+
+    class Adapter:
+        def _render_hcl_from_schema(self, resource_type, logical_name, spec, schema=None):
+            seen.update(resource_type=resource_type, logical_name=logical_name, spec=spec, schema=schema)
+            return "rendered"
+
+    with pytest.warns(DeprecationWarning):
+        out = drc._render_hcl_with_adapter(Adapter(), "aws", "aws_vpc", {"block": {}}, {"cidr_block": "10.0.0.0/16"})
+
+    assert out == "rendered"
+    assert seen == {
+        "resource_type": "aws_vpc",
+        "logical_name": "aws_vpc",
+        "spec": {"provider": "aws", "cidr_block": "10.0.0.0/16"},
+        "schema": {"block": {}},
+    }
+
+
+def test_opentofu_adapter_dispatches_through_registered_capability(recwarn) -> None:
+    seen = []
+
+    class Tofu(OpenTofuAdapter):
+        def __init__(self) -> None:  # skip binary/store setup
+            pass
+
+        def build_hcl_from_schema(self, provider, resource, schema, user_inputs=None):
+            seen.append((provider, resource, schema, user_inputs))
+            return super().build_hcl_from_schema(provider, resource, schema, user_inputs)
+
+    schema = {"block": {"attributes": {"bucket": {"required": True, "type": "string"}}}}
+
+    assert drc._render_hcl_with_adapter(Tofu(), "aws", "aws_s3_bucket", schema, {}) == 'resource "aws_s3_bucket" "aws" {\n  bucket = "AUTO"\n}'
+    assert seen == [("aws", "aws_s3_bucket", schema, {})]
+    assert not [w for w in recwarn if issubclass(w.category, DeprecationWarning)]
+
+
+def test_validation_loop_reuses_one_scratch_dir(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    workdirs = []
+
+    class Adapter:
+        tofu_path = "tofu"
+
+        def _render_hcl_from_schema(self, resource_type, logical_name, spec, schema=None):
+            return f"# {sorted(spec)}"
+
+    class Validator:
+        def __init__(self, tofu_bin):
+            pass
+
+        def validate(self, schema, values, rendered_hcl, workdir):
+            workdirs.append(workdir)
+            if "bucket" in values:
+                return SimpleNamespace(success=True, diagnostics=[], command_results=[])
+            diag = SimpleNamespace(rule_id="SCHEMA_REQUIRED_ATTRIBUTE_MISSING", path="bucket")
+            return SimpleNamespace(success=False, diagnostics=[diag], command_results=[])
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CLOUDBREW_SCRATCH_DIR", str(tmp_path / ".cloudbrew_providers"))
+    monkeypatch.setattr(drc, "OpenTofuAdapter", Adapter)
+    monkeypatch.setattr(drc, "ProvisioningValidator", Validator)
+    monkeypatch.setattr("builtins.input", lambda prompt: "b-1")
+
+    with pytest.warns(DeprecationWarning):
+        res = drc.create_resource_with_validation("aws", "aws_s3_bucket", {"block": {}}, SimpleNamespace(yes=False))
+
+    assert res["success"] is True
+    assert len(workdirs) == 2 and workdirs[0] == workdirs[1]
+    assert len(list((tmp_path / ".cloudbrew_providers" / "aws").iterdir())) == 1
+
+
+def test_block_prompts_ask_only_required_nested_attributes(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    schema = {
+        "block": {
+            "block_types": {
+                "versioning": {
+                    "block": {"attributes": {"enabled": {"required": True}, "mfa_delete": {"required": False}}}
+                }
+            }
+        }
+    }
+    prompts = []
+
+    class Adapter:
+        tofu_path = "tofu"
+
+        def _render_hcl_from_schema(self, resource_type, logical_name, spec, schema=None):
+            return "hcl"
+
+    class Validator:
+        def __init__(self, tofu_bin):
+            pass
+
+        def validate(self, schema, values, rendered_hcl, workdir):
+            if "versioning" in values:
+                return SimpleNamespace(success=True, diagnostics=[], command_results=[])
+            diag = SimpleNamespace(rule_id="SCHEMA_REQUIRED_BLOCK_MISSING", path="versioning")
+            return SimpleNamespace(success=False, diagnostics=[diag], command_results=[])
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CLOUDBREW_SCRATCH_DIR", str(tmp_path / ".cloudbrew_providers"))
+    monkeypatch.setattr(drc, "OpenTofuAdapter", Adapter)
+    monkeypatch.setattr(drc, "ProvisioningValidator", Validator)
+    monkeypatch.setattr("builtins.input", lambda prompt: prompts.append(prompt) or "true")
+
+    with pytest.warns(DeprecationWarning):
+        res = drc.create_resource_with_validation("aws", "aws_s3_bucket", schema, SimpleNamespace(yes=False))
+
+    assert res["success"] is True
+    assert prompts == ["versioning.enabled: "]
+
+
+def test_tmpfs_scratch_dir_is_removed_after_the_loop(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    shm = tmp_path / "shm"
+    workdirs = []
+
+    class Adapter:
+        tofu_path = "tofu"
+
+        def _render_hcl_from_schema(self, resource_type, logical_name, spec, schema=None):
+            return "hcl"
+
+    class Validator:
+        def __init__(self, tofu_bin):
+            pass
+
+        def validate(self, schema, values, rendered_hcl, workdir):
+            workdirs.append(workdir)
+            return SimpleNamespace(success=True, diagnostics=[], command_results=[])
+
+    monkeypatch.setattr(drc, "SHM_SCRATCH_ROOT", shm)
+    monkeypatch.setattr(drc, "_scratch_root", lambda: shm)
+    monkeypatch.setattr(drc, "OpenTofuAdapter", Adapter)
+    monkeypatch.setattr(drc, "ProvisioningValidator", Validator)
+
+    with pytest.warns(DeprecationWarning):
+        assert drc.create_resource_with_validation("aws", "aws_s3_bucket", {}, SimpleNamespace(yes=True))["success"]
+
+    assert workdirs[0].parent == shm / "aws"
+    assert not workdirs[0].exists()
+
+
+def test_scratch_dir_falls_back_to_disk_when_tmpfs_root_is_unusable(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    workdirs = []
+
+    class Adapter:
+        tofu_path = "tofu"
+
+        def _render_hcl_from_schema(self, resource_type, logical_name, spec, schema=None):
+            return "hcl"
+
+    class Validator:
+        def __init__(self, tofu_bin):
+            pass
+
+        def validate(self, schema, values, rendered_hcl, workdir):
+            workdirs.append(workdir)
+            return SimpleNamespace(success=True, diagnostics=[], command_results=[])
+
+    assert drc.SHM_SCRATCH_ROOT.name == f"cloudbrew-{os.getuid()}"
+    shm = tmp_path / "shm"
+    shm.write_text("")  # a path we cannot create dirs under, like another user's root
+    monkeypatch.setattr(drc, "SHM_SCRATCH_ROOT", shm)
+    monkeypatch.setattr(drc, "DISK_SCRATCH_ROOT", tmp_path / "disk")
+    monkeypatch.setattr(drc, "_scratch_root", lambda: shm)
+    monkeypatch.setattr(drc, "OpenTofuAdapter", Adapter)
+    monkeypatch.setattr(drc, "ProvisioningValidator", Validator)
+
+    with pytest.warns(DeprecationWarning):
+        assert drc.create_resource_with_validation("aws", "aws_s3_bucket", {}, SimpleNamespace(yes=True))["success"]
+
+    assert workdirs[0].parent == tmp_path / "disk" / "aws"
@@ -52,3 +52,15 @@ def test_hcl_ir_renderer_applies_nesting_mode_for_list_blocks() -> None:
     assert hcl.count("network_interface {") == 2
     assert 'subnet_id = "subnet-a"' in hcl
     assert 'subnet_id = "subnet-b"' in hcl
+
+
+def test_hcl_ir_renderer_orders_attributes_then_blocks_then_extras() -> None:
+    schema = {"block": {"attributes": {"zone": {}, "ami": {}}, "block_types": {"ebs": {"block": {}}}}}
+    ir = {"zone": "a", "provider": "aws", "_meta": 1, "extra": 1, "ebs": {"size": 8}, "ami": "ami-1"}
+
+    hcl = HCLIRRenderer().render_resource("aws_instance", "vm", ir, schema)
+
+    assert hcl == (
+        'resource "aws_instance" "vm" {\n  ami = "ami-1"\n  zone = "a"\n  ebs {\n    size = 8\n  }\n  extra = 1\n}'
+    )
+
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from LCF import intelligent_builder as ib
+
+
+def test_config_to_hcl_memoizes_identical_configs() -> None:
+    ib._config_to_hcl_cached.cache_clear()
+    config = {"resource": {"aws_s3_bucket": {"logs": {"bucket": "logs", "tags": {"env": "dev"}, "acl": ["private"]}}}}
+
+    hcl = ib.config_to_hcl(config)
+
+    assert hcl == (
+        'resource "aws_s3_bucket" "logs" {\n  bucket = "logs"\n  tags {\n    env = "dev"\n  }\n'
+        '  acl = ["private"]\n}'
+    )
+    assert ib.config_to_hcl({"resource": {"aws_s3_bucket": {"logs": dict(config["resource"]["aws_s3_bucket"]["logs"])}}}) == hcl
+    assert ib._config_to_hcl_cached.cache_info().misses == 1
+    assert ib.config_to_hcl({"resource": {"x_y": {"n": {"v": object}}}}).startswith('resource "x_y" "n" {')
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import LCF.provisioning  # noqa: F401
+from LCF.cloud_adapters import opentofu_adapter as ota
+
+
+def _adapter() -> ota.OpenTofuAdapter:
+    adapter = ota.OpenTofuAdapter.__new__(ota.OpenTofuAdapter)
+    adapter._creds_loaded = set()
+    adapter._creds_lock = ota.threading.Lock()
+    adapter._hcl_cache = ota.OrderedDict()
+    adapter._hcl_cache_lock = ota.threading.Lock()
+    adapter._initialized_wds = set()
+    adapter._validated_wds = set()
+    return adapter
+
+
+def test_credentials_load_only_for_the_provider_in_use(monkeypatch) -> None:
+    loads = []
+    secrets = []
+    stores = []
+
+    class FakeSecretStore:
+        def __init__(self):
+            stores.append(self)
+
+        def retrieve_secret(self, key):
+            secrets.append(key)
+            return "s3cret"
+
+    def fake_config():
+        loads.append(1)
+        return {
+            "creds": {
+                "aws": {"access_key_id": "AKIA", "region": "eu-west-1"},
+                "azure": {"tenant_id": "t", "client_id": "c"},
+            }
+        }
+
+    monkeypatch.setattr(ota, "_load_config", fake_config)
+    monkeypatch.setattr(ota, "SecretStore", FakeSecretStore)
+    ota._secret_store.cache_clear()
+    env = {}
+    monkeypatch.setattr(ota.os, "environ", env)
+    adapter = _adapter()
+
+    adapter._ensure_creds("hashicorp/aws")
+    adapter._ensure_creds("aws")
+
+    assert loads == [1]
+    assert secrets == ["aws_secret_key"]
+    assert len(stores) == 1
+    assert env["AWS_SECRET_ACCESS_KEY"] == "s3cret"
+    assert "ARM_CLIENT_ID" not in env
+
+    env.update(ARM_CLIENT_ID="env-client", ARM_CLIENT_SECRET="env-secret")
+    adapter._ensure_creds("azurerm")
+    adapter._ensure_creds("noop")
+
+    assert loads == [1]
+    assert env["ARM_CLIENT_ID"] == "env-client"
+
+    del env["ARM_CLIENT_SECRET"]
+    adapter._creds_loaded.clear()
+    adapter._ensure_creds("azure")
+
+    assert secrets == ["aws_secret_key", "azure_client_secret"]
+    assert len(stores) == 1
+    ota._secret_store.cache_clear()
+
+
+def test_concurrent_callers_wait_for_the_credential_export(monkeypatch) -> None:
+    import threading
+    import time
+
+    class FakeSecretStore:
+        def retrieve_secret(self, key):
+            time.sleep(0.05)  # keep the export in flight while the other threads arrive
+            return "s3cret"
+
+    monkeypatch.setattr(ota, "_load_config", lambda: {"creds": {"aws": {"access_key_id": "AKIA"}}})
+    monkeypatch.setattr(ota, "SecretStore", FakeSecretStore)
+    ota._secret_store.cache_clear()
+    env = {}
+    monkeypatch.setattr(ota.os, "environ", env)
+    adapter = _adapter()
+    seen = []
+
+    def worker() -> None:
+        adapter._ensure_creds("aws")
+        seen.append(env.get("AWS_SECRET_ACCESS_KEY"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen == ["s3cret"] * 4
+    ota._secret_store.cache_clear()
+
+
+def test_create_instances_runs_inits_concurrently(monkeypatch, tmp_path) -> None:
+    import threading
+
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path))
+    adapter = _adapter()
+    adapter.tofu_path = "tofu"
+    adapter._generate_hcl = lambda logical_id, spec: f"# {logical_id}\n"
+    # all three inits must be in flight at once to get past the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    calls = []
+
+    def fake_run(wd, args, timeout=300):
+        calls.append((os.path.basename(wd), args[0]))
+        if args[0] == "init":
+            barrier.wait()
+        return {"command": "tofu " + args[0], "returncode": 0, "stdout": f"{args[0]} ok", "stderr": ""}
+
+    adapter._run_tofu_command = fake_run
+    items = [(f"vm-{i}", {"provider": "noop"}) for i in range(3)]
+
+    results = adapter.create_instances(items, plan_only=True)
+
+    assert [r["adapter_id"] for r in results] == ["opentofu-vm-0", "opentofu-vm-1", "opentofu-vm-2"]
+    assert all(r["success"] and r["diff"] == "plan ok" for r in results)
+    assert sorted(c for c in calls if c[1] == "init") == [("vm-0", "init"), ("vm-1", "init"), ("vm-2", "init")]
+    assert (tmp_path / "vm-1" / "main.tf").read_text() == "# vm-1\n"
+
+
+def test_create_instances_rejects_duplicate_logical_ids(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path))
+    adapter = _adapter()
+    adapter.tofu_path = "tofu"
+    adapter._run_tofu_command = lambda *a, **k: pytest.fail("no tofu command may run")
+
+    with pytest.raises(ValueError, match="vm-a"):
+        adapter.create_instances([("vm-a", {"provider": "noop"}), ("vm-b", {}), ("vm-a", {})], plan_only=True)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unchanged_hcl_skips_tofu_init_and_validate(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path))
+    adapter = _adapter()
+    adapter.tofu_path = "tofu"
+    hcl = {"text": "# v1\n"}
+    adapter._generate_hcl = lambda logical_id, spec: hcl["text"]
+    calls = []
+
+    def fake_run(wd, args, timeout=300):
+        calls.append(args[0])
+        if args[0] == "init":
+            os.makedirs(os.path.join(wd, ".terraform"), exist_ok=True)
+        return {"command": "tofu " + args[0], "returncode": 0, "stdout": "", "stderr": ""}
+
+    adapter._run_tofu_command = fake_run
+    spec = {"provider": "noop"}
+
+    assert adapter.plan_instance("web", spec)["success"]
+    assert adapter.plan_instance("web", spec)["success"]
+    hcl["text"] = "# v2\n"
+    assert adapter.plan_instance("web", spec)["success"]
+
+    assert calls == ["init", "validate", "plan", "plan", "init", "validate", "plan"]
+
+
+def test_run_capped_keeps_a_bounded_tail(tmp_path) -> None:
+    script = "import sys\nfor i in range(5000): print(i)\nprint('boom', file=sys.stderr)\nsys.exit(3)"
+    proc = ota._run_capped([sys.executable, "-c", script], cwd=str(tmp_path), tail_lines=3)
+
+    assert proc.returncode == 3
+    assert proc.stdout == "4997\n4998\n4999\n"
+    assert proc.stderr == "boom\n"
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        ota._run_capped([sys.executable, "-c", "import time; time.sleep(30)"], cwd=str(tmp_path), timeout=0.2)
+
+
+def test_run_capped_replaces_undecodable_bytes(tmp_path) -> None:
+    script = "import sys\nsys.stdout.buffer.write(b'bad \\xff\\n' + b'x' * 200000 + b'\\n')"
+    proc = ota._run_capped([sys.executable, "-c", script], cwd=str(tmp_path), timeout=10)
+
+    assert proc.returncode == 0
+    assert proc.stdout.startswith("bad \ufffd\n")
+    assert len(proc.stdout) == 200007
+
+
+def test_gc_old_workdirs_removes_only_stale_workspaces(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path))
+    for name in ("old", "fresh", ".jinja_cache"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "schema_cache.json").write_text("{}")
+    stale = ota.time.time() - 100 * 3600
+    os.utime(tmp_path / "old", (stale, stale))
+    os.utime(tmp_path / ".jinja_cache", (stale, stale))
+
+    _adapter().gc_old_workdirs(max_age_hours=72)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".jinja_cache", "fresh", "schema_cache.json"]
+
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path / "missing"))
+    _adapter().gc_old_workdirs()
+
+
+def test_apply_keeps_provider_cache_and_state(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path))
+    monkeypatch.delenv("CLOUDBREW_FULL_CLEAN", raising=False)
+    adapter = _adapter()
+    adapter.tofu_path = "tofu"
+    adapter._generate_hcl = lambda logical_id, spec: "# v1\n"
+
+    def fake_run(wd, args, timeout=300):
+        if args[0] == "init":
+            os.makedirs(os.path.join(wd, ".terraform"), exist_ok=True)
+        if args[0] == "apply":
+            for name in ("terraform.tfstate", "crash.log", "plan.tfplan"):
+                open(os.path.join(wd, name), "w").close()
+        return {"command": "tofu " + args[0], "returncode": 0, "stdout": "", "stderr": ""}
+
+    adapter._run_tofu_command = fake_run
+
+    assert adapter.apply_instance("web", {"provider": "noop"})["success"]
+    assert sorted(os.listdir(tmp_path / "web")) == [".cloudbrew.hcl.sha256", ".terraform", "main.tf", "terraform.tfstate"]
+
+    monkeypatch.setenv("CLOUDBREW_FULL_CLEAN", "1")
+    adapter._cleanup(str(tmp_path / "web"))
+
+    assert sorted(os.listdir(tmp_path / "web")) == ["main.tf", "terraform.tfstate"]
+
+
+def test_generate_hcl_serves_repeated_specs_from_cache(monkeypatch) -> None:
+    monkeypatch.setattr(ota, "HCL_CACHE_SIZE", 2)
+    adapter = _adapter()
+    rendered = []
+
+    def fake_render(logical_id, spec):
+        rendered.append(logical_id)
+        return f"# {logical_id} {spec.get('size')}\n"
+
+    adapter._render_hcl = fake_render
+
+    assert adapter._generate_hcl("web", {"type": "aws_instance", "size": "small"}) == "# web small\n"
+    assert adapter._generate_hcl("web", {"size": "small", "type": "aws_instance"}) == "# web small\n"
+    assert adapter._generate_hcl("web", {"type": "aws_instance", "size": "large"}) == "# web large\n"
+    assert adapter._generate_hcl("db", {"type": "aws_instance", "size": "small"}) == "# db small\n"
+    assert adapter._generate_hcl("web", {"type": "aws_instance", "size": "small"}) == "# web small\n"
+    assert adapter._generate_hcl("x", {"_hcl_override": "raw"}) == "raw"
+
+    assert rendered == ["web", "web", "db", "web"]
+
+
+def test_generate_hcl_does_not_cache_specs_that_are_not_plain_json() -> None:
+    adapter = _adapter()
+    rendered = []
+
+    class Opaque:
+        def __str__(self) -> str:
+            return "same"
+
+    def fake_render(logical_id, spec):
+        rendered.append(spec["tags"])
+        return f"# {logical_id}\n"
+
+    adapter._render_hcl = fake_render
+
+    first, second = Opaque(), Opaque()
+    adapter._generate_hcl("web", {"type": "aws_instance", "tags": first})
+    adapter._generate_hcl("web", {"type": "aws_instance", "tags": second})
+
+    assert rendered == [first, second]
+    assert not adapter._hcl_cache
+
+
+def test_tofu_commands_inherit_exported_env(monkeypatch, tmp_path) -> None:
+    from LCF import utils
+
+    env = {"PATH": ota.os.environ.get("PATH", ""), "TF_PLUGIN_CACHE_DIR": str(tmp_path / "cache")}
+    monkeypatch.setattr(ota.os, "environ", env)
+
+    utils.export_tofu_env()
+
+    assert env["TF_IN_AUTOMATION"] == "1"
+    assert env["TF_PLUGIN_CACHE_DIR"] == str(tmp_path / "cache")
+    assert env["TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE"] == "1"
+
+
+def test_check_drift_initializes_a_workdir_once(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path))
+    adapter = _adapter()
+    monkeypatch.setattr(adapter, "_find_binary", lambda: "tofu")
+    # check_drift loads every cloud's credentials; keep the developer's out of the test
+    monkeypatch.setattr(adapter, "_ensure_creds", lambda provider=None: None)
+    calls = []
+
+    def fake_run(cmd, cwd, timeout=None, env=None):
+        calls.append(cmd[1])
+        return subprocess.CompletedProcess(cmd, 0, "No changes.", "")
+
+    monkeypatch.setattr(ota, "_run_capped", fake_run)
+
+    assert adapter.check_drift("web")["drifted"] is False
+    assert adapter.check_drift("web")["drifted"] is False
+    assert calls == ["init", "plan", "plan"]
+    assert adapter.tofu_path == "tofu"
+
+
+def test_required_only_hcl_uses_type_defaults() -> None:
+    schema = {
+        "attributes": {"ami": {"required": True, "type": "string"}, "tags": {"required": True, "type": ["map", "string"]}},
+        "blocks": {"ebs": {"min_items": 1, "schema": {"attributes": {"size": {"required": True, "type": "number"}}}}},
+    }
+
+    hcl = _adapter().build_hcl_from_schema("web", "aws_instance", schema, {"ami": '"ami-1"'})
+
+    assert hcl == 'resource "aws_instance" "web" {\n  ami = "ami-1"\n  tags = {}\n  ebs {\n    size = 0\n  }\n}'
+    assert _adapter().default_value_for_type("bool") == "false"
+    assert ota._default_value_for_type({"object": {}}) == '"AUTO"'
+
+
+@pytest.fixture
+def jinja_root(monkeypatch, tmp_path):
+    """Point the bytecode cache at tmp_path and drop environments cached against the real root."""
+    monkeypatch.setattr(ota, "TOFU_ROOT", str(tmp_path / "root"))
+    ota._jinja_env.cache_clear()
+    yield tmp_path / "root"
+    ota._jinja_env.cache_clear()
+
+
+def test_jinja_environment_is_shared_per_template_dir(jinja_root) -> None:
+    env = ota._jinja_env(ota.TEMPLATE_DIR)
+
+    assert env is ota._jinja_env(ota.TEMPLATE_DIR)
+    assert env is not None and env.auto_reload is False
+    assert ota._template_names(ota.TEMPLATE_DIR) == frozenset(env.list_templates())
+
+
+def test_bytecode_cache_lives_under_tofu_root(jinja_root) -> None:
+    bcc = ota._bytecode_cache()
+
+    assert bcc is not None
+    assert bcc.directory == str(jinja_root / ".jinja_cache")
+
+
+def test_find_template_file_uses_cached_names(monkeypatch, jinja_root) -> None:
+    adapter = _adapter()
+    adapter.jinja_env = ota._jinja_env(ota.TEMPLATE_DIR)
+    adapter._template_names = frozenset({"aws_instance.tf.j2"})
+    monkeypatch.setattr(adapter.jinja_env, "list_templates", lambda: (_ for _ in ()).throw(AssertionError("disk walk")))
+
+    assert adapter._find_template_file("aws_instance") == "aws_instance.tf.j2"
+    assert adapter._find_template_file("aws_vpc") is None
+
+
+def test_templates_precompile_when_enabled(monkeypatch, tmp_path, jinja_root) -> None:
+    (tmp_path / "aws_instance.tf.j2").write_text('resource "aws_instance" "{{ name }}" {}\n')
+    monkeypatch.setenv("CLOUDBREW_PRECOMPILE_TEMPLATES", "1")
+
+    env = ota._jinja_env(str(tmp_path))
+
+    assert env.cache is not None and len(env.cache) == 1
+
+
+def test_python_field_renderer_nests_blocks_and_maps() -> None:
+    adapter = _adapter()
+    schema = {"block_types": {"ingress": {}}}
+
+    assert adapter._render_hcl_field_python("tags", {"env": "dev"}, None) == '  tags = {\n    "env" = "dev"\n  }'
+    assert adapter._render_hcl_field_python("ingress", [{"port": 22}, {"port": 443}], schema, depth=2) == (
+        "    ingress {\n      port = 22\n    }\n    ingress {\n      port = 443\n    }"
+    )
+    assert adapter._render_hcl_field_python("ingress", [], schema) == ""
+    # YAML specs can carry int keys; they render like the old f-strings did
+    assert adapter._render_hcl_field_python("quarters", {2024: "q1"}, None) == '  quarters = {\n    "2024" = "q1"\n  }'
+    assert adapter._render_block_body("boot_disk", {"initialize_params": {1: "a"}, 2: {3: 4}}, 1) == (
+        '  boot_disk {\n    initialize_params {\n      1 = "a"\n    }\n    2 = {\n      "3" = 4\n    }\n  }'
+    )
+    assert adapter._render_block_body("rule", [{"a": 1}], 17) == (
+        "  " * 17 + "rule {\n" + "  " * 18 + "rule {\n" + "  " * 18 + "  a = 1\n" + "  " * 18 + "}\n" + "  " * 17 + "}"
+    )
+
+
+def test_scalar_json_encoding_is_cached_per_type() -> None:
+    ota._dumps_scalar.cache_clear()
+
+    assert [ota._dumps(v) for v in ("t2.micro", "t2.micro", True, 1, 1.0, None)] == [
+        '"t2.micro"', '"t2.micro"', "true", "1", "1.0", "null",
+    ]
+    assert ota._dumps(["a", 1]) == '["a",1]'
+    assert ota._dumps({"zone": "é"}) == '{"zone":"é"}'
+    info = ota._dumps_scalar.cache_info()
+    assert (info.hits, info.currsize) == (1, 5)
+
+
+def test_schema_manager_is_shared_per_workdir(monkeypatch, tmp_path) -> None:
+    built = []
+
+    class FakeSchemaManager:
+        def __init__(self, work_dir, tofu_bin=None):
+            built.append(work_dir)
+
+    monkeypatch.setattr(ota, "SchemaManager", FakeSchemaManager)
+    ota._schema_manager.cache_clear()
+    try:
+        first = ota._schema_manager(str(tmp_path), None)
+
+        assert ota._schema_manager(str(tmp_path), None) is first
+        assert built == [str(tmp_path)]
+    finally:
+        ota._schema_manager.cache_clear()
+
+
+def test_provider_alias_tables_key_on_provider_family() -> None:
+    adapter = _adapter()
+    spec = {"name": "web", "image": "img", "size": "small", "tags": '{"env": "dev"}'}
+
+    for provider in ("aws", "AWS", "hashicorp/aws", "aws_instance"):
+        assert adapter._alias_and_defaults(spec, "aws_instance", provider) == {
+            "tags": {"env": "dev"}, "ami": "img", "instance_type": "small",
+        }
+    assert adapter._normalize_spec_for_provider(spec, "hashicorp/google")["boot_disk"] == {
+        "initialize_params": {"image": "img"},
+    }
+    assert adapter._normalize_spec_for_provider(spec, "azurerm")["source_image_reference"]["sku"] == "img"
+    assert adapter._normalize_spec_for_provider(spec, "noop") == {"image": "img", "size": "small", "tags": '{"env": "dev"}'}
+
+
+def test_provider_header_is_built_once_per_region(monkeypatch) -> None:
+    monkeypatch.delenv("AWS_REGION", raising=False)
+    ota._provider_header.cache_clear()
+
+    region = ota._header_region("aws", {})
+    first = ota._provider_header("aws", region)
+
+    assert region == "us-east-1"
+    assert 'provider "aws" {\n  region = "us-east-1"\n}' in first
+    assert ota._provider_header("aws", ota._header_region("aws", {"region": "us-east-1"})) is first
+    assert "features {}" in ota._provider_header("azurerm", ota._header_region("azurerm", {"region": "x"}))
+    assert ota._provider_header("noop", None) == ""
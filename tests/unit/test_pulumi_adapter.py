@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+
+from LCF.cloud_adapters import pulumi_adapter
+
+
+def test_plan_yields_lines_while_the_operation_is_running(monkeypatch, tmp_path) -> None:
+    progress = []
+
+    def fake_cli(project_dir, spec, stack_name, action):
+        progress.append("started")
+        yield "Previewing update (dev)"
+        progress.append("still running")
+        yield "+ bucket\n+ policy"
+
+    monkeypatch.setattr(pulumi_adapter, "_HAS_AUTOMATION", False)
+    monkeypatch.setattr(pulumi_adapter, "_run_cli", fake_cli)
+    monkeypatch.setattr(pulumi_adapter, "_make_project_dir", lambda prefix="": str(tmp_path / "proj"))
+
+    gen = pulumi_adapter.plan({"name": "b"}, "dev")
+
+    assert next(gen) == "Previewing update (dev)"
+    assert progress == ["started"]
+    assert list(gen) == ["+ bucket", "+ policy"]
+
+
+def test_stream_create_instance_records_instance_after_up(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(pulumi_adapter, "_HAS_AUTOMATION", False)
+    monkeypatch.setattr(pulumi_adapter, "_run_cli", lambda *a: iter(["Updating", "done"]))
+    monkeypatch.setattr(pulumi_adapter, "_make_project_dir", lambda prefix="": str(tmp_path / "proj"))
+    pa = pulumi_adapter.PulumiAdapter(str(tmp_path / "cb.db"))
+
+    assert list(pa.stream_create_instance("web", {"name": "web"})) == ["Updating", "done"]
+    assert pa.store.get_instance("web")["adapter_id"] == "pulumi-web"
+
+
+def test_project_dirs_are_pooled_per_stack(monkeypatch, tmp_path) -> None:
+    import pytest
+
+    made = []
+
+    def fake_make(prefix=""):
+        made.append(str(tmp_path / f"proj{len(made)}"))
+        pulumi_adapter._make_project_template(made[-1])
+        return made[-1]
+
+    seen = []
+
+    def fake_cli(project_dir, spec, stack_name, action):
+        seen.append(project_dir)
+        if spec.get("fail"):
+            raise pulumi_adapter.PulumiAdapterError("boom")
+        yield action
+
+    monkeypatch.setattr(pulumi_adapter, "_HAS_AUTOMATION", False)
+    monkeypatch.setattr(pulumi_adapter, "_run_cli", fake_cli)
+    monkeypatch.setattr(pulumi_adapter, "_make_project_dir", fake_make)
+    pulumi_adapter._clear_project_pool()
+    pa = pulumi_adapter.PulumiAdapter(str(tmp_path / "cb.db"))
+
+    assert pa._run_action({}, "dev", "preview") == ["preview"]
+    assert pa._run_action({}, "dev", "up") == ["up"]
+    outer = pa._stream_action({}, "dev", "preview")
+    assert next(outer) == "preview"
+    assert pa._run_action({}, "dev", "preview") == ["preview"]  # dev's only idle dir is checked out
+    assert seen == [made[0], made[0], made[0], made[1]]
+
+    with pytest.raises(pulumi_adapter.PulumiAdapterError):
+        pa._run_action({"fail": True}, "dev", "preview")
+    assert not (tmp_path / "proj1").exists()
+
+    pulumi_adapter._clear_project_pool()
+    assert not (tmp_path / "proj0").exists()
+
+
+def test_make_project_template_only_rewrites_changed_files(tmp_path) -> None:
+    proj = tmp_path / "proj"
+    pulumi_adapter._make_project_template(str(proj))
+    files = ["Pulumi.yaml", "requirements.txt", "__main__.py", "__main__/__main__.py"]
+    before = {f: (proj / f).stat().st_mtime_ns for f in files}
+    (proj / "requirements.txt").write_text("stale\n")
+    stamp = before["__main__.py"] - 10_000_000
+    for f in files:
+        os.utime(proj / f, ns=(stamp, stamp))
+
+    pulumi_adapter._make_project_template(str(proj))
+
+    assert (proj / "requirements.txt").read_text() == "pulumi\n"
+    assert [f for f in files if (proj / f).stat().st_mtime_ns != stamp] == ["requirements.txt"]
+    assert (proj / "__main__" / "__main__.py").read_text() == pulumi_adapter._PROGRAM
+
+
+def test_stream_subprocess_splits_large_binary_output(tmp_path) -> None:
+    import sys
+
+    import pytest
+
+    # multi-byte characters straddle the 64 KiB read boundaries
+    script = "import sys\nfor i in range(20000): sys.stdout.write(f'é{i}\\r\\n')\nsys.stdout.write('tail')"
+    lines = list(pulumi_adapter._stream_subprocess([sys.executable, "-c", script], cwd=str(tmp_path)))
+
+    assert len(lines) == 20001
+    assert lines[0] == "é0" and lines[19999] == "é19999" and lines[-1] == "tail"
+
+    with pytest.raises(pulumi_adapter.PulumiAdapterError):
+        list(pulumi_adapter._stream_subprocess([sys.executable, "-c", "print('x'); raise SystemExit(2)"]))
+
+
+def test_stream_subprocess_ends_when_the_command_exits(tmp_path) -> None:
+    import sys
+    import time
+
+    # the grandchild inherits stdout and keeps the pipe open long after the command is done
+    script = (
+        "import subprocess, sys\n"
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        "print('done')"
+    )
+    start = time.monotonic()
+    lines = list(pulumi_adapter._stream_subprocess([sys.executable, "-c", script], cwd=str(tmp_path)))
+
+    assert lines == ["done"]
+    assert time.monotonic() - start < 10
+
+
+def test_read_chunks_drains_output_written_just_before_exit(monkeypatch) -> None:
+    r, w = os.pipe()
+    monkeypatch.setattr(pulumi_adapter, "_POLL_INTERVAL", 0.01)
+
+    class Proc:
+        def poll(self):
+            # the last output lands after select() timed out but before the exit is seen
+            os.write(w, b"Error: final summary\n")
+            return 1
+
+    try:
+        assert b"".join(pulumi_adapter._read_chunks(r, Proc())) == b"Error: final summary\n"
+    finally:
+        os.close(r)
+        os.close(w)
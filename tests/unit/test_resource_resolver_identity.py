@@ -21,3 +21,36 @@ def test_canonicalize_identity_returns_unmapped_failure_with_alternatives() -> N
     assert out["mode"] == "provider_native_type_unmapped"
     assert "alias_alternatives" in out
     assert "resolution_hint" in out
+
+
+def test_auto_resolve_probes_providers_concurrently_and_keeps_order() -> None:
+    import threading
+
+    rr = ResourceResolver(db_path=":memory:")
+    barrier = threading.Barrier(5, timeout=5)
+
+    def probe(provider: str, resource: str):
+        barrier.wait()  # only passes if all five probes are in flight together
+        return 0.9, [(f"{provider}_{resource}", 0.9)]
+
+    rr._discover_best_match = probe  # type: ignore[assignment]
+    rr._query_opentofu_schema = lambda provider=None: {}  # type: ignore[assignment]
+
+    out = rr.resolve(resource="widget_thing", provider="auto")
+
+    # equal scores: the first provider in probe order still wins
+    assert out["_provider"] == "aws"
+    assert out["_resolved"] == "aws_widget_thing"
+
+
+def test_static_alias_lookup_honours_provider_hint_without_probing() -> None:
+    rr = ResourceResolver(db_path=":memory:")
+
+    def no_probe(provider: str, resource: str):
+        raise AssertionError("static aliases must not trigger a provider probe")
+
+    rr._discover_best_match = no_probe  # type: ignore[assignment]
+
+    assert rr.resolve(resource="vm", provider="gcp")["_resolved"] == "google_compute_instance"
+    assert rr.resolve(resource="vm", provider="aws")["_resolved"] == "aws_instance"
+    assert rr.resolve(resource="vm", provider="auto")["_resolved"] == rr.static_registry["vm"][0]["type"]
@@ -106,3 +106,26 @@ def test_schema_manager_cache_key_changes_with_lockfile(tmp_path):
     second = SchemaManager(work_dir=str(workdir), tofu_bin="")
 
     assert first.cache_key != second.cache_key
+
+
+def test_tofu_binary_lookup_walks_path_once(monkeypatch):
+    from LCF import utils
+
+    calls = []
+
+    def fake_which(name):
+        calls.append(name)
+        return "/usr/bin/opentofu" if name == "opentofu" else None
+
+    monkeypatch.delenv("CLOUDBREW_OPENTOFU_BIN", raising=False)
+    monkeypatch.setattr(utils.shutil, "which", fake_which)
+    utils.which.cache_clear()
+    try:
+        assert utils.tofu_bin() == "/usr/bin/opentofu"
+        assert utils.tofu_bin() == "/usr/bin/opentofu"
+        assert calls == ["tofu", "opentofu"]
+
+        monkeypatch.setenv("CLOUDBREW_OPENTOFU_BIN", "/opt/tofu")
+        assert utils.tofu_bin() == "/opt/tofu"
+    finally:
+        utils.which.cache_clear()
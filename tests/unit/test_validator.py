@@ -62,3 +62,25 @@ def test_tier2_extracts_missing_argument_and_block_from_tofu_output(monkeypatch,
     assert [c[1] for c in calls] == ["init", "validate"]
     assert any(d.rule_id == "TOFU_REQUIRED_ARGUMENT_MISSING" and d.path == "ami" for d in report.diagnostics)
     assert any(d.rule_id == "TOFU_REQUIRED_BLOCK_MISSING" and d.path == "network_interface" for d in report.diagnostics)
+
+
+def test_tier2_runs_tofu_with_shared_plugin_cache(monkeypatch, tmp_path):
+    import subprocess
+    from types import SimpleNamespace
+
+    from LCF import utils
+
+    monkeypatch.delenv("TF_PLUGIN_CACHE_DIR", raising=False)
+    monkeypatch.setattr(utils, "PLUGIN_CACHE_DIR", tmp_path / "plugin-cache")
+    envs = []
+
+    def fake_run(cmd, cwd, capture_output, text, env):
+        envs.append(env)
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    ProvisioningValidator()._validate_tier2('resource "null_resource" "x" {}', tmp_path / "work")
+
+    assert len(envs) == 3
+    assert all(e["TF_PLUGIN_CACHE_DIR"] == str(tmp_path / "plugin-cache") for e in envs)
+    assert (tmp_path / "plugin-cache").is_dir()